@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark for building a TC queue for a generated command sequence, for example a memory
+upload.
+
+Adding each telecommand with add_pus_tc and packing it before sending is compared to adding all
+telecommands at once with add_pus_tcs_packed, and to compiling a queue of telecommand entries
+into a contiguous buffer. All variants stamp the APID and sequence count.
+"""
+import argparse
+import time
+from collections import deque
+from typing import List
+
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.tc.queue import DefaultPusQueueHelper, QueueWrapper
+from tmtccmd.tc.stamp import PusTcStamper
+from tmtccmd.util import SeqCountProvider
+
+APID = 0x22
+
+
+def build_tcs(num_tcs: int, app_data_len: int) -> List[PusTelecommand]:
+    return [
+        PusTelecommand(
+            service=8,
+            subservice=128,
+            app_data=(idx % 256).to_bytes(1, "big") * app_data_len,
+        )
+        for idx in range(num_tcs)
+    ]
+
+
+def create_helper() -> DefaultPusQueueHelper:
+    return DefaultPusQueueHelper(
+        QueueWrapper(info=None, queue=deque()),
+        pus_apid=APID,
+        seq_cnt_provider=SeqCountProvider(16),
+    )
+
+
+def run_per_tc(tcs: List[PusTelecommand]) -> float:
+    helper = create_helper()
+    start = time.perf_counter()
+    for tc in tcs:
+        helper.add_pus_tc(tc)
+    for entry in helper.queue_wrapper.queue:
+        entry.pus_tc.pack()
+    return time.perf_counter() - start
+
+
+def run_packed(tcs: List[PusTelecommand]) -> float:
+    helper = create_helper()
+    start = time.perf_counter()
+    helper.add_pus_tcs_packed(tcs)
+    return time.perf_counter() - start
+
+
+def run_compiled(tcs: List[PusTelecommand]) -> float:
+    helper = DefaultPusQueueHelper(QueueWrapper(info=None, queue=deque()))
+    for tc in tcs:
+        helper.add_pus_tc(tc)
+    start = time.perf_counter()
+    helper.queue_wrapper.compile(
+        PusTcStamper(pus_apid=APID, seq_cnt_provider=SeqCountProvider(16))
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--num-tcs", type=int, default=100_000)
+    parser.add_argument("-l", "--app-data-len", type=int, default=200)
+    args = parser.parse_args()
+    tcs = build_tcs(args.num_tcs, args.app_data_len)
+    # Only a fraction of the telecommands are used for the slow variant
+    num_per_tc = max(args.num_tcs // 20, 1)
+    per_tc = run_per_tc(tcs[:num_per_tc]) * args.num_tcs / num_per_tc
+    print(f"Per TC stamping and packing: {per_tc:8.2f} s (extrapolated)")
+    packed = run_packed(tcs)
+    print(f"Batch stamping and packing: {packed:9.2f} s")
+    print(f"Speedup: {per_tc / packed:.1f}x")
+    compiled = run_compiled(tcs)
+    print(f"Queue compilation: {compiled:16.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark for the packet reception throughput of the TCP communication interface.
+
+A loopback server sends PUS ping replies as fast as possible, and the packets received
+by the TCP communication interface are counted for a fixed duration. The polling based reception
+thread is compared to the selector based reception thread.
+"""
+import argparse
+import socket
+import threading
+import time
+
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.com_if.tcp import TcpComIF, TcpCommunicationType
+from tmtccmd.com_if.tcpip_utils import EthAddr
+
+LOCALHOST = "127.0.0.1"
+
+
+def serve(server: socket.socket, packet: bytes, stop: threading.Event):
+    conn, _ = server.accept()
+    chunk = packet * 256
+    try:
+        while not stop.is_set():
+            conn.sendall(chunk)
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+
+def run(use_selector: bool, duration: float) -> float:
+    packet = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind((LOCALHOST, 0))
+    server.listen()
+    stop = threading.Event()
+    server_thread = threading.Thread(
+        target=serve, args=(server, packet, stop), daemon=True
+    )
+    server_thread.start()
+    com_if = TcpComIF(
+        "tcp",
+        com_type=TcpCommunicationType.SPACE_PACKETS,
+        space_packet_ids=((packet[0] << 8) | packet[1],),
+        tm_polling_freqency=0.5,
+        target_address=EthAddr.from_tuple(server.getsockname()),
+        max_recv_size=4096,
+        max_packets_stored=1_000_000,
+        use_selector=use_selector,
+    )
+    com_if.open()
+    received = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        received += len(com_if.receive(poll_timeout=0.05))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    com_if.close()
+    server.close()
+    return received / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-d", "--duration", type=float, default=3.0)
+    args = parser.parse_args()
+    polling = run(use_selector=False, duration=args.duration)
+    print(f"Polling reception thread: {polling:12.1f} packets/s")
+    selector = run(use_selector=True, duration=args.duration)
+    print(f"Selector reception thread: {selector:11.1f} packets/s")
+    print(f"Speedup: {selector / polling:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
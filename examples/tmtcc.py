@@ -14,6 +14,7 @@ from tmtccmd import CcsdsTmtcBackend, TcHandlerBase, ProcedureParamsWrapper
 from tmtccmd.core.base import BackendRequest
 from tmtccmd.pus import VerificationWrapper
 from tmtccmd.tm import CcsdsTmHandler, SpecificApidHandlerBase
+from tmtccmd.tm.header_view import PusTmHeaderView
 from tmtccmd.com_if import ComInterface
 from tmtccmd.config import (
     default_json_path,
@@ -38,7 +39,9 @@ from tmtccmd.tc import (
     FeedWrapper,
     SendCbParams,
     DefaultPusQueueHelper,
+    CompiledTcEntry,
 )
+from tmtccmd.tc.stamp import add_raw_tc_to_verificator
 from tmtccmd.tm.pus_5_event import Service5Tm
 from tmtccmd.util import FileSeqCountProvider, PusFileSeqCountProvider
 from tmtccmd.util.obj_id import ObjectIdDictT
@@ -116,12 +119,13 @@ class PusHandler(SpecificApidHandlerBase):
 
     def handle_tm(self, packet: bytes, _user_args: any):
         try:
-            tm_packet = PusTelemetry.unpack(packet)
+            # Only read the header here, the packet is unpacked once by the service handling
+            service = PusTmHeaderView(packet).service
         except ValueError as e:
             LOGGER.warning("Could not generate PUS TM object from raw data")
             LOGGER.warning(f"Raw Packet: [{packet.hex(sep=',')}], REPR: {packet!r}")
             raise e
-        service = tm_packet.service
+        tm_packet = None
         dedicated_handler = False
         if service == 1:
             tm_packet = Service1Tm.unpack(data=packet, params=UnpackParams(1, 2))
@@ -158,7 +162,7 @@ class PusHandler(SpecificApidHandlerBase):
                 f"The service {service} is not implemented in Telemetry Factory"
             )
             tm_packet = PusTelemetry.unpack(packet)
-        self.raw_logger.log_tm(tm_packet)
+        self.raw_logger.log_tm(tm_packet, packet)
         if not dedicated_handler and tm_packet is not None:
             self.printer.handle_long_tm_print(packet_if=tm_packet, info_if=tm_packet)
 
@@ -189,6 +193,21 @@ class TcHandler(TcHandlerBase):
                 raw_tc = pus_tc_wrapper.pus_tc.pack()
                 LOGGER.info(f"Sending {pus_tc_wrapper.pus_tc}")
                 send_params.com_if.send(raw_tc)
+            elif entry_helper.entry_type == TcQueueEntryType.RAW_TC:
+                # Raw entries are sent unchanged. This includes the entries of compiled queues,
+                # which are only stamped if a stamper was passed to QueueWrapper.compile
+                raw_entry = entry_helper.to_raw_tc_entry()
+                if (
+                    isinstance(raw_entry, CompiledTcEntry)
+                    and raw_entry.source.etype == TcQueueEntryType.PUS_TC
+                ):
+                    add_raw_tc_to_verificator(
+                        self.verif_wrapper.pus_verificator, raw_entry.tc
+                    )
+                    LOGGER.info(f"Sending compiled {raw_entry.source.pus_tc}")
+                else:
+                    LOGGER.info(f"Sending raw TC [{bytes(raw_entry.tc).hex(sep=',')}]")
+                send_params.com_if.send(raw_entry.tc)
         elif entry_helper.entry_type == TcQueueEntryType.LOG:
             log_entry = entry_helper.to_log_entry()
             LOGGER.info(log_entry.log_str)
@@ -236,7 +255,9 @@ def main():
     # Create console logger helper and file loggers
     tmtc_logger = RegularTmtcLogWrapper()
     printer = FsfwTmTcPrinter(tmtc_logger.logger)
-    raw_logger = RawTmtcTimedLogWrapper(when=TimedLogWhen.PER_HOUR, interval=1)
+    raw_logger = RawTmtcTimedLogWrapper(
+        when=TimedLogWhen.PER_HOUR, interval=1, background=True
+    )
     verificator = PusVerificator()
     verification_wrapper = VerificationWrapper(verificator, LOGGER, printer.file_logger)
     # Create primary TM handler and add it to the CCSDS Packet Handler
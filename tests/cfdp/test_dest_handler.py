@@ -33,6 +33,7 @@ from tmtccmd.cfdp import (
     RemoteEntityCfg,
 )
 from tmtccmd.cfdp.defs import CfdpStates, TransactionId
+from tmtccmd.cfdp.filestore import HostFilestore
 from tmtccmd.cfdp.handler.dest import (
     DestHandler,
     TransactionStep,
@@ -199,6 +200,15 @@ class TestCfdpDestHandler(TestCase):
         self._check_eof_recv_indication(fsm_res)
         self._check_finished_recv_indication_success(fsm_res)
 
+    def test_larger_file_reception_files_kept_open(self):
+        self.cfdp_user.vfs = HostFilestore(keep_files_open=True)
+        self.dest_handler = DestHandler(
+            self.local_cfg, self.cfdp_user, self.remote_cfg_table
+        )
+        self.test_larger_file_reception()
+        # The file is closed when the transaction is finished
+        self.assertEqual(self.cfdp_user.vfs.num_open_files, 0)
+
     def random_data_two_file_segments(self):
         if sys.version_info >= (3, 9):
             rand_data = random.randbytes(round(self.file_segment_len * 1.3))
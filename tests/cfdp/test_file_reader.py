@@ -0,0 +1,99 @@
+import io
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from tmtccmd.cfdp.filestore import HostFilestore
+from tmtccmd.cfdp.handler.defs import SourceFileTruncated
+from tmtccmd.cfdp.handler.file_reader import SourceFileReader
+
+
+class CountingFilestore(HostFilestore):
+    def __init__(self):
+        super().__init__()
+        self.num_reads = 0
+
+    def readinto_opened_file(self, bytes_io, offset: int, buffer) -> int:
+        self.num_reads += 1
+        return super().readinto_opened_file(bytes_io, offset, buffer)
+
+
+class ShortReadFile(io.BytesIO):
+    """Reads at most a few bytes per call, like an unbuffered file may do"""
+
+    def read(self, size: int = -1) -> bytes:
+        return super().read(3 if size < 0 else min(size, 3))
+
+    def readinto(self, buffer) -> int:
+        with memoryview(buffer) as view:
+            return super().readinto(view[:3])
+
+
+class TestSourceFileReader(TestCase):
+    def setUp(self):
+        self.file_path = Path(f"{tempfile.gettempdir()}/cfdp_file_reader.bin")
+        self.data = bytes(range(256)) * 64
+        self.vfs = CountingFilestore()
+
+    def test_read_segments(self):
+        with open(self.file_path, "wb") as of:
+            of.write(self.data)
+        reader = SourceFileReader(self.file_path, self.vfs, prefetch_len=1024)
+        self.assertEqual(reader.file_size, len(self.data))
+        self.assertEqual(reader.read(0, 100), self.data[0:100])
+        self.assertEqual(reader.read(5000, 100), self.data[5000:5100])
+        # Segments are truncated at the end of the file
+        self.assertEqual(reader.read(len(self.data) - 10, 100), self.data[-10:])
+        self.assertEqual(reader.read(len(self.data), 100), bytes())
+        # All segments are read with the virtual filestore
+        self.assertEqual(self.vfs.num_reads, 3)
+        reader.close()
+        self.assertTrue(reader.file_obj.closed)
+
+    def test_file_truncated_during_transaction(self):
+        with open(self.file_path, "wb") as of:
+            of.write(self.data)
+        reader = SourceFileReader(self.file_path, self.vfs, prefetch_len=1024)
+        self.assertEqual(reader.read(0, 100), self.data[0:100])
+        with open(self.file_path, "r+b") as of:
+            of.truncate(150)
+        # The file size was already announced, so missing data is an error
+        with self.assertRaises(SourceFileTruncated):
+            reader.read(100, 100)
+        with self.assertRaises(SourceFileTruncated):
+            reader.read(5000, 100)
+        reader.close()
+
+    def test_short_reads(self):
+        segment = bytearray(10)
+        self.assertEqual(
+            self.vfs.readinto_opened_file(ShortReadFile(self.data), 4, segment), 10
+        )
+        self.assertEqual(segment, self.data[4:14])
+        self.assertEqual(
+            self.vfs.read_from_opened_file(ShortReadFile(self.data), 4, 10),
+            self.data[4:14],
+        )
+        # Only the end of the file stops the read early
+        self.assertEqual(
+            self.vfs.readinto_opened_file(ShortReadFile(self.data[:8]), 4, segment), 4
+        )
+
+    def test_empty_file(self):
+        with open(self.file_path, "wb"):
+            pass
+        reader = SourceFileReader(self.file_path, self.vfs)
+        self.assertEqual(reader.file_size, 0)
+        self.assertEqual(reader.read(0, 100), bytes())
+        reader.close()
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            SourceFileReader(
+                Path(f"{tempfile.gettempdir()}/cfdp_missing_file.bin"), self.vfs
+            )
+
+    def tearDown(self):
+        if self.file_path.exists():
+            os.remove(self.file_path)
@@ -1,10 +1,18 @@
+import io
 import os.path
 from pathlib import Path
 import shutil
 import tempfile
 
 from pyfakefs.fake_filesystem_unittest import TestCase
-from tmtccmd.cfdp.filestore import HostFilestore, FilestoreResult
+from tmtccmd.cfdp.filestore import HostFilestore, FilestoreResult, _OpenFile
+
+
+class ShortWriteFile(io.BytesIO):
+    """Writes at most a few bytes per call, like an unbuffered file may do"""
+
+    def write(self, data) -> int:
+        return super().write(bytes(data[:3]))
 
 
 class TestCfdpHostFilestore(TestCase):
@@ -74,6 +82,55 @@ class TestCfdpHostFilestore(TestCase):
         with open(self.test_file_name_0, "rb") as rf:
             self.assertEqual(rf.read(), file_data)
 
+    def test_write_file_kept_open(self):
+        filestore = HostFilestore(keep_files_open=True, write_buffer_size=16)
+        self.filestore.create_file(self.test_file_name_0)
+        filestore.write_data(self.test_file_name_0, b"Hello ", 0)
+        filestore.write_data(self.test_file_name_0, b"World", 6)
+        self.assertEqual(filestore.num_open_files, 1)
+        # Contiguous writes are buffered
+        self.assertEqual(self.test_file_name_0.stat().st_size, 0)
+        filestore.flush_file(self.test_file_name_0)
+        with open(self.test_file_name_0, "rb") as rf:
+            self.assertEqual(rf.read(), b"Hello World")
+        # A full buffer and a non-contiguous write are written immediately
+        filestore.write_data(self.test_file_name_0, bytes(16), 20)
+        self.assertEqual(self.test_file_name_0.stat().st_size, 36)
+        filestore.write_data(self.test_file_name_0, b"!", 11)
+        filestore.write_data(self.test_file_name_0, b"?", 40)
+        self.assertEqual(self.test_file_name_0.stat().st_size, 36)
+        self.assertEqual(
+            filestore.read_data(self.test_file_name_0, 0, 12), b"Hello World!"
+        )
+        self.assertEqual(self.test_file_name_0.stat().st_size, 41)
+        filestore.close_file(self.test_file_name_0)
+        self.assertEqual(filestore.num_open_files, 0)
+        with self.assertRaises(FileNotFoundError):
+            filestore.write_data(self.test_file_name_1, b"Hello", 0)
+
+    def test_flush_short_writes(self):
+        open_file = _OpenFile(ShortWriteFile(b"xx"))
+        open_file.buffer_offset = 2
+        open_file.buffer.extend(b"Hello World")
+        open_file.flush()
+        self.assertEqual(open_file.file_obj.getvalue(), b"xxHello World")
+        self.assertEqual(len(open_file.buffer), 0)
+
+    def test_open_file_limit(self):
+        filestore = HostFilestore(keep_files_open=True, max_open_files=1)
+        self.filestore.create_file(self.test_file_name_0)
+        self.filestore.create_file(self.test_file_name_1)
+        filestore.write_data(self.test_file_name_0, b"Hello", 0)
+        filestore.write_data(self.test_file_name_1, b"World", 0)
+        self.assertEqual(filestore.num_open_files, 1)
+        # The least recently written file was closed and its data was written
+        with open(self.test_file_name_0, "rb") as rf:
+            self.assertEqual(rf.read(), b"Hello")
+        filestore.close_all_files()
+        self.assertEqual(filestore.num_open_files, 0)
+        with open(self.test_file_name_1, "rb") as rf:
+            self.assertEqual(rf.read(), b"World")
+
     def test_replace_file(self):
         file_data = "Hello World".encode()
         self.filestore.create_file(self.test_file_name_0)
@@ -22,10 +22,23 @@ class TestCfdpSourceHandlerNoClosure(TestCfdpSourceHandler):
         fsm_res = self.source_handler.state_machine()
         self.cfdp_user.transaction_finished_indication.assert_called_once()
         self.assertEqual(self.cfdp_user.transaction_finished_indication.call_count, 1)
+        # The source file is closed when the transaction is finished
+        self.assertIsNone(self.source_handler._params.file_reader)
         self.source_handler.confirm_packet_sent_advance_fsm()
         self.assertEqual(fsm_res.states.state, CfdpStates.IDLE)
         self.assertEqual(fsm_res.states.step, TransactionStep.IDLE)
 
+    def test_restart_without_reset_closes_file(self):
+        self._common_empty_file_test()
+        file_reader = self.source_handler._params.file_reader
+        self.assertFalse(file_reader.file_obj.closed)
+        # Simulates a transaction which was aborted by an exception without a reset
+        put_req = self.source_handler._current_req.to_put_request()
+        self.source_handler._transaction_start(put_req)
+        self.assertTrue(file_reader.file_obj.closed)
+        self.assertIsNot(self.source_handler._params.file_reader, file_reader)
+        self.source_handler._params.reset()
+
     def test_small_file_pdu_generation(self):
         file_content = "Hello World\n"
         self._common_small_file_test(False, file_content)
@@ -142,3 +155,5 @@ class TestCfdpSourceHandlerNoClosure(TestCfdpSourceHandler):
         self.assertEqual(fsm_res.states.step, TransactionStep.IDLE)
         self.cfdp_user.transaction_finished_indication.assert_called_once()
         self.assertEqual(self.cfdp_user.transaction_finished_indication.call_count, 1)
+        # The source file is closed when the transaction is finished
+        self.assertIsNone(self.source_handler._params.file_reader)
@@ -0,0 +1,170 @@
+import socket
+from unittest import TestCase
+
+from dle_encoder import DleEncoder, STX_CHAR, ETX_CHAR, DLE_CHAR
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.com_if.framer import (
+    SpacePacketFramer,
+    FixedFrameDeframer,
+    DleStreamDecoder,
+)
+
+
+class TestSpacePacketFramer(TestCase):
+    def setUp(self) -> None:
+        self.ping_reply = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+        self.other_tm = PusTelemetry(
+            service=5, subservice=1, apid=0x02, source_data=bytes(range(20))
+        ).pack()
+        packet_id = (self.ping_reply[0] << 8) | self.ping_reply[1]
+        self.framer = SpacePacketFramer((packet_id,), initial_capacity=64)
+
+    def test_empty(self):
+        self.assertEqual(len(self.framer), 0)
+        self.assertEqual(self.framer.parse(), [])
+
+    def test_multiple_packets(self):
+        self.framer.feed(self.ping_reply + self.other_tm)
+        packets = self.framer.parse()
+        self.assertEqual(packets, [self.ping_reply, self.other_tm])
+        self.assertEqual(len(self.framer), 0)
+
+    def test_broken_tail(self):
+        self.framer.feed(self.ping_reply + self.other_tm[:10])
+        self.assertEqual(self.framer.parse(), [self.ping_reply])
+        self.assertEqual(len(self.framer), 10)
+        self.framer.feed(self.other_tm[10:])
+        self.assertEqual(self.framer.parse(), [self.other_tm])
+        self.assertEqual(len(self.framer), 0)
+
+    def test_garbage_is_skipped(self):
+        self.framer.feed(bytes([0xFF, 0xFE, 0xFD]) + self.ping_reply)
+        self.assertEqual(self.framer.parse(), [self.ping_reply])
+        self.assertEqual(self.framer.skipped_bytes, 3)
+
+    def test_buffer_growth_and_compaction(self):
+        stream = (self.ping_reply + self.other_tm) * 10
+        packets = []
+        for idx in range(0, len(stream), 7):
+            self.framer.feed(stream[idx : idx + 7])
+            packets.extend(self.framer.parse())
+        self.assertEqual(packets, [self.ping_reply, self.other_tm] * 10)
+        self.framer.feed(stream)
+        self.assertTrue(self.framer.capacity >= len(stream))
+        self.assertEqual(self.framer.parse(), [self.ping_reply, self.other_tm] * 10)
+
+    def test_recv_into(self):
+        sender, receiver = socket.socketpair()
+        try:
+            sender.sendall(self.ping_reply + self.other_tm)
+            recvd = 0
+            while recvd < len(self.ping_reply + self.other_tm):
+                recvd += self.framer.recv_into(receiver, 16)
+            self.assertEqual(self.framer.parse(), [self.ping_reply, self.other_tm])
+        finally:
+            sender.close()
+            receiver.close()
+
+
+class TestFixedFrameDeframer(TestCase):
+    def setUp(self) -> None:
+        self.ping_reply = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+        self.large_tm = PusTelemetry(
+            service=3, subservice=25, apid=0x02, source_data=bytes(range(100))
+        ).pack()
+        self.frame_size = 64
+        self.deframer = FixedFrameDeframer(self.frame_size, use_numpy=False)
+
+    def _frame(self, data: bytes) -> bytes:
+        return data + bytes(self.frame_size - len(data))
+
+    def test_idle_frames(self):
+        self.assertEqual(self.deframer.deframe(bytes(self.frame_size * 3)), [])
+        self.assertEqual(self.deframer.stats.frames, 3)
+        self.assertEqual(self.deframer.stats.idle_frames, 3)
+
+    def test_multiple_packets_per_frame(self):
+        frame = self._frame(self.ping_reply * 2)
+        packets = self.deframer.deframe(frame * 2)
+        self.assertEqual(packets, [self.ping_reply] * 4)
+        self.assertEqual(self.deframer.stats.packets, 4)
+
+    def test_unaligned_reads(self):
+        stream = self._frame(self.ping_reply) * 3
+        packets = []
+        for idx in range(0, len(stream), 10):
+            packets.extend(self.deframer.deframe(stream[idx : idx + 10]))
+        self.assertEqual(packets, [self.ping_reply] * 3)
+
+    def test_packet_spanning_frames(self):
+        # The header of the last packet is split across the last two frames
+        stream = self.ping_reply * 2 + self.large_tm + self.ping_reply * 2
+        frames = b""
+        for idx in range(0, len(stream), self.frame_size):
+            frames += self._frame(stream[idx : idx + self.frame_size])
+        packets = self.deframer.deframe(frames)
+        self.assertEqual(
+            packets, [self.ping_reply] * 2 + [self.large_tm] + [self.ping_reply] * 2
+        )
+        self.assertEqual(self.deframer.stats.reassembled_packets, 2)
+
+    def test_malformed_frame(self):
+        broken = bytearray(self.ping_reply)
+        broken[0] |= 0xE0
+        packets = self.deframer.deframe(
+            self._frame(bytes(broken) + self.ping_reply) + self._frame(self.ping_reply)
+        )
+        self.assertEqual(packets, [self.ping_reply])
+        self.assertEqual(self.deframer.stats.malformed_frames, 1)
+        self.assertEqual(self.deframer.stats.dropped_bytes, self.frame_size)
+
+    def test_numpy_path(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        deframer = FixedFrameDeframer(self.frame_size)
+        frames = (self._frame(self.ping_reply) + bytes(self.frame_size)) * 20
+        self.assertEqual(deframer.deframe(frames), [self.ping_reply] * 20)
+        self.assertEqual(deframer.stats.idle_frames, 20)
+
+
+class TestDleStreamDecoder(TestCase):
+    def setUp(self) -> None:
+        self.encoder = DleEncoder()
+        self.decoder = DleStreamDecoder(max_frame_len=64)
+        # Contains all characters which need to be escaped
+        self.packet = bytes([0x00, STX_CHAR, 0x01, ETX_CHAR, DLE_CHAR, 0x0D, 0xFF])
+        self.ping_reply = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+
+    def test_single_frame(self):
+        frames = self.decoder.feed(self.encoder.encode(self.packet))
+        self.assertEqual(frames, [self.packet])
+        self.assertEqual(self.decoder.stats.decoded_frames, 1)
+
+    def test_split_reads(self):
+        stream = bytes([0x05, 0x06]) + self.encoder.encode(self.packet)
+        stream += self.encoder.encode(self.ping_reply)
+        frames = []
+        for idx in range(len(stream)):
+            frames.extend(self.decoder.feed(stream[idx : idx + 1]))
+        self.assertEqual(frames, [self.packet, self.ping_reply])
+        self.assertEqual(self.decoder.stats.skipped_bytes, 2)
+
+    def test_invalid_escape(self):
+        stream = bytes([STX_CHAR, 0x01, DLE_CHAR, 0x01, 0x05, ETX_CHAR])
+        stream += self.encoder.encode(self.packet)
+        self.assertEqual(self.decoder.feed(stream), [self.packet])
+        self.assertEqual(self.decoder.stats.invalid_frames, 1)
+
+    def test_missing_etx(self):
+        stream = bytes([STX_CHAR, 0x01, 0x05]) + self.encoder.encode(self.packet)
+        self.assertEqual(self.decoder.feed(stream), [self.packet])
+        self.assertEqual(self.decoder.stats.invalid_frames, 1)
+
+    def test_frame_too_large(self):
+        large_packet = bytes(65)
+        stream = self.encoder.encode(large_packet) + self.encoder.encode(self.packet)
+        self.assertEqual(self.decoder.feed(stream), [self.packet])
+        self.assertEqual(self.decoder.stats.invalid_frames, 1)
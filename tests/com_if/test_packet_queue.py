@@ -0,0 +1,138 @@
+import select
+import sys
+import threading
+import time
+from unittest import TestCase, skipIf
+
+from tmtccmd.com_if.packet_queue import BoundedPacketQueue, BackpressurePolicy
+
+
+class TestPacketQueue(TestCase):
+    def setUp(self) -> None:
+        self.packets = [bytes([idx] * 10) for idx in range(10)]
+
+    def test_basic(self):
+        queue = BoundedPacketQueue()
+        self.assertFalse(queue)
+        queue.put(self.packets[:3])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.stats().stored_bytes, 30)
+        self.assertEqual(queue.get_all(), self.packets[:3])
+        self.assertEqual(queue.get_all(), [])
+        self.assertEqual(queue.stats().stored_bytes, 0)
+
+    def test_get_limited(self):
+        queue = BoundedPacketQueue()
+        queue.put(self.packets[:5])
+        self.assertEqual(queue.get_all(max_packets=2), self.packets[:2])
+        self.assertEqual(queue.stats().stored_bytes, 30)
+        self.assertEqual(queue.get_all(max_packets=5), self.packets[2:5])
+        self.assertEqual(queue.stats().peak_packets, 5)
+
+    def test_drop_oldest_byte_bound(self):
+        queue = BoundedPacketQueue(max_bytes=35)
+        queue.put(self.packets[:5])
+        self.assertEqual(queue.get_all(), self.packets[2:5])
+        stats = queue.stats()
+        self.assertEqual(stats.dropped_packets, 2)
+        self.assertEqual(stats.dropped_bytes, 20)
+        queue.reset_stats()
+        self.assertEqual(queue.stats().dropped_packets, 0)
+
+    def test_drop_oldest_packet_bound(self):
+        queue = BoundedPacketQueue(max_packets=4)
+        queue.put(self.packets)
+        self.assertEqual(queue.get_all(), self.packets[6:])
+        self.assertEqual(queue.stats().dropped_packets, 6)
+
+    def test_large_packet_always_accepted(self):
+        queue = BoundedPacketQueue(max_bytes=5)
+        queue.put([self.packets[0]])
+        self.assertEqual(queue.get_all(), [self.packets[0]])
+
+    def test_spill_to_disk(self):
+        queue = BoundedPacketQueue(
+            max_bytes=30, policy=BackpressurePolicy.SPILL_TO_DISK
+        )
+        queue.put(self.packets)
+        stats = queue.stats()
+        self.assertEqual(stats.stored_packets, 10)
+        self.assertEqual(stats.stored_bytes, 30)
+        self.assertEqual(stats.spilled_packets, 7)
+        self.assertEqual(stats.spilled_bytes, 70)
+        self.assertEqual(stats.dropped_packets, 0)
+        # Spilled packets are read back in order and bounded by the memory limit per call
+        packets = queue.get_all()
+        self.assertEqual(packets, self.packets[:6])
+        # New packets are appended after the remaining spilled packets
+        queue.put([bytes([0xFF] * 10)])
+        packets = queue.get_all()
+        packets.extend(queue.get_all())
+        self.assertEqual(packets, self.packets[6:] + [bytes([0xFF] * 10)])
+        self.assertFalse(queue)
+
+    def test_block_reader(self):
+        queue = BoundedPacketQueue(
+            max_packets=2, policy=BackpressurePolicy.BLOCK_READER
+        )
+        producer = threading.Thread(target=queue.put, args=(self.packets[:4],))
+        producer.start()
+        time.sleep(0.05)
+        # Producer is blocked now
+        self.assertTrue(producer.is_alive())
+        packets = queue.get_all()
+        while len(packets) < 4:
+            packets.extend(queue.get_all(timeout=0.5))
+        producer.join(0.5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(packets, self.packets[:4])
+        stats = queue.stats()
+        self.assertEqual(stats.dropped_packets, 0)
+        self.assertTrue(stats.blocked_time > 0.0)
+
+    def test_close_unblocks_producer(self):
+        queue = BoundedPacketQueue(
+            max_packets=1, policy=BackpressurePolicy.BLOCK_READER
+        )
+        producer = threading.Thread(target=queue.put, args=(self.packets[:3],))
+        producer.start()
+        time.sleep(0.02)
+        queue.close()
+        producer.join(0.5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(queue.get_all(), self.packets[:1])
+        self.assertEqual(queue.stats().dropped_packets, 2)
+
+    def test_blocking_get(self):
+        queue = BoundedPacketQueue()
+        timer = threading.Timer(0.02, queue.put, args=(self.packets[:1],))
+        timer.start()
+        self.assertTrue(queue.wait_for_packets(1.0))
+        self.assertEqual(queue.get_all(timeout=1.0), self.packets[:1])
+        timer.join()
+
+    @skipIf(sys.platform == "win32", "Pipes can not be used with a selector on Windows")
+    def test_fileno(self):
+        queue = BoundedPacketQueue(
+            max_packets=2, policy=BackpressurePolicy.BLOCK_READER
+        )
+        queue.put(self.packets[:1])
+        # The descriptor is created on demand and already reflects the stored packets
+        fd = queue.fileno()
+        self.assertEqual(select.select([fd], [], [], 0)[0], [fd])
+        self.assertEqual(queue.get_all(), self.packets[:1])
+        self.assertEqual(select.select([fd], [], [], 0)[0], [])
+        # A blocked producer signals the packets which were already added
+        producer = threading.Thread(target=queue.put, args=(self.packets[:4],))
+        producer.start()
+        self.assertEqual(select.select([fd], [], [], 1.0)[0], [fd])
+        packets = queue.get_all()
+        while len(packets) < 4:
+            self.assertEqual(select.select([fd], [], [], 1.0)[0], [fd])
+            packets.extend(queue.get_all())
+        producer.join(0.5)
+        self.assertEqual(packets, self.packets[:4])
+        self.assertEqual(select.select([fd], [], [], 0)[0], [])
+        queue.put(self.packets[:1])
+        queue.clear()
+        self.assertEqual(select.select([fd], [], [], 0)[0], [])
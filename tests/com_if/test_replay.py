@@ -0,0 +1,119 @@
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from unittest import TestCase
+
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss import PusTelecommand, PusTelemetry
+
+from tmtccmd.com_if.replay import REPLAY_MAX_SPEED, ReplayComIF
+from tmtccmd.logging.archive import ArchiveDirection, PacketArchiveWriter
+from tmtccmd.logging.pus import TimedLogWhen
+from tmtccmd.tm import CcsdsTmHandler, SpecificApidHandlerBase
+from tmtccmd.tm.ccsds_tm_listener import CcsdsTmListener
+
+# 2022-01-01 00:00:00 UTC
+START_TIME = 1640995200.0
+
+
+class ApidHandler(SpecificApidHandlerBase):
+    def __init__(self, apid: int):
+        super().__init__(apid, None)
+        self.packets = deque()
+
+    def handle_tm(self, packet: bytes, user_args: any):
+        self.packets.append(bytes(packet))
+
+
+class TestReplayComIF(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+        timestamp = CdsShortTimestamp.from_current_time()
+        self.tms = [
+            bytes(
+                PusTelemetry(
+                    service=17,
+                    subservice=2,
+                    apid=0x10 + idx % 2,
+                    seq_count=idx,
+                    time_provider=timestamp,
+                ).pack()
+            )
+            for idx in range(10)
+        ]
+        # Packets are recorded with 150 ms spacing and the archive rotates every second
+        with PacketArchiveWriter(
+            self.directory, when=TimedLogWhen.PER_SECOND
+        ) as writer:
+            for idx, tm in enumerate(self.tms):
+                writer.write_tm(tm, START_TIME + idx * 0.15)
+                if idx == 0:
+                    writer.write(
+                        bytes(PusTelecommand(service=17, subservice=1).pack()),
+                        ArchiveDirection.TC,
+                        START_TIME + 0.01,
+                    )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_max_speed(self):
+        com_if = ReplayComIF(
+            self.directory, speed=REPLAY_MAX_SPEED, max_packets_per_receive=4
+        )
+        self.assertEqual(com_if.receive(), [])
+        com_if.open()
+        self.assertTrue(com_if.is_open())
+        packets = []
+        while com_if.data_available():
+            received = com_if.receive()
+            self.assertLessEqual(len(received), 4)
+            packets.extend(received)
+        self.assertTrue(com_if.finished)
+        self.assertEqual(com_if.packets_replayed, 10)
+        # Telecommands are not replayed
+        self.assertEqual([bytes(packet) for packet in packets], self.tms)
+        self.assertIsInstance(packets[0], memoryview)
+        com_if.close()
+        self.assertFalse(com_if.is_open())
+
+    def test_filters(self):
+        com_if = ReplayComIF(
+            self.directory,
+            speed=REPLAY_MAX_SPEED,
+            start=START_TIME + 0.3,
+            end=START_TIME + 1.2,
+            apid=0x11,
+            zero_copy=False,
+        )
+        com_if.open()
+        self.assertEqual(com_if.receive(), [self.tms[3], self.tms[5], self.tms[7]])
+        self.assertTrue(com_if.finished)
+
+    def test_scaled_speed(self):
+        # 1.35 seconds of recorded packets are replayed in 135 ms
+        com_if = ReplayComIF(self.directory, speed=10.0)
+        com_if.open()
+        start = time.monotonic()
+        self.assertEqual(com_if.receive(), [self.tms[0]])
+        self.assertEqual(com_if.receive(), [])
+        packets = 1
+        while packets < 10:
+            if com_if.data_available(timeout=1.0):
+                packets += len(com_if.receive())
+        self.assertGreaterEqual(time.monotonic() - start, 0.13)
+        self.assertTrue(com_if.finished)
+
+    def test_tm_listener(self):
+        handlers = [ApidHandler(0x10), ApidHandler(0x11)]
+        ccsds_handler = CcsdsTmHandler(None)
+        for handler in handlers:
+            ccsds_handler.add_apid_handler(handler)
+        tm_listener = CcsdsTmListener(tm_handler=ccsds_handler)
+        com_if = ReplayComIF(self.directory, speed=REPLAY_MAX_SPEED)
+        com_if.open()
+        self.assertEqual(tm_listener.operation(com_if), 10)
+        self.assertEqual(list(handlers[0].packets), self.tms[0::2])
+        self.assertEqual(list(handlers[1].packets), self.tms[1::2])
@@ -0,0 +1,87 @@
+import select
+import socket
+import time
+from unittest import TestCase
+
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.com_if.tcp import TcpComIF, TcpCommunicationType
+from tmtccmd.com_if.tcpip_utils import EthAddr
+
+LOCALHOST = "127.0.0.1"
+
+
+class TestTcpIf(TestCase):
+    def setUp(self) -> None:
+        self.tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.tcp_server.bind((LOCALHOST, 0))
+        self.tcp_server.listen()
+        self.ping_reply = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+        packet_id = (self.ping_reply[0] << 8) | self.ping_reply[1]
+        self.tcp_client = TcpComIF(
+            "tcp",
+            com_type=TcpCommunicationType.SPACE_PACKETS,
+            space_packet_ids=(packet_id,),
+            tm_polling_freqency=0.5,
+            target_address=EthAddr.from_tuple(self.tcp_server.getsockname()),
+            max_recv_size=1500,
+        )
+        self.conn = None
+
+    def test_recv_split_packets(self):
+        self.tcp_client.open()
+        self.assertTrue(self.tcp_client.is_open())
+        self.conn, _ = self.tcp_server.accept()
+        stream = self.ping_reply * 3
+        # Split in the middle of the second packet
+        self.conn.sendall(stream[: len(self.ping_reply) + 5])
+        packets = self._receive_packets(1)
+        self.conn.sendall(stream[len(self.ping_reply) + 5 :])
+        packets.extend(self._receive_packets(2))
+        self.assertEqual(packets, [self.ping_reply] * 3)
+        self.assertEqual(self.tcp_client.recv_stats().dropped_packets, 0)
+
+    def test_selector_blocking_recv(self):
+        self.tcp_client.use_selector = True
+        self.tcp_client.open()
+        self.conn, _ = self.tcp_server.accept()
+        self.assertEqual(self.tcp_client.receive(), [])
+        self.conn.sendall(self.ping_reply * 2)
+        # Consumers can block until the packets arrive. There is no polling delay
+        start = time.time()
+        self.assertTrue(self.tcp_client.data_available(timeout=1.0))
+        self.assertTrue(time.time() - start < self.tcp_client.TM_LOOP_DELAY)
+        packets = self.tcp_client.receive(poll_timeout=1.0)
+        if len(packets) < 2:
+            packets.extend(self.tcp_client.receive(poll_timeout=1.0))
+        self.assertEqual(packets, [self.ping_reply] * 2)
+        self.conn.sendall(self.ping_reply)
+        self.assertEqual(self.tcp_client.receive(poll_timeout=1.0), [self.ping_reply])
+
+    def test_fileno(self):
+        self.tcp_client.use_selector = True
+        self.tcp_client.open()
+        self.conn, _ = self.tcp_server.accept()
+        fd = self.tcp_client.fileno()
+        self.assertEqual(select.select([fd], [], [], 0)[0], [])
+        self.conn.sendall(self.ping_reply)
+        # Readable once the reception thread has received the packet
+        self.assertEqual(select.select([fd], [], [], 1.0)[0], [fd])
+        self.assertEqual(self.tcp_client.receive(), [self.ping_reply])
+        self.assertEqual(select.select([fd], [], [], 0)[0], [])
+
+    def _receive_packets(self, expected: int, timeout: float = 2.0):
+        packets = []
+        start = time.time()
+        while len(packets) < expected and time.time() - start < timeout:
+            packets.extend(self.tcp_client.receive())
+            time.sleep(0.01)
+        self.assertEqual(len(packets), expected)
+        return packets
+
+    def tearDown(self) -> None:
+        self.tcp_client.close()
+        if self.conn is not None:
+            self.conn.close()
+        self.tcp_server.close()
@@ -3,7 +3,7 @@ import socket
 from unittest import TestCase
 
 from tmtccmd.com_if.tcpip_utils import EthAddr
-from tmtccmd.com_if.udp import UdpComIF
+from tmtccmd.com_if.udp import UdpComIF, MultiUdpComIF, UdpEndpoint
 
 
 LOCALHOST = "127.0.0.1"
@@ -36,6 +36,32 @@ class TestUdpIf(TestCase):
         data_recv = self.udp_client.receive()
         self.assertTrue(data_recv, data)
 
+    def test_recv_batch(self):
+        self._open()
+        sender_addr = self._simple_send(bytes([0]))
+        datagrams = [bytes([idx] * (idx + 1)) for idx in range(5)]
+        for datagram in datagrams:
+            self.udp_server.sendto(datagram, sender_addr)
+        self.assertTrue(self.udp_client.data_available(0.1))
+        batch = self.udp_client.receive_batch(poll_timeout=0.1)
+        self.assertEqual(len(batch), 5)
+        self.assertEqual([bytes(view) for view in batch], datagrams)
+        self.assertEqual(batch.to_list(), datagrams)
+        self.assertEqual(bytes(batch[-1]), datagrams[-1])
+        self.assertEqual(batch.sender_addrs[0], self.addr)
+        # Nothing to receive anymore
+        self.assertEqual(len(self.udp_client.receive_batch()), 0)
+
+    def test_recv_multiple_batches(self):
+        self.udp_client.recv_batch_size = 2
+        self._open()
+        sender_addr = self._simple_send(bytes([0]))
+        datagrams = [bytes([idx]) for idx in range(5)]
+        for datagram in datagrams:
+            self.udp_server.sendto(datagram, sender_addr)
+        self.assertTrue(self.udp_client.data_available(0.1))
+        self.assertEqual(self.udp_client.receive(), datagrams)
+
     def _simple_send(self, data: bytes) -> any:
         self.udp_client.send(data)
         ready = select.select([self.udp_server], [], [], 0.1)
@@ -51,3 +77,94 @@ class TestUdpIf(TestCase):
     def tearDown(self) -> None:
         self.udp_client.close()
         self.udp_server.close()
+
+
+class TestMultiUdpIf(TestCase):
+    def setUp(self) -> None:
+        self.com_if = MultiUdpComIF(
+            "udp_multi",
+            endpoints=[
+                UdpEndpoint("bench0", EthAddr(LOCALHOST, 0)),
+                UdpEndpoint("bench1", EthAddr(LOCALHOST, 0)),
+            ],
+            max_recv_size=1024,
+        )
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sender.bind((LOCALHOST, 0))
+
+    def test_duplicate_endpoint(self):
+        with self.assertRaises(ValueError):
+            MultiUdpComIF(
+                "udp_multi",
+                endpoints=[
+                    UdpEndpoint("bench0", EthAddr(LOCALHOST, 0)),
+                    UdpEndpoint("bench0", EthAddr(LOCALHOST, 0)),
+                ],
+                max_recv_size=1024,
+            )
+
+    def test_failed_bind_closes_sockets(self):
+        free_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        free_socket.bind((LOCALHOST, 0))
+        free_addr = free_socket.getsockname()
+        free_socket.close()
+        com_if = MultiUdpComIF(
+            "udp_multi",
+            endpoints=[
+                UdpEndpoint("bench0", EthAddr.from_tuple(free_addr)),
+                # The address of the sender is already in use
+                UdpEndpoint("bench1", EthAddr.from_tuple(self.sender.getsockname())),
+            ],
+            max_recv_size=1024,
+        )
+        with self.assertRaises(OSError):
+            com_if.open()
+        self.assertFalse(com_if.is_open())
+        self.assertEqual(com_if.fileno(), -1)
+        # The socket of the first endpoint was closed again
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as rebound_socket:
+            rebound_socket.bind(free_addr)
+
+    def test_fan_in(self):
+        self.com_if.open()
+        self.assertTrue(self.com_if.is_open())
+        addrs = self._bound_addrs()
+        self.sender.sendto(bytes([0, 1]), addrs["bench0"])
+        self.sender.sendto(bytes([2, 3]), addrs["bench1"])
+        self.sender.sendto(bytes([4, 5]), addrs["bench0"])
+        self.assertTrue(self.com_if.data_available(0.1))
+        tagged = self.com_if.receive_with_source(0.1)
+        self.assertEqual(len(tagged), 3)
+        self.assertEqual(
+            sorted(tagged),
+            [
+                ("bench0", bytes([0, 1])),
+                ("bench0", bytes([4, 5])),
+                ("bench1", bytes([2, 3])),
+            ],
+        )
+        self.sender.sendto(bytes([6]), addrs["bench1"])
+        self.assertEqual(self.com_if.receive(0.1), [bytes([6])])
+        self.assertEqual(self.com_if.receive(), [])
+
+    def test_send_to(self):
+        self.com_if.endpoints["bench1"].send_addr = EthAddr.from_tuple(
+            self.sender.getsockname()
+        )
+        self.com_if.open()
+        self.com_if.send(bytes([1, 2, 3]))
+        ready = select.select([self.sender], [], [], 0.1)
+        self.assertTrue(ready[0])
+        data, addr = self.sender.recvfrom(1024)
+        self.assertEqual(data, bytes([1, 2, 3]))
+        self.assertEqual(addr, self._bound_addrs()["bench1"])
+
+    def _bound_addrs(self):
+        return {
+            name: udp_socket.getsockname()
+            for name, udp_socket in self.com_if._sockets.items()
+        }
+
+    def tearDown(self) -> None:
+        self.com_if.close()
+        self.sender.close()
@@ -0,0 +1,175 @@
+import asyncio
+import socket
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd import CcsdsTmListener
+from tmtccmd.com_if.dummy import DummyComIF
+from tmtccmd.com_if.tcp import TcpComIF, TcpCommunicationType
+from tmtccmd.com_if.tcpip_utils import EthAddr
+from tmtccmd.com_if.udp import UdpComIF
+from tmtccmd.core import TcMode, TmMode, BackendRequest
+from tmtccmd.core.async_backend import AsyncCcsdsTmtcBackend
+from tmtccmd.tc import DefaultProcedureInfo
+from tests.test_backend import TcHandlerMock
+
+LOCALHOST = "127.0.0.1"
+
+
+class TestAsyncBackend(TestCase):
+    def setUp(self) -> None:
+        self.tm_listener = MagicMock(specs=CcsdsTmListener)
+        self.tc_handler = TcHandlerMock()
+
+    def _create_backend(self, com_if, tc_mode: TcMode, tm_mode: TmMode):
+        return AsyncCcsdsTmtcBackend(
+            tc_mode=tc_mode,
+            tm_mode=tm_mode,
+            com_if=com_if,
+            tm_listener=self.tm_listener,
+            tc_handler=self.tc_handler,
+        )
+
+    def test_one_queue_with_wait(self):
+        backend = self._create_backend(DummyComIF(), TcMode.ONE_QUEUE, TmMode.IDLE)
+        backend.current_procedure = DefaultProcedureInfo(service="17", op_code="2")
+        backend.start()
+        res = asyncio.run(asyncio.wait_for(backend.run(), 1.0))
+        self.assertEqual(res, BackendRequest.TERMINATION_NO_ERROR)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+        # Two TCs and the wait entry
+        self.assertEqual(self.tc_handler.send_cb_call_count, 3)
+        backend.close_com_if()
+
+    def test_stop_from_other_task(self):
+        backend = self._create_backend(DummyComIF(), TcMode.IDLE, TmMode.LISTENER)
+        backend.start()
+
+        async def stop_later():
+            await asyncio.sleep(0.05)
+            backend.stop()
+
+        async def main():
+            await asyncio.gather(backend.run(), stop_later())
+
+        asyncio.run(asyncio.wait_for(main(), 1.0))
+        # No file descriptor available for the dummy interface, so it is polled
+        self.assertTrue(self.tm_listener.operation.call_count > 1)
+        backend.close_com_if()
+
+    def test_wakeup_on_readable_fd(self):
+        udp_server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp_server.bind((LOCALHOST, 0))
+        com_if = UdpComIF(
+            "udp",
+            send_address=EthAddr.from_tuple(udp_server.getsockname()),
+            max_recv_size=1024,
+        )
+        backend = self._create_backend(com_if, TcMode.IDLE, TmMode.LISTENER)
+        backend.tm_poll_interval = timedelta(seconds=10.0)
+        backend.start()
+        com_if.send(bytes([0, 1, 2]))
+        _, client_addr = udp_server.recvfrom(1024)
+        recvd_packets = []
+
+        def listener_op(com_if_arg):
+            packets = com_if_arg.receive()
+            recvd_packets.extend(packets)
+            if packets:
+                backend.stop()
+
+        self.tm_listener.operation.side_effect = listener_op
+
+        async def send_tm():
+            await asyncio.sleep(0.05)
+            udp_server.sendto(bytes([3, 2, 1]), client_addr)
+
+        async def main():
+            await asyncio.gather(backend.run(), send_tm())
+
+        asyncio.run(asyncio.wait_for(main(), 1.0))
+        self.assertEqual(recvd_packets, [bytes([3, 2, 1])])
+        backend.close_com_if()
+        udp_server.close()
+
+    def test_wakeup_on_tcp_packets(self):
+        tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tcp_server.bind((LOCALHOST, 0))
+        tcp_server.listen()
+        ping_reply = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+        com_if = TcpComIF(
+            "tcp",
+            com_type=TcpCommunicationType.SPACE_PACKETS,
+            space_packet_ids=((ping_reply[0] << 8) | ping_reply[1],),
+            tm_polling_freqency=0.5,
+            target_address=EthAddr.from_tuple(tcp_server.getsockname()),
+            max_recv_size=1500,
+            use_selector=True,
+        )
+        backend = self._create_backend(com_if, TcMode.IDLE, TmMode.LISTENER)
+        backend.tm_poll_interval = timedelta(seconds=10.0)
+        backend.start()
+        conn, _ = tcp_server.accept()
+        recvd_packets = []
+
+        def listener_op(com_if_arg):
+            packets = com_if_arg.receive()
+            recvd_packets.extend(packets)
+            if packets:
+                backend.stop()
+
+        self.tm_listener.operation.side_effect = listener_op
+
+        async def send_tm():
+            await asyncio.sleep(0.05)
+            conn.sendall(ping_reply)
+
+        async def main():
+            await asyncio.gather(backend.run(), send_tm())
+
+        asyncio.run(asyncio.wait_for(main(), 1.0))
+        self.assertEqual(recvd_packets, [ping_reply])
+        backend.close_com_if()
+        conn.close()
+        tcp_server.close()
+
+    def test_pending_tm_in_idle_mode_does_not_wake_up(self):
+        udp_server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        udp_server.bind((LOCALHOST, 0))
+        com_if = UdpComIF(
+            "udp",
+            send_address=EthAddr.from_tuple(udp_server.getsockname()),
+            max_recv_size=1024,
+        )
+        backend = self._create_backend(com_if, TcMode.IDLE, TmMode.IDLE)
+        backend.start()
+        com_if.send(bytes([0, 1, 2]))
+        _, client_addr = udp_server.recvfrom(1024)
+        # This TM is never drained because TM listening is not active
+        udp_server.sendto(bytes([3, 2, 1]), client_addr)
+        self.assertTrue(com_if.data_available(timeout=1.0))
+        periodic_op = backend.periodic_op
+        periodic_op_calls = []
+
+        def counting_periodic_op(args):
+            periodic_op_calls.append(args)
+            return periodic_op(args)
+
+        backend.periodic_op = counting_periodic_op
+
+        async def stop_later():
+            await asyncio.sleep(0.1)
+            backend.stop()
+
+        async def main():
+            await asyncio.gather(backend.run(), stop_later())
+
+        asyncio.run(asyncio.wait_for(main(), 1.0))
+        # The loop blocks until the stop notification
+        self.assertEqual(len(periodic_op_calls), 1)
+        self.tm_listener.operation.assert_not_called()
+        backend.close_com_if()
+        udp_server.close()
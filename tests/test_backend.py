@@ -198,3 +198,13 @@ class TestBackend(TestCase):
         self.assertEqual(
             pus_entry.pus_tc, PusTelecommand(service=service, subservice=subservice)
         )
+
+    def test_custom_delay_with_whole_seconds(self):
+        self.backend.tc_mode = TcMode.ONE_QUEUE
+        self.backend.current_procedure = DefaultProcedureInfo(service="17", op_code="2")
+        self.backend.periodic_op()
+        self.backend.state.sender_res.longest_rem_delay = timedelta(seconds=2)
+        self.backend.state.sender_res.next_entry_is_tc = True
+        self.backend.mode_to_req()
+        self.assertEqual(self.backend.request, BackendRequest.DELAY_CUSTOM)
+        self.assertEqual(self.backend.state.next_delay, timedelta(seconds=2))
@@ -1,7 +1,7 @@
 import time
 from datetime import timedelta
 from unittest import TestCase
-from tmtccmd.util.countdown import Countdown
+from tmtccmd.util.countdown import Countdown, Deadline
 
 
 class CountdownTest(TestCase):
@@ -26,3 +26,21 @@ class CountdownTest(TestCase):
         self.assertTrue(test_cd.busy())
         test_cd.time_out()
         self.assertTrue(test_cd.timed_out())
+
+    def test_deadline(self):
+        deadline = Deadline(timedelta(milliseconds=50))
+        self.assertTrue(deadline.busy())
+        self.assertEqual(deadline.timeout, timedelta(milliseconds=50))
+        now = time.monotonic()
+        self.assertTrue(0.04 < deadline.deadline - now <= 0.05)
+        self.assertTrue(deadline.timed_out(deadline.deadline))
+        self.assertEqual(deadline.rem_time(deadline.deadline), timedelta())
+        self.assertTrue(0.04 < deadline.rem_seconds(now) <= 0.05)
+        time.sleep(0.05)
+        self.assertTrue(deadline.timed_out())
+        deadline.reset(timedelta(seconds=2.5))
+        # Whole seconds are taken into account
+        self.assertTrue(deadline.rem_time() > timedelta(seconds=2))
+        deadline.time_out()
+        self.assertTrue(deadline.timed_out())
+        self.assertEqual(Deadline().rem_time(), timedelta())
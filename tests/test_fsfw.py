@@ -0,0 +1,192 @@
+import logging
+import os
+import pickle
+import tempfile
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from tmtccmd.fsfw import (
+    bit_extractor,
+    parse_fsfw_events_csv,
+    parse_fsfw_objects_csv,
+    parse_fsfw_returnvalues_csv,
+    validity_buffer_list,
+    validity_matrix,
+)
+from tmtccmd.fsfw.catalog import (
+    LOGGER,
+    EventCatalog,
+    ObjectCatalog,
+    RetvalCatalog,
+    default_cache_path,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def reference_validity_list(validity_buffer: bytes, num_vars: int):
+    valid_list = [
+        bit_extractor(byte, bit) == 1 for byte in validity_buffer for bit in range(1, 9)
+    ]
+    if num_vars > 0:
+        return valid_list[:num_vars]
+    return valid_list
+
+
+class TestValidityBuffer(TestCase):
+    def setUp(self) -> None:
+        self.validity_buffer = bytes([0b10110000, 0b01000001, 0xFF])
+
+    def test_validity_list(self):
+        for num_vars in (0, 1, 5, 8, 9, 17, 24, 30):
+            self.assertEqual(
+                validity_buffer_list(self.validity_buffer, num_vars),
+                reference_validity_list(self.validity_buffer, num_vars),
+            )
+        self.assertEqual(validity_buffer_list(bytes(), 4), [])
+
+    def test_validity_list_no_num_vars(self):
+        # Without a positive number of variables, the flags of all bits are returned
+        all_flags = [bit == "1" for bit in "10110000" "01000001" "11111111"]
+        self.assertEqual(validity_buffer_list(self.validity_buffer, 0), all_flags)
+        self.assertEqual(validity_buffer_list(self.validity_buffer, -1), all_flags)
+
+    @skipIf(np is None, "NumPy is not installed")
+    def test_validity_matrix(self):
+        buffers = [self.validity_buffer, bytes([0xFF, 0x00, 0x00]), bytes([0x80])]
+        matrix = validity_matrix(buffers, 10)
+        self.assertIsInstance(matrix, np.ndarray)
+        self.assertEqual(matrix.shape, (3, 10))
+        self.assertEqual(validity_matrix([], 10).shape, (0, 10))
+        rows = [list(map(bool, row)) for row in matrix]
+        self.assertEqual(rows[0], reference_validity_list(self.validity_buffer, 10))
+        self.assertEqual(rows[1], [True] * 8 + [False] * 2)
+        # Short buffers are padded with invalid flags
+        self.assertEqual(rows[2], [True] + [False] * 9)
+
+
+class TestCatalogs(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        # Keep the caches of the tests out of the cache directory of the user
+        self.cache_home = os.path.join(self.tmp_dir.name, "cache")
+        env_patcher = patch.dict(
+            os.environ,
+            {"XDG_CACHE_HOME": self.cache_home, "LOCALAPPDATA": self.cache_home},
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.objects_csv = os.path.join(self.tmp_dir.name, "objects.csv")
+        self.events_csv = os.path.join(self.tmp_dir.name, "events.csv")
+        self.retvals_csv = os.path.join(self.tmp_dir.name, "retvals.csv")
+        with open(self.objects_csv, "w") as file:
+            file.write("0x44000001;ACS_CONTROLLER\n0x44000002;PCDU_HANDLER\n")
+        with open(self.events_csv, "w") as file:
+            file.write("Event ID;Event Name;Name;Severity;Description;File Path\n")
+            file.write("2200;0x0898;MODE_TRANSITION_FAILED;LOW;Failed;mode.h\n")
+        with open(self.retvals_csv, "w") as file:
+            file.write("Full ID;Name;Description;Unique ID;Subsystem;Interface;File\n")
+            file.write("0x2601;TIMEOUT;Timed out;1;38;HasReturnvaluesIF;retval.h\n")
+            file.write("2602;INVALID;Invalid;2;38;HasReturnvaluesIF;retval.h\n")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_parse_functions(self):
+        objects = parse_fsfw_objects_csv(self.objects_csv)
+        self.assertEqual(len(objects), 2)
+        obj_id = objects[bytes([0x44, 0x00, 0x00, 0x02])]
+        self.assertEqual(obj_id.obj_id, 0x44000002)
+        self.assertEqual(obj_id.name, "PCDU_HANDLER")
+        events = parse_fsfw_events_csv(self.events_csv)
+        self.assertEqual(events[2200].name, "MODE_TRANSITION_FAILED")
+        self.assertEqual(events[2200].severity, "LOW")
+        self.assertEqual(events[2200].file_location, "mode.h")
+        retvals = parse_fsfw_returnvalues_csv(self.retvals_csv)
+        self.assertEqual(retvals[0x2601].name, "TIMEOUT")
+        self.assertEqual(retvals[0x2602].if_name, "HasReturnvaluesIF")
+        self.assertIsNone(
+            parse_fsfw_events_csv(os.path.join(self.tmp_dir.name, "missing.csv"))
+        )
+
+    def test_catalog_cache(self):
+        catalog = EventCatalog(self.events_csv)
+        self.assertFalse(catalog.loaded_from_cache)
+        self.assertEqual(catalog[2200].name, "MODE_TRANSITION_FAILED")
+        self.assertIs(catalog[2200], catalog[2200])
+        self.assertFalse(catalog.loaded_from_cache)
+        self.assertTrue(os.path.exists(catalog.cache_path))
+        cached = EventCatalog(self.events_csv)
+        self.assertEqual(len(cached), 1)
+        self.assertTrue(cached.loaded_from_cache)
+        self.assertEqual(cached[2200].severity, "LOW")
+        self.assertNotIn(2201, cached)
+        with self.assertRaises(KeyError):
+            cached[2201]
+
+    def test_catalog_cache_dir(self):
+        cache_path = default_cache_path(self.events_csv)
+        self.assertEqual(
+            os.path.dirname(cache_path),
+            os.path.join(self.cache_home, "tmtccmd", "catalogs"),
+        )
+        self.assertTrue(os.path.basename(cache_path).startswith("events.csv-"))
+        # CSV files with the same name in different directories use different caches
+        other_csv = os.path.join(self.tmp_dir.name, "other", "events.csv")
+        self.assertNotEqual(default_cache_path(other_csv), cache_path)
+        catalog = EventCatalog(self.events_csv)
+        catalog.load()
+        self.assertEqual(catalog.cache_path, cache_path)
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)),
+            ["cache", "events.csv", "objects.csv", "retvals.csv"],
+        )
+
+    def test_catalog_cache_not_writable(self):
+        # The parent of the cache file is a regular file, so the cache can not be written
+        cache_path = os.path.join(self.events_csv, "events.cache")
+        with self.assertNoLogs(LOGGER, logging.WARNING):
+            catalog = EventCatalog(self.events_csv, cache_path=cache_path)
+            self.assertEqual(catalog[2200].name, "MODE_TRANSITION_FAILED")
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_catalog_changed_file(self):
+        self.assertEqual(len(ObjectCatalog(self.objects_csv)), 2)
+        with open(self.objects_csv, "a") as file:
+            file.write("0x44000003;THERMAL_CONTROLLER\n")
+        catalog = ObjectCatalog(self.objects_csv)
+        self.assertEqual(len(catalog), 3)
+        self.assertFalse(catalog.loaded_from_cache)
+        self.assertEqual(
+            catalog[bytes([0x44, 0x00, 0x00, 0x03])].name, "THERMAL_CONTROLLER"
+        )
+        # Only touching the file does not require parsing it again
+        os.utime(self.objects_csv, ns=(0, 0))
+        touched = ObjectCatalog(self.objects_csv)
+        touched.load()
+        self.assertTrue(touched.loaded_from_cache)
+
+    def test_catalog_pickled_cache_ignored(self):
+        catalog = EventCatalog(self.events_csv)
+        catalog.load()
+        # Pickled caches of older versions are never unpickled
+        with open(catalog.cache_path, "wb") as file:
+            pickle.dump({"version": 1, "entries": {}}, file)
+        cached = EventCatalog(self.events_csv)
+        self.assertEqual(cached[2200].name, "MODE_TRANSITION_FAILED")
+        self.assertFalse(cached.loaded_from_cache)
+        rewritten = EventCatalog(self.events_csv)
+        rewritten.load()
+        self.assertTrue(rewritten.loaded_from_cache)
+
+    def test_catalog_missing_file(self):
+        catalog = RetvalCatalog(os.path.join(self.tmp_dir.name, "missing.csv"))
+        self.assertFalse(catalog.exists)
+        self.assertEqual(len(catalog), 0)
+        self.assertEqual(
+            RetvalCatalog(self.retvals_csv).to_dict()[0x2602].name, "INVALID"
+        )
@@ -0,0 +1,84 @@
+from unittest import TestCase, skipIf
+
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.tm.pus_3_hk_batch import HkSetLayout, decode_hk_batch
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestHkSetLayout(TestCase):
+    def test_layout(self):
+        layout = HkSetLayout([("temp", "f"), ("counter", "I"), ("quat", "4d")])
+        self.assertEqual(layout.num_vars, 3)
+        self.assertEqual(layout.struct.size, 40)
+        self.assertEqual(layout.validity_buffer_len, 1)
+        self.assertEqual(layout.hk_data_len, 41)
+
+    def test_unpack(self):
+        layout = HkSetLayout([("temp", "f"), ("counter", "I"), ("quat", "4d")])
+        hk_data = (
+            bytes(4) + layout.struct.pack(1.5, 7, 1.0, 0.0, 0.0, 2.0) + bytes([0xA0])
+        )
+        values = layout.unpack(hk_data, 4)
+        self.assertEqual(values["temp"], 1.5)
+        self.assertEqual(values["counter"], 7)
+        self.assertEqual(values["quat"], (1.0, 0.0, 0.0, 2.0))
+        self.assertEqual(layout.validity_buffer(hk_data, 4), bytes([0xA0]))
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            HkSetLayout([("temp", "x")])
+
+
+@skipIf(np is None, "NumPy is not installed")
+class TestHkBatch(TestCase):
+    def setUp(self) -> None:
+        self.layout = HkSetLayout(
+            [("temp", "f"), ("counter", "I"), ("quat", "4d"), ("mode", "B")]
+        )
+        self.sid = bytes([0x01, 0x02, 0x03, 0x04, 0x00, 0x00, 0x00, 0x05])
+        self.packets = [self._hk_packet(self.sid, idx) for idx in range(5)]
+
+    def _hk_packet(self, sid: bytes, idx: int) -> bytes:
+        hk_data = self.layout.struct.pack(idx * 1.5, idx, 1.0, 2.0, 3.0, idx, idx % 2)
+        # Every other packet has an invalid counter
+        validity = bytes([0b10110000 if idx % 2 == 0 else 0b10010000])
+        return PusTelemetry(
+            service=3,
+            subservice=25,
+            apid=0x02,
+            source_data=sid + hk_data + validity,
+            time_provider=CdsShortTimestamp(ccsds_days=23000 + idx, ms_of_day=500),
+        ).pack()
+
+    def test_decode(self):
+        batch = decode_hk_batch(self.packets, self.layout)
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.skipped_packets, 0)
+        self.assertEqual(batch.columns["temp"].tolist(), [0.0, 1.5, 3.0, 4.5, 6.0])
+        self.assertEqual(batch.columns["counter"].tolist(), list(range(5)))
+        self.assertEqual(batch.columns["quat"].shape, (5, 4))
+        self.assertEqual(batch.columns["quat"][3].tolist(), [1.0, 2.0, 3.0, 3.0])
+        self.assertEqual(batch.columns["mode"].tolist(), [0, 1, 0, 1, 0])
+        self.assertEqual(batch.validity.shape, (5, 4))
+        self.assertEqual(batch.validity[0].tolist(), [True, False, True, True])
+        self.assertEqual(batch.validity[1].tolist(), [True, False, False, True])
+        expected_unix = CdsShortTimestamp(ccsds_days=23001, ms_of_day=500)
+        self.assertAlmostEqual(batch.timestamps[1], expected_unix.as_unix_seconds())
+
+    def test_other_sids_skipped(self):
+        other_sid = bytes([0x01, 0x02, 0x03, 0x04, 0x00, 0x00, 0x00, 0x06])
+        packets = self.packets + [self._hk_packet(other_sid, 0), bytes(20)]
+        batch = decode_hk_batch(packets, self.layout, sid=self.sid)
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch.skipped_packets, 2)
+
+    def test_empty(self):
+        batch = decode_hk_batch([], self.layout)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.columns["quat"].shape, (0, 4))
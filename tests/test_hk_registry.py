@@ -0,0 +1,86 @@
+import struct
+from unittest import TestCase
+
+from spacepackets.ecss import PusTelemetry
+from spacepackets.ecss.pus_3_hk import Subservices
+
+from tmtccmd.tm.pus_3_fsfw_hk import Service3FsfwTm
+from tmtccmd.tm.pus_3_hk_batch import HkSetLayout
+from tmtccmd.tm.pus_3_hk_registry import HkSetDefinition, HkSetRegistry
+
+OBJ_ID = bytes([0x01, 0x02, 0x03, 0x04])
+
+
+class TestHkSetRegistry(TestCase):
+    def setUp(self) -> None:
+        self.registry = HkSetRegistry()
+        self.sid = HkSetRegistry.sid(OBJ_ID, 5)
+        self.definitions_data = (
+            self.sid
+            + struct.pack("!BBfB", 1, 1, 2000.0, 2)
+            + struct.pack("!II", 0x10, 0x11)
+        )
+        self.hk_data = self.sid + struct.pack("!fH", 20.5, 3) + bytes([0x80])
+
+    def test_definition_unpack(self):
+        definition = HkSetDefinition.unpack(self.definitions_data)
+        self.assertEqual(definition.sid, self.sid)
+        self.assertTrue(definition.reporting_enabled)
+        self.assertTrue(definition.valid)
+        self.assertEqual(definition.collection_interval_seconds, 2.0)
+        self.assertEqual(definition.pool_ids, [0x10, 0x11])
+        with self.assertRaises(ValueError):
+            HkSetDefinition.unpack(self.definitions_data[:-1])
+
+    def test_definitions_list(self):
+        definitions_tm = _hk_tm(
+            Subservices.TM_HK_DEFINITIONS_REPORT, self.definitions_data
+        )
+        header, content = definitions_tm.get_hk_definitions_list()
+        self.assertEqual(header[-2:], ["Pool ID 1", "Pool ID 2"])
+        self.assertEqual(content[2:], ["On", "Yes", 2.0, 2, "0x10", "0x11"])
+        too_short_tm = _hk_tm(
+            Subservices.TM_HK_DEFINITIONS_REPORT, self.definitions_data[:-1]
+        )
+        self.assertEqual(too_short_tm.get_hk_definitions_list(), ([], []))
+
+    def test_registered_set(self):
+        self.registry.register_set(
+            self.sid, HkSetLayout([("temp", "f"), ("mode", "H")])
+        )
+        decoded = self.registry.decode(self.hk_data)
+        self.assertEqual(decoded.sid, self.sid)
+        self.assertEqual(decoded.values, {"temp": 20.5, "mode": 3})
+        self.assertEqual(decoded.validity, [True, False])
+        self.assertIsNone(self.registry.decode(self.hk_data[:-2]))
+
+    def test_unknown_set(self):
+        self.assertIsNone(self.registry.decode(self.hk_data))
+
+    def test_learn_from_definitions(self):
+        self.registry.register_pool_variable(0x10, "temp", "f")
+        self.assertIsNone(
+            self.registry.learn_from_definitions(
+                HkSetDefinition.unpack(self.definitions_data)
+            )
+        )
+        self.assertIsNone(self.registry.layout(self.sid))
+        self.registry.register_pool_variable(0x11, "mode", "H")
+        definitions_tm = _hk_tm(
+            Subservices.TM_HK_DEFINITIONS_REPORT, self.definitions_data
+        )
+        self.assertIsNone(self.registry.handle_hk_tm(definitions_tm))
+        self.assertEqual(self.registry.layout(self.sid).names, ["temp", "mode"])
+        self.assertEqual(self.registry.definition(self.sid).pool_ids, [0x10, 0x11])
+        hk_tm = _hk_tm(Subservices.TM_HK_REPORT, self.hk_data)
+        decoded = self.registry.handle_hk_tm(hk_tm)
+        self.assertEqual(decoded.values, {"temp": 20.5, "mode": 3})
+
+
+def _hk_tm(subservice: int, tm_data: bytes) -> Service3FsfwTm:
+    return Service3FsfwTm.unpack(
+        PusTelemetry(
+            service=3, subservice=subservice, apid=0x02, source_data=tm_data
+        ).pack(),
+        custom_hk_handling=False,
+    )
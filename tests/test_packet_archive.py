@@ -0,0 +1,138 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.logging.archive import (
+    ArchiveDirection,
+    FILE_HEADER_LEN,
+    INDEX_ENTRY_LEN,
+    PacketArchiveReader,
+    PacketArchiveWriter,
+    archive_file_start,
+    archive_files,
+    index_path,
+    read_archive,
+)
+from tmtccmd.logging.pus import TimedLogWhen
+
+# 2022-01-01 00:00:00 UTC
+START_TIME = 1640995200.0
+
+
+def raw_tc(apid: int, service: int, subservice: int, app_data: bytes = b"") -> bytes:
+    return bytes(
+        PusTelecommand(
+            service=service, subservice=subservice, apid=apid, app_data=app_data
+        ).pack()
+    )
+
+
+class TestPacketArchive(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp_dir.name)
+        self.tcs = [
+            raw_tc(apid=0x10 + idx % 2, service=17, subservice=1, app_data=bytes([idx]))
+            for idx in range(10)
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, when: TimedLogWhen = TimedLogWhen.PER_HOUR, step: float = 1.0):
+        with PacketArchiveWriter(self.directory, when=when) as writer:
+            for idx, tc in enumerate(self.tcs):
+                writer.write(tc, ArchiveDirection.TC, START_TIME + idx * step)
+            return writer.file_name
+
+    def test_write_read(self):
+        file_name = self._write()
+        self.assertEqual(file_name.name, "tmtc-archive_20220101_000000.tmtca")
+        self.assertEqual(archive_file_start(file_name), START_TIME)
+        with PacketArchiveReader(file_name) as reader:
+            self.assertEqual(len(reader), 10)
+            self.assertEqual(reader.time_range, (START_TIME, START_TIME + 9))
+            record = reader[3]
+            self.assertEqual(record.timestamp, START_TIME + 3)
+            self.assertEqual(record.direction, ArchiveDirection.TC)
+            self.assertEqual(record.apid, 0x11)
+            self.assertEqual(record.service, 17)
+            self.assertEqual(record.subservice, 1)
+            self.assertEqual(record.raw, self.tcs[3])
+            self.assertEqual([rec.raw for rec in reader], self.tcs)
+
+    def test_time_range_query(self):
+        file_name = self._write()
+        with PacketArchiveReader(file_name) as reader:
+            self.assertEqual(reader.index_range(START_TIME + 2, START_TIME + 5), (2, 5))
+            records = list(reader.records(START_TIME + 2, START_TIME + 5))
+            self.assertEqual([rec.raw for rec in records], self.tcs[2:5])
+            records = list(reader.records(start=START_TIME + 2, apid=0x10))
+            self.assertEqual([rec.raw for rec in records], self.tcs[2::2])
+            self.assertEqual(list(reader.records(direction=ArchiveDirection.TM)), [])
+            self.assertEqual(list(reader.records(start=START_TIME + 100)), [])
+
+    def test_rotation(self):
+        self._write(when=TimedLogWhen.PER_MINUTE, step=20.0)
+        files = archive_files(self.directory)
+        self.assertEqual(len(files), 4)
+        self.assertEqual(
+            [archive_file_start(path) for path in files],
+            [START_TIME + minute * 60 for minute in range(4)],
+        )
+        records = list(read_archive(self.directory))
+        self.assertEqual([rec.raw for rec in records], self.tcs)
+        records = list(read_archive(self.directory, START_TIME + 70, START_TIME + 130))
+        self.assertEqual([rec.raw for rec in records], self.tcs[4:7])
+        records = list(read_archive(self.directory, apid=0x11, end=START_TIME + 60))
+        self.assertEqual([rec.raw for rec in records], self.tcs[1:3:2])
+
+    def test_missing_index_is_rebuilt(self):
+        file_name = self._write()
+        index_path(file_name).unlink()
+        with PacketArchiveReader(file_name) as reader:
+            self.assertEqual([rec.raw for rec in reader], self.tcs)
+
+    def test_append_after_partial_write(self):
+        file_name = self._write()
+        # Simulate a record which was not written completely and a lagging index
+        with open(file_name, "ab") as file:
+            file.write(b"\x00\x00\x00\x20\x01\x02")
+        with open(index_path(file_name), "r+b") as file:
+            file.truncate(FILE_HEADER_LEN + 5 * INDEX_ENTRY_LEN)
+        with PacketArchiveWriter(self.directory) as writer:
+            writer.write_tc(self.tcs[0], START_TIME + 20)
+        self.assertEqual(
+            index_path(file_name).stat().st_size, FILE_HEADER_LEN + 11 * INDEX_ENTRY_LEN
+        )
+        with PacketArchiveReader(file_name) as reader:
+            self.assertEqual([rec.raw for rec in reader], self.tcs + [self.tcs[0]])
+
+    def test_out_of_order_timestamp_rejected(self):
+        with PacketArchiveWriter(self.directory) as writer:
+            writer.write_tc(self.tcs[0], START_TIME + 10)
+            writer.write_tc(self.tcs[1], START_TIME + 10)
+            with self.assertRaises(ValueError):
+                writer.write_tc(self.tcs[2], START_TIME + 5)
+            # Earlier rotation period
+            with self.assertRaises(ValueError):
+                writer.write_tc(self.tcs[2], START_TIME - 3600)
+            file_name = writer.file_name
+        # The last timestamp of an existing archive file is also respected when appending
+        with PacketArchiveWriter(self.directory) as writer:
+            with self.assertRaises(ValueError):
+                writer.write_tc(self.tcs[3], START_TIME + 5)
+            writer.write_tc(self.tcs[3], START_TIME + 11)
+        with PacketArchiveReader(file_name) as reader:
+            self.assertEqual(
+                [rec.raw for rec in reader], [self.tcs[0], self.tcs[1], self.tcs[3]]
+            )
+            self.assertEqual(reader.index_range(START_TIME + 11), (2, 3))
+
+    def test_invalid_file(self):
+        path = self.directory / "invalid.tmtca"
+        path.write_bytes(b"not an archive")
+        with self.assertRaises(ValueError):
+            PacketArchiveReader(path)
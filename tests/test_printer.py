@@ -1,4 +1,7 @@
+import logging
 import os
+import re
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 
@@ -14,8 +17,11 @@ from tmtccmd.tm.pus_1_verification import Service1TmExtended
 from tmtccmd.pus.pus_17_test import pack_service_17_ping_command
 from tmtccmd.logging import get_console_logger, LOG_DIR
 from tmtccmd.logging.pus import (
+    RAW_PUS_LOGGER_NAME,
     RegularTmtcLogWrapper,
     RawTmtcRotatingLogWrapper,
+    RawTmtcTimedLogWrapper,
+    TimedLogWhen,
 )
 
 
@@ -49,6 +55,81 @@ class TestPrintersLoggers(TestCase):
         self.assertTrue(Path(raw_tmtc_log.file_name).exists())
         self.assertTrue(Path(f"{raw_tmtc_log.file_name}.1").exists())
 
+    def test_background_raw_logger(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            raw_tmtc_log = RawTmtcTimedLogWrapper(
+                when=TimedLogWhen.PER_HOUR,
+                interval=1,
+                file_name=Path(tmp_dir, "pus-log.log"),
+                background=True,
+            )
+            self.assertTrue(raw_tmtc_log.background)
+            pus_tc = pack_service_17_ping_command()
+            raw_tc = pus_tc.pack()
+            for _ in range(10):
+                raw_tmtc_log.log_tc(pus_tc, raw_tc)
+            self.assertTrue(raw_tmtc_log.flush(timeout=5.0))
+            raw_tmtc_log.close()
+            self.assertFalse(raw_tmtc_log.background)
+            with open(raw_tmtc_log.file_name) as file:
+                lines = file.read().splitlines()
+        # Representation, readable hex and bytes representation for each packet
+        self.assertEqual(len(lines), 30)
+        self.assertTrue(
+            re.match(
+                r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}: tc 0 \[17, 1\] repr: ",
+                lines[0],
+            )
+        )
+        self.assertTrue(lines[1].endswith(f"raw readable hex: [{raw_tc.hex(sep=',')}]"))
+        self.assertTrue(lines[2].endswith(f"raw repr: {raw_tc!r}"))
+        self.assertIn("tc 9 [17, 1]", lines[29])
+
+    def test_mixed_raw_logger_modes(self):
+        class PrefixedLogWrapper(RawTmtcTimedLogWrapper):
+            @staticmethod
+            def tc_prefix(packet, counter: int):
+                return f"custom tc {counter}"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sync_log = RawTmtcTimedLogWrapper(
+                when=TimedLogWhen.PER_HOUR,
+                interval=1,
+                file_name=Path(tmp_dir, "sync.log"),
+            )
+            background_log = PrefixedLogWrapper(
+                when=TimedLogWhen.PER_HOUR,
+                interval=1,
+                file_name=Path(tmp_dir, "background.log"),
+                background=True,
+            )
+            pus_tc = pack_service_17_ping_command()
+            sync_log.log_tc(pus_tc)
+            background_log.log_tc(pus_tc)
+            # Raw packets which are too short for a PUS header can be logged as well
+            background_log.log_tc(pus_tc, bytes([0, 1, 2]))
+            background_log.close()
+            sync_log.close()
+            with open(sync_log.file_name) as file:
+                sync_lines = file.read().splitlines()
+            with open(background_log.file_name) as file:
+                background_lines = file.read().splitlines()
+        # The wrappers share the raw PUS logger, so both files contain the lines of both
+        self.assertEqual(len(sync_lines), 9)
+        self.assertEqual(background_lines, sync_lines)
+        line_re = r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}: "
+        for line in sync_lines[:3]:
+            self.assertTrue(re.match(line_re + r"tc 0 \[17, 1\] ", line))
+        for line in background_lines[3:]:
+            # The overridden prefix hook is used and each line has exactly one timestamp
+            self.assertTrue(re.match(line_re + r"custom tc [01] ", line))
+        self.assertTrue(background_lines[7].endswith("raw readable hex: [00,01,02]"))
+        self.assertTrue(background_lines[8].endswith(f"raw repr: {bytes([0, 1, 2])!r}"))
+        # Closing the wrappers removes their handlers again
+        raw_pus_handlers = logging.getLogger(RAW_PUS_LOGGER_NAME).handlers
+        self.assertNotIn(sync_log.handler, raw_pus_handlers)
+        self.assertNotIn(background_log.handler, raw_pus_handlers)
+
     def test_print_functions(self):
         pass
 
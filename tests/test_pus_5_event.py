@@ -0,0 +1,93 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from spacepackets.ecss.pus_5_event import Severity, Subservices
+
+from tmtccmd.pus.pus_5_event import EventInfoIndex
+from tmtccmd.tm.pus_5_event import Service5Tm, decode_event
+
+
+class TestService5Tm(TestCase):
+    def test_pack_unpack(self):
+        event_tm = Service5Tm(
+            subservice=Subservices.TM_LOW_SEVERITY_EVENT,
+            event_id=2200,
+            object_id=bytes([0x44, 0x00, 0x00, 0x01]),
+            param_1=5,
+            param_2=0xFFFFFFFF,
+            apid=0x02,
+        )
+        raw = event_tm.pack()
+        first = Service5Tm.unpack(raw)
+        self.assertEqual(first.event_id, 2200)
+        self.assertEqual(first.reporter_id.obj_id, 0x44000001)
+        self.assertEqual(first.param_1, 5)
+        self.assertEqual(first.param_2, 0xFFFFFFFF)
+        self.assertEqual(first.get_print_info(), "Event Error Low Severity")
+        self.assertEqual(first.pack(), raw)
+        second = Service5Tm.unpack(raw)
+        self.assertIs(first.reporter_id, second.reporter_id)
+
+    def test_decode_event(self):
+        raw = Service5Tm(
+            subservice=Subservices.TM_HIGH_SEVERITY_EVENT,
+            event_id=12,
+            object_id=bytes([0x44, 0x00, 0x00, 0x02]),
+            param_1=1,
+            param_2=2,
+        ).pack()
+        event = decode_event(raw)
+        self.assertEqual(event.subservice, Subservices.TM_HIGH_SEVERITY_EVENT)
+        self.assertEqual(event.event_id, 12)
+        self.assertEqual(event.reporter_id.obj_id, 0x44000002)
+        self.assertEqual((event.param_1, event.param_2), (1, 2))
+        raw[-1] ^= 0xFF
+        with self.assertRaises(ValueError):
+            decode_event(raw)
+        self.assertEqual(decode_event(raw, check_crc=False).event_id, 12)
+        with self.assertRaises(ValueError):
+            decode_event(raw[:-3])
+
+    def test_invalid_object_id(self):
+        with self.assertRaises(ValueError):
+            Service5Tm(
+                subservice=Subservices.TM_INFO_EVENT,
+                event_id=1,
+                object_id=bytes(3),
+                param_1=0,
+                param_2=0,
+            )
+
+
+class TestEventInfoIndex(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.events_csv = os.path.join(self.tmp_dir.name, "events.csv")
+        self.objects_csv = os.path.join(self.tmp_dir.name, "objects.csv")
+        with open(self.events_csv, "w") as file:
+            file.write("Event ID;Event Name;Name;Severity;Description;File Path\n")
+            file.write("2200;0x0898;MODE_TRANSITION_FAILED;LOW;Failed;mode.h\n")
+            file.write("2201;0x0899;MODE_INFO;INFO;Info;mode.h\n")
+        with open(self.objects_csv, "w") as file:
+            file.write("0x44000001;ACS_CONTROLLER\n")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_from_csv(self):
+        index = EventInfoIndex.from_csv(self.events_csv, self.objects_csv)
+        self.assertEqual(len(index), 2)
+        self.assertIn(2200, index)
+        self.assertEqual(index.event_name(2200), "MODE_TRANSITION_FAILED")
+        self.assertEqual(index.event_info(2201).severity, "INFO")
+        self.assertEqual(index.severity(2200), Severity.LOW)
+        self.assertEqual(index.reporter_name(0x44000001), "ACS_CONTROLLER")
+        self.assertEqual(index.event_name(1), EventInfoIndex.UNKNOWN_NAME)
+        self.assertIsNone(index.severity(1))
+        self.assertEqual(index.reporter_name(0), EventInfoIndex.UNKNOWN_NAME)
+
+    def test_missing_file(self):
+        self.assertIsNone(
+            EventInfoIndex.from_csv(os.path.join(self.tmp_dir.name, "missing.csv"))
+        )
@@ -5,14 +5,16 @@ from typing import cast
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from spacepackets.ecss import PusTelecommand
-from tmtccmd.tc import WaitEntry, QueueEntryHelper
+from spacepackets.ecss import PusTelecommand, PusVerificator
+from spacepackets.ecss.req_id import RequestId
+from tmtccmd.tc import WaitEntry, QueueEntryHelper, CompiledTcEntry, TcQueueEntryType
 
 # Required for eval calls
 # noinspection PyUnresolvedReferences
 from tmtccmd.tc import LogQueueEntry, RawTcEntry
 from tmtccmd.tc.queue import QueueWrapper, QueueHelperBase, DefaultPusQueueHelper
-from tmtccmd.util import ProvidesSeqCount
+from tmtccmd.tc.stamp import PusTcStamper, crc16_ccitt
+from tmtccmd.util import ProvidesSeqCount, SeqCountProvider
 
 
 class TestTcQueue(TestCase):
@@ -48,6 +50,121 @@ class TestTcQueue(TestCase):
         pus_entry = cast_wrapper.to_pus_tc_entry()
         self.assertEqual(pus_entry.pus_tc.seq_count, 5)
 
+    def test_packed_stamping(self):
+        verificator = PusVerificator()
+        self.queue_helper.pus_apid = 0x22
+        self.queue_helper.seq_cnt_provider = SeqCountProvider(16)
+        self.queue_helper.pus_verificator = verificator
+        tcs = [
+            PusTelecommand(service=8, subservice=128, app_data=bytes([idx] * 8))
+            for idx in range(3)
+        ]
+        raw_tc = PusTelecommand(service=17, subservice=1, apid=0x05).pack()
+        original = tcs[0].pack()
+        self.assertEqual(self.queue_helper.add_pus_tcs_packed(tcs + [raw_tc]), 4)
+        self.assertEqual(len(self.queue_wrapper.queue), 4)
+        for idx, tc in enumerate(tcs + [PusTelecommand.unpack(raw_tc)]):
+            entry = QueueEntryHelper(self.queue_wrapper.queue.popleft())
+            raw_entry = entry.to_raw_tc_entry()
+            expected = PusTelecommand(
+                service=tc.service,
+                subservice=tc.subservice,
+                app_data=tc.app_data,
+                apid=0x22,
+                seq_count=idx,
+            )
+            self.assertEqual(raw_entry.tc, bytes(expected.pack()))
+            self.assertIn(RequestId.from_pus_tc(expected), verificator.verif_dict)
+        # The passed objects are not modified
+        self.assertEqual(tcs[0].pack(), original)
+
+    def test_packed_too_short(self):
+        with self.assertRaises(ValueError):
+            self.queue_helper.add_pus_tcs_packed([bytes([0, 1, 2])])
+        # Valid space packet which is too short for a PUS TC
+        with self.assertRaises(ValueError):
+            self.queue_helper.add_pus_tcs_packed(
+                [bytes([0x18, 0, 0xC0, 0, 0, 1, 0, 0])]
+            )
+
+    def test_packed_time_tagged_stamping(self):
+        self.queue_helper.pus_apid = 0x22
+        self.queue_helper.seq_cnt_provider = SeqCountProvider(16)
+        inner_tc = PusTelecommand(service=17, subservice=1)
+        timestamp = bytes([0, 0, 0, 10])
+        sched_tc = PusTelecommand(
+            service=11, subservice=4, app_data=timestamp + inner_tc.pack()
+        )
+        self.queue_helper.add_pus_tcs_packed([sched_tc])
+        raw_tc = self.queue_wrapper.queue.popleft().tc
+        self.assertEqual(crc16_ccitt(raw_tc), 0)
+        unpacked = PusTelecommand.unpack(raw_tc)
+        self.assertEqual(unpacked.seq_count, 1)
+        self.assertEqual(unpacked.apid, 0x22)
+        self.assertEqual(crc16_ccitt(unpacked.app_data[4:]), 0)
+        unpacked_inner = PusTelecommand.unpack(unpacked.app_data[4:])
+        self.assertEqual(unpacked_inner.seq_count, 0)
+        self.assertEqual(unpacked_inner.apid, 0x22)
+        self.assertEqual(unpacked_inner.service, 17)
+
+    def test_compile(self):
+        verificator = PusVerificator()
+        stamper = PusTcStamper(
+            pus_apid=0x22,
+            seq_cnt_provider=SeqCountProvider(16),
+            pus_verificator=verificator,
+        )
+        space_packet_tc = PusTelecommand(service=17, subservice=1, apid=0x05)
+        self.queue_helper.add_log_cmd("Pinging")
+        self.queue_helper.add_pus_tc(self.pus_cmd)
+        self.queue_helper.add_wait_ms(20)
+        self.queue_helper.add_raw_tc(bytes([0, 1, 2]))
+        self.queue_helper.add_packet_delay_ms(10)
+        self.queue_helper.add_ccsds_tc(space_packet_tc.to_space_packet())
+        compiled = self.queue_wrapper.compile(stamper)
+        self.assertEqual(len(compiled), 3)
+        expected_pus_tc = PusTelecommand(
+            service=17, subservice=1, apid=0x22, seq_count=0
+        ).pack()
+        self.assertEqual(compiled[0], expected_pus_tc)
+        self.assertEqual(compiled[1], bytes([0, 1, 2]))
+        self.assertEqual(compiled[-1], space_packet_tc.pack())
+        self.assertEqual(
+            compiled.nbytes, len(expected_pus_tc) + 3 + len(space_packet_tc.pack())
+        )
+        self.assertEqual(compiled.offsets[1], len(expected_pus_tc))
+        with self.assertRaises(IndexError):
+            compiled[3]
+        self.assertIn(
+            RequestId.from_pus_tc(PusTelecommand.unpack(expected_pus_tc)),
+            verificator.verif_dict,
+        )
+        etypes = [entry.etype for entry in self.queue_wrapper.queue]
+        self.assertEqual(
+            etypes,
+            [
+                TcQueueEntryType.LOG,
+                TcQueueEntryType.RAW_TC,
+                TcQueueEntryType.WAIT,
+                TcQueueEntryType.RAW_TC,
+                TcQueueEntryType.PACKET_DELAY,
+                TcQueueEntryType.RAW_TC,
+            ],
+        )
+        compiled_entry = QueueEntryHelper(self.queue_wrapper.queue[1]).to_raw_tc_entry()
+        self.assertIsInstance(compiled_entry, CompiledTcEntry)
+        self.assertIs(compiled_entry.source.pus_tc, self.pus_cmd)
+        self.assertEqual(compiled_entry.tc, expected_pus_tc)
+        # Compiling again keeps the original source entries and stamps them again
+        stamper.pus_apid = 0x33
+        recompiled = self.queue_wrapper.compile(stamper)
+        self.assertIs(self.queue_wrapper.queue[1].source.pus_tc, self.pus_cmd)
+        self.assertEqual(
+            recompiled[0],
+            PusTelecommand(service=17, subservice=1, apid=0x33, seq_count=1).pack(),
+        )
+        self.assertEqual(recompiled[1], bytes([0, 1, 2]))
+
     def test_faulty_cast(self):
         self.queue_helper.add_pus_tc(self.pus_cmd)
         cast_wrapper = QueueEntryHelper(self.queue_wrapper.queue.popleft())
@@ -174,8 +174,26 @@ class TestSendReceive(TestCase):
         self.assertFalse(res.tc_sent)
         self.assertFalse(self.seq_sender.no_delay_remaining())
         self.assertTrue(0.8 * delay_at_end < res.longest_rem_delay <= delay_at_end)
+        self.assertIsNotNone(res.next_wake_time)
+        self.assertTrue(
+            0.8 * delay_at_end.total_seconds()
+            < res.next_wake_time - time.monotonic()
+            <= delay_at_end.total_seconds()
+        )
         self.assertEqual(self.seq_sender.mode, SenderMode.BUSY)
         time.sleep(delay_at_end.total_seconds())
         self.assertTrue(self.seq_sender.no_delay_remaining())
-        self.seq_sender.operation(self.com_if)
+        res = self.seq_sender.operation(self.com_if)
         self.assertEqual(self.seq_sender.mode, SenderMode.DONE)
+        self.assertIsNone(res.next_wake_time)
+
+    def test_long_wait_entry(self):
+        self.queue_helper.add_wait(timedelta(seconds=1, milliseconds=500))
+        self.queue_helper.add_raw_tc(bytes([0, 1, 2]))
+        self.seq_sender.resume()
+        res = self.seq_sender.operation(self.com_if)
+        self.assertFalse(res.tc_sent)
+        self.assertTrue(
+            timedelta(seconds=1.4) < res.longest_rem_delay <= timedelta(seconds=1.5)
+        )
+        self.assertTrue(1.4 < res.next_wake_time - time.monotonic() <= 1.5)
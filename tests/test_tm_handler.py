@@ -1,3 +1,4 @@
+import threading
 from collections import deque
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -8,7 +9,8 @@ from tmtccmd.tm import (
     CcsdsTmHandler,
     GenericApidHandlerBase,
 )
-from tmtccmd.com_if import ComInterface
+from tmtccmd.com_if import ComInterface, MultiSourceComInterface
+from tmtccmd.tm.apid_worker import ApidWorkerCfg
 from tmtccmd.tm.ccsds_tm_listener import CcsdsTmListener
 
 
@@ -57,3 +59,69 @@ class TestTmHandler(TestCase):
         handled_packets = tm_listener.operation(com_if)
         self.assertEqual(handled_packets, 1)
         unknown_handler.handle_tm.assert_called_once()
+
+    def test_routing_by_source(self):
+        bench0_handler = ApidHandler(0x01)
+        bench1_handler = ApidHandler(0x01)
+        default_handler = CcsdsTmHandler(MagicMock(specs=GenericApidHandlerBase))
+        default_handler.add_apid_handler(bench0_handler)
+        bench1_ccsds_handler = CcsdsTmHandler(MagicMock(specs=GenericApidHandlerBase))
+        bench1_ccsds_handler.add_apid_handler(bench1_handler)
+        tm_listener = CcsdsTmListener(tm_handler=default_handler)
+        tm_listener.add_source_handler("bench1", bench1_ccsds_handler)
+        com_if = MagicMock(spec=MultiSourceComInterface)
+        tm0_raw = PusTelemetry(service=1, subservice=12, apid=0x01).pack()
+        tm1_raw = PusTelemetry(service=5, subservice=1, apid=0x01).pack()
+        com_if.receive_with_source.return_value = [
+            ("bench0", tm0_raw),
+            ("bench1", tm1_raw),
+        ]
+        self.assertEqual(tm_listener.operation(com_if), 2)
+        self.assertEqual(bench0_handler.packet_queue.pop(), tm0_raw)
+        self.assertEqual(bench1_handler.packet_queue.pop(), tm1_raw)
+        com_if.receive.assert_not_called()
+
+    def test_apid_workers(self):
+        slow_handler = BlockingApidHandler(0x01)
+        fast_handler = ApidHandler(0x02)
+        ccsds_handler = CcsdsTmHandler(None)
+        ccsds_handler.add_apid_handler(slow_handler, ApidWorkerCfg(max_queue_len=2))
+        ccsds_handler.add_apid_handler(fast_handler)
+        slow_tms = [
+            PusTelemetry(service=17, subservice=2, apid=0x01, seq_count=idx).pack()
+            for idx in range(5)
+        ]
+        fast_tm = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+        try:
+            ccsds_handler.handle_packet(0x01, slow_tms[0])
+            self.assertTrue(slow_handler.started.wait(1.0))
+            # The worker is blocked now, which does not delay the other APID
+            for tm in slow_tms[1:]:
+                self.assertTrue(ccsds_handler.handle_packet(0x01, tm))
+            self.assertTrue(ccsds_handler.handle_packet(0x02, fast_tm))
+            self.assertEqual(fast_handler.packet_queue.pop(), fast_tm)
+            stats = ccsds_handler.worker_stats()[0x01]
+            self.assertEqual(stats.queue_depth, 2)
+            self.assertEqual(stats.queue.dropped_packets, 2)
+            slow_handler.release.set()
+        finally:
+            ccsds_handler.stop_workers(1.0)
+        # Order is kept, the two oldest queued packets were dropped
+        self.assertEqual(
+            list(reversed(slow_handler.packet_queue)), [slow_tms[i] for i in (0, 3, 4)]
+        )
+        stats = ccsds_handler.worker_stats()[0x01]
+        self.assertEqual(stats.handled_packets, 3)
+        self.assertEqual(stats.queue_depth, 0)
+
+
+class BlockingApidHandler(ApidHandler):
+    def __init__(self, apid: int):
+        super().__init__(apid)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def handle_tm(self, packet: bytes, user_args: any):
+        self.started.set()
+        self.release.wait(1.0)
+        super().handle_tm(packet, user_args)
@@ -0,0 +1,64 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from spacepackets.ecss import PusTelemetry
+from spacepackets.ecss.pus_17_test import Service17Tm
+
+from tmtccmd.tm.header_view import PusTmHeaderView, LazyPusTm, PusTmDispatcher
+
+
+class TestTmHeaderView(TestCase):
+    def setUp(self) -> None:
+        self.pus_tm = PusTelemetry(
+            service=17,
+            subservice=2,
+            apid=0x22,
+            seq_count=5,
+            source_data=bytes([1, 2, 3]),
+        )
+        self.raw_tm = self.pus_tm.pack()
+
+    def test_header_fields(self):
+        view = PusTmHeaderView(self.raw_tm)
+        self.assertEqual(view.apid, 0x22)
+        self.assertEqual(view.seq_count, 5)
+        self.assertEqual(view.service, 17)
+        self.assertEqual(view.subservice, 2)
+        self.assertEqual(view.pus_version, 2)
+        self.assertEqual(view.packet_len, len(self.raw_tm))
+        self.assertEqual(view.source_data, bytes([1, 2, 3]))
+        timestamp = self.pus_tm.pus_tm_sec_header.time_provider.pack()
+        self.assertEqual(view.timestamp, timestamp)
+        self.assertEqual(view.unpack_timestamp().pack(), timestamp)
+
+    def test_no_crc_check(self):
+        broken_tm = bytearray(self.raw_tm)
+        broken_tm[-1] ^= 0xFF
+        self.assertEqual(PusTmHeaderView(broken_tm).service, 17)
+
+    def test_too_short(self):
+        with self.assertRaises(ValueError):
+            PusTmHeaderView(self.raw_tm[:12])
+
+    def test_lazy_unpack_cached(self):
+        lazy_tm = LazyPusTm(self.raw_tm)
+        ping_reply = lazy_tm.unpack(Service17Tm.unpack)
+        self.assertEqual(ping_reply.subservice, 2)
+        self.assertIs(lazy_tm.unpack(Service17Tm.unpack), ping_reply)
+        self.assertEqual(lazy_tm.unpack().service, 17)
+
+    def test_dispatcher(self):
+        dispatcher = PusTmDispatcher(0x22)
+        ping_cb = MagicMock()
+        event_cb = MagicMock()
+        generic_cb = MagicMock()
+        dispatcher.subscribe(ping_cb, service=17)
+        dispatcher.subscribe(event_cb, service=5)
+        dispatcher.subscribe(generic_cb)
+        dispatcher.handle_tm(self.raw_tm, None)
+        ping_cb.assert_called_once()
+        event_cb.assert_not_called()
+        generic_cb.assert_called_once()
+        lazy_tm = ping_cb.call_args[0][0]
+        self.assertIs(lazy_tm, generic_cb.call_args[0][0])
+        self.assertEqual(lazy_tm.raw, self.raw_tm)
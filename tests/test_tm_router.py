@@ -0,0 +1,75 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from spacepackets.ecss import PusTelemetry
+from spacepackets.ecss.pus_17_test import Service17Tm
+
+from tmtccmd.tm import CcsdsTmHandler
+from tmtccmd.tm.header_view import LazyPusTm
+from tmtccmd.tm.router import PusTmRouter
+
+
+class TestPusTmRouter(TestCase):
+    def setUp(self) -> None:
+        self.unmatched = MagicMock()
+        self.router = PusTmRouter(unmatched_handler=self.unmatched)
+        self.ping_reply = PusTelemetry(service=17, subservice=2, apid=0x01).pack()
+        self.event = PusTelemetry(service=5, subservice=1, apid=0x01).pack()
+        self.other_apid_ping = PusTelemetry(service=17, subservice=2, apid=0x02).pack()
+
+    def test_exact_and_wildcards(self):
+        exact_cb = MagicMock()
+        service_cb = MagicMock()
+        apid_cb = MagicMock()
+        all_cb = MagicMock()
+        self.router.register(all_cb)
+        self.router.register(apid_cb, apid=0x01)
+        self.router.register(service_cb, service=17)
+        self.router.register(exact_cb, apid=0x01, service=17, subservice=2)
+        self.assertEqual(
+            self.router.callbacks(0x01, 17, 2), (exact_cb, apid_cb, service_cb, all_cb)
+        )
+        self.assertTrue(self.router.route(self.ping_reply))
+        self.assertTrue(self.router.route(self.event))
+        self.assertTrue(self.router.route(self.other_apid_ping))
+        self.assertEqual(exact_cb.call_count, 1)
+        self.assertEqual(apid_cb.call_count, 2)
+        self.assertEqual(service_cb.call_count, 2)
+        self.assertEqual(all_cb.call_count, 3)
+        self.assertIsInstance(exact_cb.call_args[0][0], LazyPusTm)
+        self.unmatched.assert_not_called()
+
+    def test_unmatched(self):
+        self.router.register(MagicMock(), service=17)
+        self.assertFalse(self.router.route(self.event))
+        self.unmatched.assert_called_once()
+        self.assertEqual(self.router.unmatched_packets, 1)
+        self.assertFalse(self.router.route(bytes(5)))
+        self.assertEqual(self.router.invalid_packets, 1)
+
+    def test_registration_invalidates_cache(self):
+        first_cb = MagicMock()
+        second_cb = MagicMock()
+        self.router.register(first_cb, service=17)
+        self.router.route(self.ping_reply)
+        self.router.register(second_cb, service=17, subservice=2)
+        self.router.route(self.ping_reply)
+        self.assertEqual(first_cb.call_count, 2)
+        self.assertEqual(second_cb.call_count, 1)
+
+    def test_unpacker(self):
+        first_cb = MagicMock()
+        second_cb = MagicMock()
+        self.router.register(first_cb, service=17, unpacker=Service17Tm.unpack)
+        self.router.register(second_cb, service=17, unpacker=Service17Tm.unpack)
+        self.router.route(self.ping_reply)
+        ping_reply = first_cb.call_args[0][0]
+        self.assertIsInstance(ping_reply, Service17Tm)
+        self.assertIs(second_cb.call_args[0][0], ping_reply)
+
+    def test_as_generic_handler(self):
+        ping_cb = MagicMock()
+        self.router.register(ping_cb, service=17, subservice=2)
+        ccsds_handler = CcsdsTmHandler(self.router)
+        ccsds_handler.handle_packet(0x01, self.ping_reply)
+        ping_cb.assert_called_once()
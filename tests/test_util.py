@@ -1,7 +1,13 @@
+import copy
 from unittest import TestCase
 
 from tmtccmd.util import ObjectIdU32
-from tmtccmd.util.obj_id import ObjectIdU8, ObjectIdU16
+from tmtccmd.util.obj_id import (
+    InternedObjectIdU32,
+    ObjectIdInterner,
+    ObjectIdU8,
+    ObjectIdU16,
+)
 
 
 class TestObjectId(TestCase):
@@ -46,3 +52,51 @@ class TestObjectId(TestCase):
         self.assertEqual(obj_id_u16_from_raw, obj_id_u16)
         obj_id_u32_from_raw = ObjectIdU32.from_bytes(obj_id_u32.as_bytes)
         self.assertEqual(obj_id_u32_from_raw, obj_id_u32)
+
+
+class TestObjectIdInterner(TestCase):
+    def setUp(self) -> None:
+        self.named_id = ObjectIdU32(0x44000001, "ACS_CONTROLLER")
+        self.interner = ObjectIdInterner(
+            max_cached=2, names={self.named_id.as_bytes: self.named_id}
+        )
+
+    def test_named(self):
+        obj_id = self.interner.get(bytes([0x44, 0x00, 0x00, 0x01, 0xFF]))
+        self.assertIsInstance(obj_id, InternedObjectIdU32)
+        self.assertEqual(obj_id.name, "ACS_CONTROLLER")
+        self.assertEqual(obj_id.as_hex_string, "0x44000001")
+        self.assertEqual(obj_id, self.named_id)
+        self.assertIs(self.interner.get_by_int(0x44000001), obj_id)
+
+    def test_immutable(self):
+        obj_id = self.interner.get_by_int(5)
+        with self.assertRaises(AttributeError):
+            obj_id.name = "Other"
+        with self.assertRaises(AttributeError):
+            obj_id.obj_id = 6
+        obj_id_copy = copy.copy(obj_id)
+        obj_id_copy.name = "Other"
+        self.assertEqual(obj_id.name, "Unknown")
+
+    def test_lru_eviction(self):
+        first = self.interner.get_by_int(1)
+        second = self.interner.get_by_int(2)
+        self.assertIs(self.interner.get_by_int(1), first)
+        self.interner.get_by_int(3)
+        # Object ID 2 was the least recently used one
+        self.assertEqual(len(self.interner), 3)
+        self.assertIs(self.interner.get_by_int(1), first)
+        self.assertIsNot(self.interner.get_by_int(2), second)
+        # Named object IDs are never evicted
+        self.assertEqual(
+            self.interner.get(self.named_id.as_bytes).name, "ACS_CONTROLLER"
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.interner.get(bytes(3))
+        with self.assertRaises(ValueError):
+            self.interner.get_by_int(-1)
+        with self.assertRaises(ValueError):
+            self.interner.get_by_int(2**32)
@@ -22,6 +22,7 @@ from tmtccmd.core.ccsds_backend import BackendBase
 from tmtccmd.tm import TmTypes, TmHandlerBase, CcsdsTmHandler
 from tmtccmd.core.globals_manager import update_global
 from tmtccmd.logging import get_console_logger
+from tmtccmd.util.obj_id import get_obj_id_interner
 from tmtccmd.config.globals import set_default_globals_pre_args_parsing
 from tmtccmd.core import ModeWrapper
 from tmtccmd.tc import DefaultProcedureInfo, TcProcedureBase, ProcedureWrapper
@@ -62,6 +63,8 @@ def setup(setup_args: SetupWrapper):
         set_default_globals_pre_args_parsing(setup_args.params.apid)
     if not setup_args.params.use_gui:
         __handle_cli_args_and_globals(setup_args)
+    # Object IDs unpacked from telemetry are then resolved to the user provided names
+    get_obj_id_interner().add_names(setup_args.hook_obj.get_object_ids())
     __SETUP_FOR_GUI = setup_args.params.use_gui
     __SETUP_WAS_CALLED = True
 
@@ -3,6 +3,7 @@ import enum
 import os
 import shutil
 import platform
+from collections import OrderedDict
 from io import BytesIO
 from pathlib import Path
 from typing import Optional, BinaryIO
@@ -28,6 +29,19 @@ class VirtualFilestore(abc.ABC):
             "Reading from opened file not implemented in virtual filestore"
         )
 
+    def readinto_opened_file(
+        self, bytes_io: BinaryIO, offset: int, buffer: bytearray
+    ) -> int:
+        """Read from an opened file into a preallocated buffer. The default implementation uses
+        :py:meth:`read_from_opened_file`.
+
+        :return: Number of bytes read. This is only smaller than the buffer at the end of the
+            file
+        """
+        data = self.read_from_opened_file(bytes_io, offset, len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
     @abc.abstractmethod
     def file_exists(self, path: Path) -> bool:
         pass
@@ -48,6 +62,17 @@ class VirtualFilestore(abc.ABC):
             "Writing to data not implemented in virtual filestore"
         )
 
+    def flush_file(self, file: Path):
+        """Write all data of a file which was buffered by :py:meth:`write_data`. Filestores which
+        do not buffer written data do not need to implement this"""
+        pass
+
+    def close_file(self, file: Path):
+        """Flush a file and release all resources which were kept for writing it, for example
+        an open file handle. Filestores which do not keep resources do not need to implement
+        this"""
+        pass
+
     @abc.abstractmethod
     def create_file(self, file: Path) -> FilestoreResponseStatusCode:
         LOGGER.warning("Creating file not implemented in virtual filestore")
@@ -92,13 +117,51 @@ class VirtualFilestore(abc.ABC):
         return FilestoreResponseStatusCode.NOT_PERFORMED
 
 
+class _OpenFile:
+    """Open file handle with a buffer for contiguous writes"""
+
+    def __init__(self, file_obj: BinaryIO):
+        self.file_obj = file_obj
+        self.buffer = bytearray()
+        self.buffer_offset = 0
+
+    def flush(self):
+        if self.buffer:
+            self.file_obj.seek(self.buffer_offset)
+            # The file object is unbuffered, so a single write call may write only a part of
+            # the data
+            with memoryview(self.buffer) as data:
+                written = 0
+                while written < len(data):
+                    written += self.file_obj.write(data[written:])
+            self.buffer.clear()
+
+
 class HostFilestore(VirtualFilestore):
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        keep_files_open: bool = False,
+        max_open_files: int = 16,
+        write_buffer_size: int = 256 * 1024,
+    ):
+        """
+        :param keep_files_open: Keep the files written with :py:meth:`write_data` open until
+            they are closed with :py:meth:`close_file`. Contiguous writes are collected in a
+            buffer and written when the buffer is full, when a write is not contiguous or when
+            the file is flushed or closed. Otherwise, each write opens and closes the file
+        :param max_open_files: Maximum number of open files if they are kept open. The least
+            recently written file is closed when the limit is exceeded
+        :param write_buffer_size: Buffered data of a file is written once it reaches this size
+        """
+        self.keep_files_open = keep_files_open
+        self.max_open_files = max_open_files
+        self.write_buffer_size = write_buffer_size
+        self._open_files: OrderedDict[Path, _OpenFile] = OrderedDict()
 
     def read_data(
         self, file: Path, offset: Optional[int], read_len: Optional[int] = None
     ) -> bytes:
+        self.flush_file(file)
         if not file.exists():
             raise FileNotFoundError(file)
         file_size = file.stat().st_size
@@ -112,12 +175,34 @@ class HostFilestore(VirtualFilestore):
 
     def read_from_opened_file(self, bytes_io: BinaryIO, offset: int, read_len: int):
         bytes_io.seek(offset)
-        return bytes_io.read(read_len)
+        data = bytes_io.read(read_len)
+        # An unbuffered file object may return less data than requested before the end of
+        # the file
+        while len(data) < read_len:
+            chunk = bytes_io.read(read_len - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+
+    def readinto_opened_file(
+        self, bytes_io: BinaryIO, offset: int, buffer: bytearray
+    ) -> int:
+        bytes_io.seek(offset)
+        with memoryview(buffer) as view:
+            read_len = 0
+            while read_len < len(view):
+                chunk_len = bytes_io.readinto(view[read_len:])
+                if not chunk_len:
+                    break
+                read_len += chunk_len
+        return read_len
 
     def file_exists(self, path: Path) -> bool:
         return path.exists()
 
     def truncate_file(self, file: Path):
+        self.close_file(file)
         if not file.exists():
             raise FileNotFoundError(file)
         with open(file, "w"):
@@ -130,6 +215,9 @@ class HostFilestore(VirtualFilestore):
         :return:
         :raises FileNotFoundError: File not found
         """
+        if self.keep_files_open:
+            self._write_buffered(file, data, offset)
+            return
         if not file.exists():
             raise FileNotFoundError(file)
         with open(file, "r+b") as of:
@@ -137,6 +225,51 @@ class HostFilestore(VirtualFilestore):
                 of.seek(offset)
             of.write(data)
 
+    @property
+    def num_open_files(self) -> int:
+        return len(self._open_files)
+
+    def flush_file(self, file: Path):
+        open_file = self._open_files.get(file)
+        if open_file is not None:
+            open_file.flush()
+
+    def close_file(self, file: Path):
+        open_file = self._open_files.pop(file, None)
+        if open_file is not None:
+            try:
+                open_file.flush()
+            finally:
+                open_file.file_obj.close()
+
+    def close_all_files(self):
+        for file in list(self._open_files):
+            self.close_file(file)
+
+    def _write_buffered(self, file: Path, data: bytes, offset: Optional[int]):
+        if offset is None:
+            # Same as writing to a newly opened file
+            offset = 0
+        open_file = self._open_files.get(file)
+        if open_file is None:
+            if not file.exists():
+                raise FileNotFoundError(file)
+            # The data is buffered here, so the file object does not need another buffer
+            open_file = _OpenFile(open(file, "r+b", buffering=0))
+            self._open_files[file] = open_file
+            while len(self._open_files) > self.max_open_files:
+                self.close_file(next(iter(self._open_files)))
+        else:
+            self._open_files.move_to_end(file)
+        buffer = open_file.buffer
+        if buffer and offset != open_file.buffer_offset + len(buffer):
+            open_file.flush()
+        if not buffer:
+            open_file.buffer_offset = offset
+        buffer.extend(data)
+        if len(buffer) >= self.write_buffer_size:
+            open_file.flush()
+
     def create_file(self, file: Path) -> FilestoreResponseStatusCode:
         """Returns CREATE_NOT_ALLOWED if the file already exists"""
         if file.exists():
@@ -151,6 +284,7 @@ class HostFilestore(VirtualFilestore):
             return FilestoreResponseStatusCode.CREATE_NOT_ALLOWED
 
     def delete_file(self, file: Path) -> FilestoreResponseStatusCode:
+        self.close_file(file)
         if not file.exists():
             return FilestoreResponseStatusCode.DELETE_FILE_DOES_NOT_EXIST
         if file.is_dir():
@@ -161,6 +295,7 @@ class HostFilestore(VirtualFilestore):
     def rename_file(
         self, old_file: Path, new_file: Path
     ) -> FilestoreResponseStatusCode:
+        self.close_file(old_file)
         if old_file.is_dir() or new_file.is_dir():
             LOGGER.exception(f"{old_file} or {new_file} is a directory")
             return FilestoreResponseStatusCode.RENAME_NOT_PERFORMED
@@ -174,6 +309,8 @@ class HostFilestore(VirtualFilestore):
     def replace_file(
         self, replaced_file: Path, source_file: Path
     ) -> FilestoreResponseStatusCode:
+        self.close_file(replaced_file)
+        self.close_file(source_file)
         if replaced_file.is_dir() or source_file.is_dir():
             LOGGER.warning(f"{replaced_file} is a directory")
             return FilestoreResponseStatusCode.REPLACE_NOT_ALLOWED
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from crcmod.predefined import PredefinedCrc
 
@@ -36,22 +36,33 @@ class Crc32Helper:
     def calc_for_file(self, file: Path, file_sz: int, segment_len: int) -> bytes:
         if self.checksum_type == ChecksumType.NULL_CHECKSUM:
             return NULL_CHECKSUM_U32
-        crc_obj = self.generate_crc_calculator()
         if segment_len == 0:
             raise ValueError("Segment length can not be 0")
         if not file.exists():
             raise SourceFileDoesNotExist(file)
+        with open(file, "rb") as of:
+            return self.calc_for_opened_file(of, file_sz, segment_len)
+
+    def calc_for_opened_file(
+        self, bytes_io: BinaryIO, file_sz: int, segment_len: int
+    ) -> bytes:
+        """Calculate the checksum for a file which is already opened, reading it with the
+        :py:meth:`VirtualFilestore.read_from_opened_file` method of the virtual filestore"""
+        if self.checksum_type == ChecksumType.NULL_CHECKSUM:
+            return NULL_CHECKSUM_U32
+        crc_obj = self.generate_crc_calculator()
+        if segment_len == 0:
+            raise ValueError("Segment length can not be 0")
         current_offset = 0
         # Calculate the file CRC
-        with open(file, "rb") as of:
-            while current_offset < file_sz:
-                if current_offset + segment_len > file_sz:
-                    read_len = file_sz - current_offset
-                else:
-                    read_len = segment_len
-                if read_len > 0:
-                    crc_obj.update(
-                        self.vfs.read_from_opened_file(of, current_offset, read_len)
-                    )
-                current_offset += read_len
-            return crc_obj.digest()
+        while current_offset < file_sz:
+            if current_offset + segment_len > file_sz:
+                read_len = file_sz - current_offset
+            else:
+                read_len = segment_len
+            if read_len > 0:
+                crc_obj.update(
+                    self.vfs.read_from_opened_file(bytes_io, current_offset, read_len)
+                )
+            current_offset += read_len
+        return crc_obj.digest()
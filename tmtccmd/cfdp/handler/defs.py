@@ -23,6 +23,16 @@ class SourceFileDoesNotExist(Exception):
         return f"Source file {self.file} does not exist"
 
 
+class SourceFileTruncated(Exception):
+    def __init__(self, file: Path, file_size: int, *args, **kwargs):
+        super().__init__(args, kwargs)
+        self.file = file
+        self.file_size = file_size
+
+    def __str__(self):
+        return f"Source file {self.file} was truncated to {self.file_size} bytes"
+
+
 class ChecksumNotImplemented(Exception):
     def __init__(self, checksum_type: ChecksumType, *args, **kwargs):
         super().__init__(args, kwargs)
@@ -321,6 +321,8 @@ class DestHandler:
         return FsmResult(self.states, self.pdu_holder)
 
     def finish(self):
+        if not self._params.fp.no_file_data:
+            self.user.vfs.close_file(self._params.fp.file_name)
         self._params.reset()
         # Not fully sure this is the best approach, but I think this is ok for now
         self._params.clear_file_directive_dict()
@@ -381,6 +383,10 @@ class DestHandler:
 
     def _handle_eof_pdu(self, eof_pdu: EofPdu):
         # TODO: Error handling
+        if not self._params.fp.no_file_data:
+            # The filestore may buffer written file data. The file is complete for the checksum
+            # verification after this
+            self.user.vfs.flush_file(self._params.fp.file_name)
         if eof_pdu.condition_code == ConditionCode.NO_ERROR:
             self._params.fp.crc32 = eof_pdu.file_checksum
             file_size_from_eof = eof_pdu.file_size
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+from tmtccmd.cfdp.filestore import VirtualFilestore
+from tmtccmd.cfdp.handler.defs import SourceFileTruncated
+
+# File access advice is not available on all platforms
+_POSIX_FADVISE = getattr(os, "posix_fadvise", None)
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+_FADV_WILLNEED = getattr(os, "POSIX_FADV_WILLNEED", None)
+
+
+class SourceFileReader:
+    """Keeps the source file of a transaction open, so reading a file segment does not require
+    opening the file again. The segments are read with the
+    :py:meth:`VirtualFilestore.readinto_opened_file` method of the virtual filestore into a
+    buffer which is reused for all segments.
+
+    The operating system can optionally be advised to read ahead the segments following the
+    last read segment. The read ahead is performed asynchronously by the kernel, so no
+    additional thread is required.
+    """
+
+    def __init__(self, file: Path, vfs: VirtualFilestore, prefetch_len: int = 0):
+        """
+        :param file: Source file
+        :param vfs: Virtual filestore used to read from the opened file
+        :param prefetch_len: Number of bytes following each read segment which should be read
+            ahead. 0 to disable read ahead
+        :raises FileNotFoundError: File does not exist
+        """
+        self.file = file
+        self.vfs = vfs
+        self.prefetch_len = prefetch_len
+        # Unbuffered, because each segment is read exactly once
+        self._file_obj = open(file, "rb", buffering=0)
+        self._prefetched_end = 0
+        self._buffer = bytearray()
+        self.file_size = os.fstat(self._file_obj.fileno()).st_size
+        if prefetch_len > 0:
+            self._advise(_FADV_SEQUENTIAL, 0, 0)
+
+    @property
+    def file_obj(self):
+        """Opened file, for example to calculate the file checksum"""
+        return self._file_obj
+
+    def read(self, offset: int, read_len: int) -> memoryview:
+        """Read a file segment. The segment is truncated at the file size the file had when it
+        was opened.
+
+        :return: View of the segment in the reused buffer. It is only valid until the next read
+        :raises SourceFileTruncated: The file was truncated since it was opened
+        """
+        end = min(offset + read_len, self.file_size)
+        if end <= offset:
+            return memoryview(bytes())
+        # The read ahead window is extended once half of it was read, which avoids a system
+        # call for each segment
+        if (
+            self.prefetch_len > 0
+            and end + self.prefetch_len // 2 > self._prefetched_end
+            and max(end, self._prefetched_end) < self.file_size
+        ):
+            prefetch_start = max(end, self._prefetched_end)
+            prefetch_end = min(end + self.prefetch_len, self.file_size)
+            self._advise(_FADV_WILLNEED, prefetch_start, prefetch_end - prefetch_start)
+            self._prefetched_end = prefetch_end
+        read_len = end - offset
+        if len(self._buffer) < read_len:
+            # Views of the previous buffer may still exist, so it can not be resized
+            self._buffer = bytearray(read_len)
+        segment = memoryview(self._buffer)[:read_len]
+        segment_len = self.vfs.readinto_opened_file(self._file_obj, offset, segment)
+        if segment_len < read_len:
+            raise SourceFileTruncated(self.file, offset + segment_len)
+        return segment
+
+    def close(self):
+        self._file_obj.close()
+
+    def _advise(self, advice: Optional[int], offset: int, length: int):
+        if _POSIX_FADVISE is None or advice is None:
+            return
+        try:
+            _POSIX_FADVISE(self._file_obj.fileno(), offset, length, advice)
+        except OSError:
+            pass
@@ -34,6 +34,7 @@ from tmtccmd.cfdp import (
 from tmtccmd.cfdp.defs import CfdpRequestType, CfdpStates
 from tmtccmd.cfdp.filestore import VirtualFilestore
 from tmtccmd.cfdp.handler.crc import Crc32Helper
+from tmtccmd.cfdp.handler.file_reader import SourceFileReader
 from tmtccmd.cfdp.handler.defs import (
     FileParamsBase,
     PacketSendNotConfirmed,
@@ -49,6 +50,8 @@ from tmtccmd.util import ProvidesSeqCount
 from tmtccmd.util.countdown import Countdown
 
 LOGGER = get_console_logger()
+# The checksum is calculated in larger chunks than the file segments
+CRC_READ_LEN = 64 * 1024
 
 
 class TransactionStep(enum.Enum):
@@ -77,6 +80,7 @@ class TransferFieldWrapper:
         self.transaction: Optional[TransactionId] = None
         self.check_limit: Optional[Countdown] = None
         self.fp = FileParamsBase.empty()
+        self.file_reader: Optional[SourceFileReader] = None
         self.remote_cfg: Optional[RemoteEntityCfg] = None
         self.closure_requested: bool = False
         self.pdu_conf = PduConfig.empty()
@@ -116,6 +120,9 @@ class TransferFieldWrapper:
 
     def reset(self):
         self.fp.reset()
+        if self.file_reader is not None:
+            self.file_reader.close()
+            self.file_reader = None
         self.remote_cfg = None
         self.transaction = None
         self.check_limit = None
@@ -167,8 +174,18 @@ class SourceHandler:
         cfg: LocalEntityCfg,
         seq_num_provider: ProvidesSeqCount,
         user: CfdpUserBase,
+        prefetch_segments: int = 4,
     ):
+        """
+        :param cfg: Local entity configuration
+        :param seq_num_provider: Provides the transaction sequence numbers
+        :param user: CFDP user
+        :param prefetch_segments: The source file is kept open during a transaction. The
+            operating system is advised to read ahead this number of file segments following
+            the last sent segment. 0 disables the read ahead
+        """
         self.states = SourceStateWrapper()
+        self.prefetch_segments = prefetch_segments
         self.pdu_holder = PduHolder(None)
         self.cfg = cfg
         self.user = user
@@ -289,10 +306,12 @@ class SourceHandler:
                     # Empty file, use null checksum
                     self._params.fp.crc32 = NULL_CHECKSUM_U32
                 else:
-                    self._params.fp.crc32 = self._params.crc_helper.calc_for_file(
-                        file=put_req.cfg.source_file,
-                        file_sz=self._params.fp.file_size,
-                        segment_len=self._params.fp.segment_len,
+                    self._params.fp.crc32 = (
+                        self._params.crc_helper.calc_for_opened_file(
+                            bytes_io=self._params.file_reader.file_obj,
+                            file_sz=self._params.fp.file_size,
+                            segment_len=max(self._params.fp.segment_len, CRC_READ_LEN),
+                        )
                     )
                 self.states.step = TransactionStep.SENDING_METADATA
             if self.states.step == TransactionStep.SENDING_METADATA:
@@ -461,12 +480,22 @@ class SourceHandler:
         if not put_req.cfg.source_file.exists():
             # TODO: Handle this exception in the handler, reset CFDP state machine
             raise SourceFileDoesNotExist(put_req.cfg.source_file)
-        size = put_req.cfg.source_file.stat().st_size
+        self._params.fp.segment_len = self._params.remote_cfg.max_file_segment_len
+        # The reader of a transaction which was aborted without a reset is still open
+        if self._params.file_reader is not None:
+            self._params.file_reader.close()
+            self._params.file_reader = None
+        # The file is kept open until the transaction is reset
+        self._params.file_reader = SourceFileReader(
+            put_req.cfg.source_file,
+            self.user.vfs,
+            prefetch_len=self.prefetch_segments * self._params.fp.segment_len,
+        )
+        size = self._params.file_reader.file_size
         if size == 0:
             self._params.fp.no_file_data = True
         else:
             self._params.fp.file_size = size
-        self._params.fp.segment_len = self._params.remote_cfg.max_file_segment_len
         self._params.remote_cfg = self._params.remote_cfg
         self._get_next_transfer_seq_num()
         self._params.transaction = TransactionId(
@@ -501,45 +530,43 @@ class SourceHandler:
         :param request:
         :return: True if a packet was prepared, False if PDU handling is done and the next steps
             in the Copy File procedure can be performed
+        :raises SourceFileTruncated: The source file was truncated during the transaction
         """
         # No need to send a file data PDU for an empty file
         if self._params.fp.no_file_data:
             return False
-        with open(request.cfg.source_file, "rb") as of:
-            if self._params.fp.progress == self._params.fp.file_size:
-                return False
-            if self.states.packet_ready:
-                raise PacketSendNotConfirmed(
-                    f"Must send current packet {self.pdu_holder.base} first"
-                )
-            if self._params.fp.file_size < self._params.fp.segment_len:
-                read_len = self._params.fp.file_size
-            else:
-                if (
-                    self._params.fp.progress + self._params.fp.segment_len
-                    > self._params.fp.file_size
-                ):
-                    read_len = self._params.fp.file_size - self._params.fp.progress
-                else:
-                    read_len = self._params.fp.segment_len
-            file_data = self.user.vfs.read_from_opened_file(
-                of, self._params.fp.progress, read_len
-            )
-            # TODO: Support for record continuation state not implemented yet. Segment metadata
-            #       flag is therefore always set to False. Segment metadata support also omitted
-            #       for now. Implementing those generically could be done in form of a callback,
-            #       e.g. abstractmethod of this handler as a first way, another one being
-            #       to expect the user to supply some helper class to split up a file
-            fd_params = FileDataParams(
-                file_data=file_data,
-                offset=self._params.fp.progress,
-                segment_metadata_flag=False,
-            )
-            file_data_pdu = FileDataPdu(
-                pdu_conf=self._params.pdu_conf, params=fd_params
+        if self._params.fp.progress == self._params.fp.file_size:
+            return False
+        if self.states.packet_ready:
+            raise PacketSendNotConfirmed(
+                f"Must send current packet {self.pdu_holder.base} first"
             )
-            self._params.fp.progress += read_len
-            self.pdu_holder.base = file_data_pdu
+        if self._params.fp.file_size < self._params.fp.segment_len:
+            read_len = self._params.fp.file_size
+        else:
+            if (
+                self._params.fp.progress + self._params.fp.segment_len
+                > self._params.fp.file_size
+            ):
+                read_len = self._params.fp.file_size - self._params.fp.progress
+            else:
+                read_len = self._params.fp.segment_len
+        # The segment is a view into the buffer of the reader, which is only reused for the
+        # next segment once this packet was sent
+        file_data = self._params.file_reader.read(self._params.fp.progress, read_len)
+        # TODO: Support for record continuation state not implemented yet. Segment metadata
+        #       flag is therefore always set to False. Segment metadata support also omitted
+        #       for now. Implementing those generically could be done in form of a callback,
+        #       e.g. abstractmethod of this handler as a first way, another one being
+        #       to expect the user to supply some helper class to split up a file
+        fd_params = FileDataParams(
+            file_data=file_data,
+            offset=self._params.fp.progress,
+            segment_metadata_flag=False,
+        )
+        file_data_pdu = FileDataPdu(pdu_conf=self._params.pdu_conf, params=fd_params)
+        self._params.fp.progress += read_len
+        self.pdu_holder.base = file_data_pdu
         return True
 
     def _prepare_eof_pdu(self):
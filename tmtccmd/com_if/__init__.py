@@ -4,9 +4,12 @@ Abstract methods must be implemented by child class (e.g. Ethernet Com IF)
 :author:     R. Mueller
 """
 from abc import abstractmethod, ABC
+from typing import List, Tuple
 
 from tmtccmd.tm import TelemetryListT
 
+SourceTaggedTmListT = List[Tuple[str, bytes]]
+
 
 class ComInterface(ABC):
     """Generic form of a communication interface to separate communication logic from
@@ -70,3 +73,20 @@ class ComInterface(ABC):
         :param parameters: Can be an arbitrary parameter like a timeout
         :return: 0 if no data is available, number of bytes or anything > 0 otherwise.
         """
+
+
+class MultiSourceComInterface(ComInterface):
+    """Communication interface which receives packets from multiple sources, for example
+    multiple sockets. Each received packet is tagged with the name of its source, which allows
+    the :py:class:`tmtccmd.tm.ccsds_tm_listener.CcsdsTmListener` to route packets by source
+    and APID.
+    """
+
+    @abstractmethod
+    def receive_with_source(self, parameters: any = 0) -> SourceTaggedTmListT:
+        """Returns a list of received packets, each tagged with the name of the source it was
+        received from.
+        """
+
+    def receive(self, parameters: any = 0) -> TelemetryListT:
+        return [packet for _, packet in self.receive_with_source(parameters)]
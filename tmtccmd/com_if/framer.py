@@ -0,0 +1,459 @@
+"""Incremental framing of CCSDS space packets and DLE frames received via stream based
+interfaces"""
+import enum
+import re
+import socket
+import struct
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from dle_encoder import (
+    STX_CHAR,
+    ETX_CHAR,
+    DLE_CHAR,
+    ESCAPE_JUMP,
+    ESCAPED_STX,
+    ESCAPED_ETX,
+    ESCAPED_CR,
+)
+from spacepackets.ccsds.spacepacket import PACKET_ID_MASK
+
+from tmtccmd.logging import get_console_logger
+
+LOGGER = get_console_logger()
+
+SPACE_PACKET_HEADER_LEN = 6
+# Maximum total length of a space packet: Header and a 16 bit length field + 1
+MAX_SPACE_PACKET_LEN = SPACE_PACKET_HEADER_LEN + 0xFFFF + 1
+_HEADER_STRUCT = struct.Struct("!HHH")
+# First header byte containing the version bits and the packet data length field
+_VERSION_LEN_STRUCT = struct.Struct("!BxxxH")
+
+
+class SpacePacketFramer:
+    """Incremental space packet framer for byte streams like a TCP stream.
+
+    Received data is appended into a preallocated buffer, either by passing a socket to
+    :py:meth:`recv_into` or by passing already received data to :py:meth:`feed`.
+    :py:meth:`parse` then scans the backlog for the provided packet IDs and returns all complete
+    packets. Only the bytes of a found packet are copied once. Broken packet tails stay inside the
+    buffer until the rest of the packet arrives, and bytes which are not part of a packet
+    with a known packet ID are skipped.
+    """
+
+    def __init__(
+        self,
+        packet_ids: Sequence[int],
+        initial_capacity: int = 2 * MAX_SPACE_PACKET_LEN,
+    ):
+        """
+        :param packet_ids: 16 bit packet IDs used to detect the start of a space packet. The
+            version bits are ignored
+        :param initial_capacity: Initial size of the receive buffer. The buffer is grown
+            automatically if necessary
+        """
+        self.packet_ids = frozenset(
+            packet_id & PACKET_ID_MASK for packet_id in packet_ids
+        )
+        self._buf = bytearray(initial_capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._end = 0
+        self.skipped_bytes = 0
+
+    def __len__(self) -> int:
+        """Number of bytes in the backlog which were not returned as a packet yet"""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def writable_view(self, size: int) -> memoryview:
+        """Retrieve a view into the free section of the receive buffer which has at least the
+        given size. The caller has to call :py:meth:`commit` with the number of written bytes
+        afterwards.
+        """
+        if self._end + size > len(self._buf):
+            self._make_room(size)
+        return self._view[self._end : self._end + size]
+
+    def commit(self, written: int):
+        """Mark bytes written into the view returned by :py:meth:`writable_view` as received"""
+        if self._end + written > len(self._buf):
+            raise ValueError("Committed more bytes than available in the buffer")
+        self._end += written
+
+    def recv_into(self, sock: socket.socket, max_recv_size: int) -> int:
+        """Receive data from the socket directly into the receive buffer.
+
+        :return: Number of bytes received. 0 means that the remote side closed the connection
+        """
+        recvd = sock.recv_into(self.writable_view(max_recv_size), max_recv_size)
+        self._end += recvd
+        return recvd
+
+    def feed(self, data: bytes):
+        """Append already received data to the backlog"""
+        data_len = len(data)
+        self.writable_view(data_len)[:] = data
+        self._end += data_len
+
+    def parse(self) -> List[bytes]:
+        """Parse all complete space packets contained in the backlog.
+
+        :return: List of complete space packets
+        """
+        packets = []
+        buf = self._buf
+        current_idx = self._start
+        end = self._end
+        while end - current_idx >= SPACE_PACKET_HEADER_LEN:
+            packet_id, _, len_field = _HEADER_STRUCT.unpack_from(buf, current_idx)
+            if packet_id & PACKET_ID_MASK not in self.packet_ids:
+                # Keep parsing until a packet ID is found
+                current_idx += 1
+                self.skipped_bytes += 1
+                continue
+            packet_end = current_idx + SPACE_PACKET_HEADER_LEN + len_field + 1
+            if packet_end > end:
+                # Broken tail, wait for the rest of the packet
+                break
+            packets.append(bytes(self._view[current_idx:packet_end]))
+            current_idx = packet_end
+        self._start = current_idx
+        if self._start == self._end:
+            # Cheap reset, no data needs to be moved
+            self._start = 0
+            self._end = 0
+        return packets
+
+    def _make_room(self, size: int):
+        backlog = self._end - self._start
+        if backlog + size <= len(self._buf):
+            # Moving the (usually small) broken tail to the front is sufficient. The source
+            # and destination might overlap, so a temporary copy is used
+            self._buf[:backlog] = bytes(self._view[self._start : self._end])
+        else:
+            new_capacity = len(self._buf)
+            while backlog + size > new_capacity:
+                new_capacity *= 2
+            LOGGER.debug(f"Growing space packet framer buffer to {new_capacity} bytes")
+            new_buf = bytearray(new_capacity)
+            new_buf[:backlog] = self._view[self._start : self._end]
+            self._buf = new_buf
+            self._view = memoryview(new_buf)
+        self._start = 0
+        self._end = backlog
+
+
+@dataclass
+class DeframerStats:
+    """Statistics of a :py:class:`FixedFrameDeframer`"""
+
+    frames: int = 0
+    # Frames which only contained fill bytes
+    idle_frames: int = 0
+    packets: int = 0
+    # Packets which were reassembled from multiple frames
+    reassembled_packets: int = 0
+    # Frames which contained an invalid packet header. The rest of those frames is discarded
+    malformed_frames: int = 0
+    # Bytes discarded because of malformed frames or broken reassemblies
+    dropped_bytes: int = 0
+
+
+class FixedFrameDeframer:
+    """Extracts space packets from a stream of fixed size frames, for example received via a
+    serial interface.
+
+    Each frame contains space packets back to back. A zero packet data length field marks the
+    start of fill bytes which pad the frame to the fixed size. Packets which do not fit into the
+    remaining space of a frame continue at the start of the following frame and are reassembled.
+
+    :py:meth:`deframe` accepts arbitrary amounts of received data. All complete frames are
+    processed at once while a trailing incomplete frame is kept until the rest of it arrives.
+    If NumPy is installed, the fill marker of the first header of all frames is extracted
+    in one vectorized operation so that idle frames are skipped without touching them.
+    """
+
+    # Minimum number of frames processed at once before NumPy is used
+    NUMPY_THRESHOLD = 16
+
+    def __init__(
+        self,
+        frame_size: int,
+        max_packet_len: int = MAX_SPACE_PACKET_LEN,
+        use_numpy: bool = True,
+    ):
+        """
+        :param frame_size: Fixed size of a single frame
+        :param max_packet_len: Packets with a larger size are considered malformed
+        :param use_numpy: Use NumPy to detect idle frames if it is installed
+        """
+        if frame_size < SPACE_PACKET_HEADER_LEN:
+            raise ValueError(
+                f"Frame size needs to be at least {SPACE_PACKET_HEADER_LEN} bytes"
+            )
+        self.frame_size = frame_size
+        self.max_packet_len = max_packet_len
+        self.use_numpy = use_numpy and np is not None
+        self.stats = DeframerStats()
+        self._frame_buf = bytearray()
+        # Reassembly buffer for packets spanning multiple frames
+        self._partial = bytearray()
+        # Total length of the packet which is reassembled. None if the header is incomplete
+        self._partial_len: Optional[int] = None
+
+    def reset(self):
+        """Discard all buffered data. The statistics are kept"""
+        self._frame_buf.clear()
+        self._partial.clear()
+        self._partial_len = None
+
+    def deframe(self, data: bytes) -> List[bytes]:
+        """Process received data.
+
+        :param data: Raw received data. It does not need to be aligned to frames
+        :return: List of all complete space packets
+        """
+        if self._frame_buf:
+            self._frame_buf.extend(data)
+            buf = bytes(self._frame_buf)
+            self._frame_buf.clear()
+        else:
+            # No copy if the data already is a bytes object
+            buf = bytes(data)
+        frame_size = self.frame_size
+        num_frames = len(buf) // frame_size
+        frames_end = num_frames * frame_size
+        if frames_end < len(buf):
+            self._frame_buf.extend(buf[frames_end:])
+        packets = []
+        if num_frames == 0:
+            return packets
+        idle_frames = self._idle_frames(buf, num_frames)
+        frame_start = 0
+        for idle in idle_frames:
+            if idle and not self._partial:
+                self.stats.idle_frames += 1
+            else:
+                self._deframe_single(
+                    buf, frame_start, frame_start + frame_size, packets
+                )
+            frame_start += frame_size
+        self.stats.frames += num_frames
+        self.stats.packets += len(packets)
+        return packets
+
+    def _idle_frames(self, buf: bytes, num_frames: int) -> Sequence[bool]:
+        """Determine the frames which start with fill bytes, using the length field of the
+        first header of each frame"""
+        frame_size = self.frame_size
+        if self.use_numpy and num_frames >= self.NUMPY_THRESHOLD:
+            frames = np.frombuffer(
+                buf, dtype=np.uint8, count=num_frames * frame_size
+            ).reshape(num_frames, frame_size)
+            return ((frames[:, 4] | frames[:, 5]) == 0).tolist()
+        return [
+            buf[idx + 4] == 0 and buf[idx + 5] == 0
+            for idx in range(0, num_frames * frame_size, frame_size)
+        ]
+
+    def _deframe_single(self, buf: bytes, pos: int, end: int, packets: List[bytes]):
+        if self._partial:
+            pos = self._continue_partial(buf, pos, end, packets)
+        unpack_from = _VERSION_LEN_STRUCT.unpack_from
+        max_packet_len = self.max_packet_len
+        while end - pos >= SPACE_PACKET_HEADER_LEN:
+            first_byte, len_field = unpack_from(buf, pos)
+            if len_field == 0:
+                # Fill bytes until the end of the frame
+                return
+            packet_len = len_field + SPACE_PACKET_HEADER_LEN + 1
+            if first_byte >> 5 != 0 or packet_len > max_packet_len:
+                self._malformed(end - pos)
+                return
+            packet_end = pos + packet_len
+            if packet_end > end:
+                self._partial.extend(buf[pos:end])
+                self._partial_len = packet_len
+                return
+            packets.append(buf[pos:packet_end])
+            pos = packet_end
+        if pos < end and any(buf[pos:end]):
+            # Header split across two frames
+            self._partial.extend(buf[pos:end])
+            self._partial_len = None
+
+    def _continue_partial(
+        self, buf: bytes, pos: int, end: int, packets: List[bytes]
+    ) -> int:
+        partial = self._partial
+        if self._partial_len is None:
+            missing_header = SPACE_PACKET_HEADER_LEN - len(partial)
+            partial.extend(buf[pos : pos + missing_header])
+            pos += missing_header
+            len_field = partial[4] << 8 | partial[5]
+            packet_len = len_field + SPACE_PACKET_HEADER_LEN + 1
+            if (
+                len_field == 0
+                or partial[0] >> 5 != 0
+                or packet_len > self.max_packet_len
+            ):
+                self._partial_len = None
+                self.stats.dropped_bytes += len(partial)
+                partial.clear()
+                self._malformed(end - pos)
+                return end
+            self._partial_len = packet_len
+        missing = min(self._partial_len - len(partial), end - pos)
+        partial.extend(buf[pos : pos + missing])
+        pos += missing
+        if len(partial) == self._partial_len:
+            packets.append(bytes(partial))
+            self.stats.reassembled_packets += 1
+            partial.clear()
+            self._partial_len = None
+        return pos
+
+    def _malformed(self, discarded: int):
+        if self.stats.malformed_frames == 0:
+            LOGGER.warning("Malformed frame detected, discarding the rest of the frame")
+        self.stats.malformed_frames += 1
+        self.stats.dropped_bytes += discarded
+
+
+# Any character which changes the state of the DLE decoder while inside a frame
+_DLE_CONTROL_CHARS = re.compile(
+    b"[" + re.escape(bytes([STX_CHAR, ETX_CHAR, DLE_CHAR])) + b"]"
+)
+
+
+class _DleState(enum.Enum):
+    WAIT_FOR_STX = 0
+    IN_FRAME = 1
+    ESCAPE = 2
+
+
+@dataclass
+class DleDecoderStats:
+    """Statistics of a :py:class:`DleStreamDecoder`"""
+
+    decoded_frames: int = 0
+    # Frames with an invalid escape sequence, an unexpected STX character or which exceeded
+    # the maximum frame length
+    invalid_frames: int = 0
+    # Bytes received outside of a frame
+    skipped_bytes: int = 0
+
+
+class DleStreamDecoder:
+    """Incremental decoder for the escaped DLE encoding used by the
+    :py:class:`dle_encoder.DleEncoder`.
+
+    :py:meth:`feed` accepts arbitrarily sized chunks of received data and returns all frames
+    which were completed by the chunk. The decoder state is kept between calls, so frames may
+    be split across any number of reads. Runs of regular bytes are located and copied in bulk
+    instead of processing the stream byte by byte.
+    """
+
+    def __init__(self, max_frame_len: int, escape_cr: bool = False):
+        """
+        :param max_frame_len: Maximum length of a decoded frame. Longer frames are discarded
+        :param escape_cr: Also decode escaped carriage return characters
+        """
+        self.max_frame_len = max_frame_len
+        self.escape_cr = escape_cr
+        self.stats = DleDecoderStats()
+        self._state = _DleState.WAIT_FOR_STX
+        self._frame = bytearray()
+
+    def reset(self):
+        """Discard a partially decoded frame. The statistics are kept"""
+        self._state = _DleState.WAIT_FOR_STX
+        self._frame.clear()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Decode received data.
+
+        :return: List of all frames completed with the data
+        """
+        frames = []
+        frame = self._frame
+        pos = 0
+        data_len = len(data)
+        while pos < data_len:
+            if self._state == _DleState.WAIT_FOR_STX:
+                stx_idx = data.find(STX_CHAR, pos)
+                if stx_idx < 0:
+                    self.stats.skipped_bytes += data_len - pos
+                    break
+                self.stats.skipped_bytes += stx_idx - pos
+                pos = stx_idx + 1
+                self._state = _DleState.IN_FRAME
+            elif self._state == _DleState.IN_FRAME:
+                match = _DLE_CONTROL_CHARS.search(data, pos)
+                run_end = match.start() if match is not None else data_len
+                frame.extend(data[pos:run_end])
+                if len(frame) > self.max_frame_len:
+                    self._invalid_frame()
+                    pos = run_end
+                    continue
+                if match is None:
+                    break
+                pos = run_end + 1
+                char = data[run_end]
+                if char == ETX_CHAR:
+                    frames.append(bytes(frame))
+                    frame.clear()
+                    self.stats.decoded_frames += 1
+                    self._state = _DleState.WAIT_FOR_STX
+                elif char == DLE_CHAR:
+                    if pos < data_len:
+                        # Common case: The escaped character was received as well
+                        self._handle_escaped_char(data[pos])
+                        pos += 1
+                    else:
+                        self._state = _DleState.ESCAPE
+                else:
+                    # STX inside a frame. The end of the previous frame was lost
+                    self._invalid_frame()
+                    self._state = _DleState.IN_FRAME
+            else:
+                self._handle_escaped_char(data[pos])
+                pos += 1
+        return frames
+
+    def _handle_escaped_char(self, char: int):
+        if (
+            char == ESCAPED_STX
+            or char == ESCAPED_ETX
+            or (self.escape_cr and char == ESCAPED_CR)
+        ):
+            self._frame.append(char - ESCAPE_JUMP)
+            self._state = _DleState.IN_FRAME
+        elif char == DLE_CHAR:
+            self._frame.append(DLE_CHAR)
+            self._state = _DleState.IN_FRAME
+        else:
+            self._invalid_frame()
+            if char == STX_CHAR:
+                # Start of the next frame
+                self._state = _DleState.IN_FRAME
+
+    def _invalid_frame(self):
+        if self.stats.invalid_frames == 0:
+            LOGGER.warning("Invalid DLE frame detected, discarding it")
+        self.stats.invalid_frames += 1
+        self._frame.clear()
+        self._state = _DleState.WAIT_FOR_STX
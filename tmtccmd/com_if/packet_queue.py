@@ -0,0 +1,325 @@
+"""Bounded and thread-safe packet queue with configurable backpressure handling. It can be used
+by communication interfaces which receive packets on a separate thread"""
+from __future__ import annotations
+
+import enum
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Sequence, BinaryIO, Tuple
+
+from tmtccmd.logging import get_console_logger
+
+LOGGER = get_console_logger()
+
+_SPILL_LEN_STRUCT = struct.Struct("!I")
+
+
+class BackpressurePolicy(enum.Enum):
+    """Determines what happens if packets are added to a full :py:class:`BoundedPacketQueue`.
+
+    1. DROP_OLDEST: The oldest whole packets are dropped to make room for the new packets
+    2. BLOCK_READER: The producer, usually a reception thread, blocks until the consumer has
+       made room. For stream based interfaces like TCP, this passes the backpressure to the
+       sender via the flow control of the transport layer
+    3. SPILL_TO_DISK: Packets which do not fit into memory are stored in a temporary file and
+       returned in order once the consumer has caught up
+    """
+
+    DROP_OLDEST = 0
+    BLOCK_READER = 1
+    SPILL_TO_DISK = 2
+
+
+@dataclass
+class PacketQueueStats:
+    """Statistics of a :py:class:`BoundedPacketQueue`. The stored packets include spilled packets
+    while the stored bytes only include the bytes stored in memory."""
+
+    stored_packets: int = 0
+    stored_bytes: int = 0
+    dropped_packets: int = 0
+    dropped_bytes: int = 0
+    spilled_packets: int = 0
+    spilled_bytes: int = 0
+    # Highest number of stored packets since the last statistics reset
+    peak_packets: int = 0
+    # Total time in seconds the producer was blocked with the BLOCK_READER policy
+    blocked_time: float = 0.0
+
+
+class BoundedPacketQueue:
+    """FIFO queue for whole packets which is bounded by the number of packets and the number of
+    bytes stored. All functions are thread-safe.
+
+    On POSIX systems, :py:meth:`fileno` provides a file descriptor which is readable while
+    packets are stored, so a consumer can wait for packets with an event loop or a selector.
+    """
+
+    def __init__(
+        self,
+        max_packets: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ):
+        """
+        :param max_packets: Maximum number of packets stored in memory. None for no limit
+        :param max_bytes: Maximum number of bytes stored in memory. None for no limit
+        :param policy: Policy applied if a packet does not fit into the queue anymore
+        """
+        self.max_packets = max_packets
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._queue: Deque[bytes] = deque()
+        self._stored_bytes = 0
+        self._stats = PacketQueueStats()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        self._spill_file: Optional[BinaryIO] = None
+        self._spill_read_pos = 0
+        self._spilled_packets = 0
+        # Read and write end of the pipe which signals stored packets, created on demand
+        self._wakeup_fds: Optional[Tuple[int, int]] = None
+        self._wakeup_signaled = False
+
+    def __del__(self):
+        if getattr(self, "_wakeup_fds", None) is not None:
+            os.close(self._wakeup_fds[0])
+            os.close(self._wakeup_fds[1])
+            self._wakeup_fds = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queue) + self._spilled_packets
+
+    def __bool__(self) -> bool:
+        return self.__len__() > 0
+
+    def stats(self) -> PacketQueueStats:
+        """Retrieve a snapshot of the queue statistics"""
+        with self._lock:
+            return PacketQueueStats(
+                stored_packets=len(self._queue) + self._spilled_packets,
+                stored_bytes=self._stored_bytes,
+                dropped_packets=self._stats.dropped_packets,
+                dropped_bytes=self._stats.dropped_bytes,
+                spilled_packets=self._stats.spilled_packets,
+                spilled_bytes=self._stats.spilled_bytes,
+                peak_packets=self._stats.peak_packets,
+                blocked_time=self._stats.blocked_time,
+            )
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = PacketQueueStats()
+
+    def open(self):
+        with self._lock:
+            self._closed = False
+
+    def fileno(self) -> int:
+        """File descriptor which is readable while packets are stored. The descriptor is only
+        created on the first call and must not be read by the caller.
+
+        :return: -1 if the platform does not support waiting for a pipe with a selector
+        """
+        if sys.platform == "win32":
+            return -1
+        with self._lock:
+            if self._wakeup_fds is None:
+                self._wakeup_fds = os.pipe()
+                for fd in self._wakeup_fds:
+                    os.set_blocking(fd, False)
+                self._update_wakeup()
+            return self._wakeup_fds[0]
+
+    def close(self):
+        """Wake up all blocked producers and consumers. Packets which are added while the queue
+        is closed and do not fit into the queue are dropped."""
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    def put(self, packets: Sequence[bytes]):
+        """Add packets to the queue, applying the configured backpressure policy."""
+        if not packets:
+            return
+        max_packets = self.max_packets if self.max_packets is not None else sys.maxsize
+        max_bytes = self.max_bytes if self.max_bytes is not None else sys.maxsize
+        with self._lock:
+            queue = self._queue
+            for packet in packets:
+                packet_len = len(packet)
+                # Fast path for the common case where the packet fits into the queue
+                if (
+                    not self._spilled_packets
+                    and len(queue) < max_packets
+                    and self._stored_bytes + packet_len <= max_bytes
+                ):
+                    queue.append(packet)
+                    self._stored_bytes += packet_len
+                else:
+                    self._put_single(packet)
+            stored_packets = len(queue) + self._spilled_packets
+            if stored_packets > self._stats.peak_packets:
+                self._stats.peak_packets = stored_packets
+            self._update_wakeup()
+            self._not_empty.notify_all()
+
+    def get_all(
+        self, timeout: float = 0, max_packets: Optional[int] = None
+    ) -> List[bytes]:
+        """Retrieve all stored packets in FIFO order.
+
+        :param timeout: If no packets are available, block up to this time in seconds until
+            packets are added
+        :param max_packets: Retrieve at most this number of packets. This allows multiple
+            consumers to share the packets of one queue
+        """
+        with self._lock:
+            if not self._queue and not self._spilled_packets and timeout > 0:
+                self._not_empty.wait(timeout)
+            if max_packets is None or max_packets >= len(self._queue):
+                packets = list(self._queue)
+                self._queue.clear()
+                self._stored_bytes = 0
+            else:
+                packets = [self._queue.popleft() for _ in range(max_packets)]
+                self._stored_bytes -= sum(len(packet) for packet in packets)
+            if self._spilled_packets and not self._queue:
+                if max_packets is None:
+                    packets.extend(self._read_spilled())
+                elif len(packets) < max_packets:
+                    packets.extend(self._read_spilled(max_packets - len(packets)))
+            self._update_wakeup()
+            self._not_full.notify_all()
+        return packets
+
+    def wait_for_packets(self, timeout: float) -> bool:
+        """Block up to the given time in seconds until packets are available.
+
+        :return: True if packets are available
+        """
+        with self._lock:
+            if not self._queue and not self._spilled_packets and timeout > 0:
+                self._not_empty.wait(timeout)
+            return bool(self._queue) or self._spilled_packets > 0
+
+    def clear(self):
+        with self._lock:
+            self._queue.clear()
+            self._stored_bytes = 0
+            self._discard_spill_file()
+            self._update_wakeup()
+            self._not_full.notify_all()
+
+    def _update_wakeup(self):
+        """Make the wake-up pipe readable if packets are stored and drain it otherwise. The
+        lock needs to be held"""
+        if self._wakeup_fds is None:
+            return
+        stored = bool(self._queue) or self._spilled_packets > 0
+        if stored and not self._wakeup_signaled:
+            os.write(self._wakeup_fds[1], b"\x00")
+            self._wakeup_signaled = True
+        elif not stored and self._wakeup_signaled:
+            os.read(self._wakeup_fds[0], 1)
+            self._wakeup_signaled = False
+
+    def _fits(self, packet_len: int) -> bool:
+        if not self._queue:
+            # A single packet is always accepted, even if it is larger than the bytes limit
+            return True
+        if self.max_packets is not None and len(self._queue) >= self.max_packets:
+            return False
+        if (
+            self.max_bytes is not None
+            and self._stored_bytes + packet_len > self.max_bytes
+        ):
+            return False
+        return True
+
+    def _put_single(self, packet: bytes):
+        packet_len = len(packet)
+        if self.policy == BackpressurePolicy.SPILL_TO_DISK:
+            # Spilled packets are newer than the ones in memory, so all new packets need to
+            # be spilled until the consumer has caught up to keep the order
+            if self._spilled_packets or not self._fits(packet_len):
+                self._spill(packet)
+                return
+        elif self.policy == BackpressurePolicy.BLOCK_READER:
+            start = time.monotonic()
+            if not self._fits(packet_len):
+                # Let waiting consumers retrieve the packets which were already added
+                self._update_wakeup()
+                self._not_empty.notify_all()
+            while not self._fits(packet_len) and not self._closed:
+                self._not_full.wait()
+            self._stats.blocked_time += time.monotonic() - start
+            if self._closed and not self._fits(packet_len):
+                self._drop(packet_len)
+                return
+        else:
+            while not self._fits(packet_len):
+                dropped_len = len(self._queue.popleft())
+                self._stored_bytes -= dropped_len
+                self._drop(dropped_len)
+        self._queue.append(packet)
+        self._stored_bytes += packet_len
+
+    def _drop(self, packet_len: int):
+        if self._stats.dropped_packets == 0:
+            LOGGER.warning("Packet queue full. Dropping packets..")
+        self._stats.dropped_packets += 1
+        self._stats.dropped_bytes += packet_len
+
+    def _spill(self, packet: bytes):
+        if self._spill_file is None:
+            LOGGER.info("Packet queue full. Spilling packets to disk..")
+            self._spill_file = tempfile.TemporaryFile()
+            self._spill_read_pos = 0
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(_SPILL_LEN_STRUCT.pack(len(packet)))
+        self._spill_file.write(packet)
+        self._spilled_packets += 1
+        self._stats.spilled_packets += 1
+        self._stats.spilled_bytes += len(packet)
+
+    def _read_spilled(self, max_packets: Optional[int] = None) -> List[bytes]:
+        """Read back spilled packets, up to the configured memory bounds per call"""
+        packets = []
+        read_bytes = 0
+        if max_packets is None:
+            max_packets = self.max_packets
+        self._spill_file.flush()
+        self._spill_file.seek(self._spill_read_pos)
+        while self._spilled_packets:
+            if max_packets is not None and len(packets) >= max_packets:
+                break
+            if packets and self.max_bytes is not None and read_bytes >= self.max_bytes:
+                break
+            packet_len = _SPILL_LEN_STRUCT.unpack(
+                self._spill_file.read(_SPILL_LEN_STRUCT.size)
+            )[0]
+            packets.append(self._spill_file.read(packet_len))
+            read_bytes += packet_len
+            self._spilled_packets -= 1
+        self._spill_read_pos = self._spill_file.tell()
+        if not self._spilled_packets:
+            self._discard_spill_file()
+        return packets
+
+    def _discard_spill_file(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_read_pos = 0
+        self._spilled_packets = 0
@@ -0,0 +1,170 @@
+"""Communication interface which replays telemetry recorded in a packet archive, see
+:py:mod:`tmtccmd.logging.archive`. This allows feeding recorded passes into the TM handlers
+without hardware, for example for regression tests or to benchmark the handlers.
+"""
+import math
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from tmtccmd.com_if import ComInterface
+from tmtccmd.logging import LOG_DIR, get_console_logger
+from tmtccmd.logging.archive import (
+    ARCHIVE_BASE_NAME,
+    ArchiveDirection,
+    ArchiveRecord,
+    PacketArchiveReader,
+    archive_files_in_range,
+)
+from tmtccmd.tm import TelemetryListT
+
+LOGGER = get_console_logger()
+
+REPLAY_COM_IF_ID = "replay"
+# Replay the packets without waiting
+REPLAY_MAX_SPEED = math.inf
+
+
+class ReplayComIF(ComInterface):
+    """Streams the packets of a packet archive through :py:meth:`receive`.
+
+    The packets are replayed with the relative timing of their recorded timestamps, which can
+    be scaled with the replay speed. At :py:data:`REPLAY_MAX_SPEED`, each call returns the next
+    packets without waiting, which is useful to measure the throughput of the TM handlers.
+    The archive files are memory-mapped. By default, the returned packets are memoryviews into
+    the archive files, so no packet is copied. Sent telecommands are discarded.
+    """
+
+    def __init__(
+        self,
+        archive: Union[str, Path] = LOG_DIR,
+        speed: float = 1.0,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        apid: Optional[int] = None,
+        direction: Optional[ArchiveDirection] = ArchiveDirection.TM,
+        max_packets_per_receive: int = 1024,
+        zero_copy: bool = True,
+        base_name: str = ARCHIVE_BASE_NAME,
+        com_if_id: str = REPLAY_COM_IF_ID,
+    ):
+        """
+        :param archive: Archive file or directory containing the archive files
+        :param speed: Replay speed relative to real-time. For example, 2.0 replays the packets
+            twice as fast as they were recorded
+        :param start: Only replay packets with a timestamp at or after start
+        :param end: Only replay packets with a timestamp before end
+        :param apid: Only replay packets with this APID
+        :param direction: Only replay packets with this direction. All packets are replayed if
+            this is None
+        :param max_packets_per_receive: Maximum number of packets returned by one
+            :py:meth:`receive` call
+        :param zero_copy: Return memoryviews into the archive files instead of bytes. The views
+            are valid as long as they are referenced
+        :param base_name: Base name of the archive files in a directory
+        :raises ValueError: Invalid speed
+        """
+        super().__init__(com_if_id=com_if_id)
+        if not speed > 0:
+            raise ValueError(f"Invalid replay speed {speed}")
+        self.archive = Path(archive)
+        self.speed = speed
+        self.start = start
+        self.end = end
+        self.apid = apid
+        self.direction = direction
+        self.max_packets_per_receive = max_packets_per_receive
+        self.zero_copy = zero_copy
+        self.base_name = base_name
+        self.packets_replayed = 0
+        self._open = False
+        self._records: Optional[Iterator[ArchiveRecord]] = None
+        self._next: Optional[ArchiveRecord] = None
+        self._first_timestamp: Optional[float] = None
+        self._replay_start = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """All packets were replayed"""
+        return self._open and self._next is None
+
+    def initialize(self, args: any = None) -> any:
+        pass
+
+    def open(self, args: any = None) -> None:
+        """Start the replay from the beginning"""
+        self.close()
+        self.packets_replayed = 0
+        self._records = self._replay_records()
+        self._next = next(self._records, None)
+        self._first_timestamp = None if self._next is None else self._next.timestamp
+        self._replay_start = time.monotonic()
+        self._open = True
+
+    def is_open(self) -> bool:
+        return self._open
+
+    def close(self, args: any = None) -> None:
+        if self._records is not None:
+            # Closes the current archive reader
+            self._records.close()
+        self._records = None
+        self._next = None
+        self._open = False
+
+    def send(self, data: bytes):
+        LOGGER.debug(f"Replay interface discarded {len(data)} bytes of sent data")
+
+    def receive(self, parameters: any = 0) -> TelemetryListT:
+        """Returns the packets which are due at the current replay time"""
+        packet_list = []
+        if not self._open or self._next is None:
+            return packet_list
+        replay_time = self._replay_time()
+        while (
+            self._next is not None
+            and len(packet_list) < self.max_packets_per_receive
+            and self._next.timestamp <= replay_time
+        ):
+            packet_list.append(self._next.raw)
+            self._next = next(self._records, None)
+        self.packets_replayed += len(packet_list)
+        return packet_list
+
+    def data_available(self, timeout: float = 0, parameters: any = 0) -> int:
+        """Wait until the next packet is due.
+
+        :param timeout: Maximum time to wait in seconds
+        :return: 1 if a packet is due, 0 otherwise
+        """
+        if not self._open or self._next is None:
+            return 0
+        if self.speed == REPLAY_MAX_SPEED:
+            return 1
+        wait_time = (self._next.timestamp - self._replay_time()) / self.speed
+        if wait_time > 0:
+            if wait_time > timeout:
+                time.sleep(max(timeout, 0))
+                return 0
+            time.sleep(wait_time)
+        return 1
+
+    def _replay_time(self) -> float:
+        """Archive timestamp corresponding to the current time"""
+        if self.speed == REPLAY_MAX_SPEED:
+            return math.inf
+        elapsed = time.monotonic() - self._replay_start
+        return self._first_timestamp + elapsed * self.speed
+
+    def _replay_records(self) -> Iterator[ArchiveRecord]:
+        if self.archive.is_dir():
+            files = archive_files_in_range(
+                self.archive, self.start, self.end, self.base_name
+            )
+        else:
+            files = [self.archive]
+        for path in files:
+            with PacketArchiveReader(path) as reader:
+                yield from reader.records(
+                    self.start, self.end, self.apid, self.direction, self.zero_copy
+                )
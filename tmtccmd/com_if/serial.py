@@ -3,21 +3,27 @@ import enum
 import threading
 import time
 import logging
-from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 
 import serial
 import serial.tools.list_ports
 
 from tmtccmd.com_if import ComInterface
+from tmtccmd.com_if.framer import (
+    FixedFrameDeframer,
+    DleStreamDecoder,
+    DleDecoderStats,
+)
+from tmtccmd.com_if.packet_queue import BoundedPacketQueue, PacketQueueStats
 from tmtccmd.tm import TelemetryListT
 from tmtccmd.logging import get_console_logger
-from dle_encoder import DleEncoder, STX_CHAR, ETX_CHAR, DleErrorCodes
+from dle_encoder import DleEncoder
 
 
 LOGGER = get_console_logger()
 SERIAL_FRAME_LENGTH = 256
 DLE_FRAME_LENGTH = 1500
+DLE_QUEUE_LEN = 256
 HEADER_BYTES_BEFORE_SIZE = 5
 
 
@@ -72,16 +78,19 @@ class SerialComIF(ComInterface):
         self.serial = None
         self.encoder = None
         self.ser_com_type = ser_com_type
+        self.deframer: Optional[FixedFrameDeframer] = None
         if self.ser_com_type == SerialCommunicationType.FIXED_FRAME_BASED:
             # Set to default value.
-            self.serial_frame_size = 256
+            self.serial_frame_size = SERIAL_FRAME_LENGTH
+            self.deframer = FixedFrameDeframer(self.serial_frame_size)
         elif self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
             self.encoder = DleEncoder()
             self.reception_thread = None
-            self.reception_buffer = None
+            self.reception_buffer: Optional[BoundedPacketQueue] = None
+            self.dle_decoder: Optional[DleStreamDecoder] = None
             self.dle_polling_active_event: Optional[threading.Event] = None
             # Set to default value.
-            self.dle_queue_len = 10
+            self.dle_queue_len = DLE_QUEUE_LEN
             self.dle_max_frame = 256
             self.dle_timeout = 0.01
             self.dle_encode_cr = True
@@ -92,6 +101,7 @@ class SerialComIF(ComInterface):
 
     def set_fixed_frame_settings(self, serial_frame_size: int):
         self.serial_frame_size = serial_frame_size
+        self.deframer = FixedFrameDeframer(self.serial_frame_size)
 
     def set_dle_settings(
         self,
@@ -107,7 +117,13 @@ class SerialComIF(ComInterface):
 
     def initialize(self, args: any = None) -> any:
         if self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
-            self.reception_buffer = deque(maxlen=self.dle_queue_len)
+            # Decoded packets are stored, so the queue is bounded by both the number of packets
+            # and the maximum number of bytes for that many frames
+            self.reception_buffer = BoundedPacketQueue(
+                max_packets=self.dle_queue_len,
+                max_bytes=self.dle_queue_len * DLE_FRAME_LENGTH,
+            )
+            self.dle_decoder = DleStreamDecoder(max_frame_len=DLE_FRAME_LENGTH)
             self.dle_polling_active_event = threading.Event()
 
     def open(self, args: any = None) -> None:
@@ -126,7 +142,10 @@ class SerialComIF(ComInterface):
         """
         Needs to be called by application code once for DLE mode!
         """
+        if self.deframer is not None:
+            self.deframer.reset()
         if self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
+            self.dle_decoder.reset()
             self.reception_thread.start()
 
     def is_open(self) -> bool:
@@ -155,42 +174,41 @@ class SerialComIF(ComInterface):
     def receive(self, parameters: any = 0) -> TelemetryListT:
         packet_list = []
         if self.ser_com_type == SerialCommunicationType.FIXED_FRAME_BASED:
-            if self.data_available():
-                data = self.serial.read(self.serial_frame_size)
-                pus_data_list = self.poll_pus_packets_fixed_frames(bytearray(data))
-                for pus_packet in pus_data_list:
-                    packet_list.append(pus_packet)
+            available = self.data_available()
+            if available:
+                # Read everything at once, the deframer keeps incomplete frames and packets
+                # spanning multiple frames until the rest arrives
+                data = self.serial.read(available)
+                packet_list.extend(self.deframer.deframe(data))
         elif self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
-            while self.reception_buffer:
-                data = self.reception_buffer.pop()
-                dle_retval, decoded_packet, read_len = self.encoder.decode(
-                    source_packet=data
-                )
-                if dle_retval == DleErrorCodes.OK:
-                    packet_list.append(decoded_packet)
-                else:
-                    LOGGER.warning("DLE decoder error!")
+            # Packets are already decoded by the reception thread
+            packet_list = self.reception_buffer.get_all()
         else:
             LOGGER.warning("This communication type was not implemented yet!")
         return packet_list
 
+    def fileno(self) -> int:
+        """File descriptor which becomes readable when new data can be received. In DLE mode,
+        the port is read by the reception thread, so the descriptor of the packet queue is
+        returned. -1 if the port is not open or if the platform does not support this"""
+        if self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
+            if self.reception_buffer is None:
+                return -1
+            return self.reception_buffer.fileno()
+        # Only the POSIX implementation of PySerial provides the descriptor of the port
+        if self.serial is None or not hasattr(self.serial, "fileno"):
+            return -1
+        return self.serial.fileno()
+
     def data_available(self, timeout: float = 0, parameters: any = 0) -> int:
-        elapsed_time = 0
-        start_time = time.time()
         sleep_time = timeout / 3.0
         if self.ser_com_type == SerialCommunicationType.FIXED_FRAME_BASED:
             return self.data_available_fixed_frame(
                 timeout=timeout, sleep_time=sleep_time
             )
         elif self.ser_com_type == SerialCommunicationType.DLE_ENCODING:
-            if timeout > 0:
-                while elapsed_time < timeout:
-                    if self.reception_buffer:
-                        return self.reception_buffer.__len__()
-                    elapsed_time = time.time() - start_time
-                    time.sleep(sleep_time)
-            if self.reception_buffer:
-                return self.reception_buffer.__len__()
+            if self.reception_buffer.wait_for_packets(timeout):
+                return len(self.reception_buffer)
         return 0
 
     def data_available_fixed_frame(self, timeout: float, sleep_time: float):
@@ -205,29 +223,28 @@ class SerialComIF(ComInterface):
         if self.serial.inWaiting() > 0:
             return self.serial.inWaiting()
 
+    def dle_stats(self) -> Tuple[DleDecoderStats, PacketQueueStats]:
+        """Retrieve the statistics of the DLE decoder and of the reception queue, which
+        counts dropped packets"""
+        return self.dle_decoder.stats, self.reception_buffer.stats()
+
     def poll_dle_packets(self):
-        while True and self.dle_polling_active_event.is_set():
-            # Poll permanently, but it is possible to join this thread every 200 ms
-            self.serial.timeout = 0.2
-            data = bytearray()
-            byte = self.serial.read()
-            if len(byte) == 1 and byte[0] == STX_CHAR:
-                data.append(byte[0])
-                self.serial.timeout = 0.1
-                bytes_rcvd = self.serial.read_until(
-                    serial.to_bytes([ETX_CHAR]), DLE_FRAME_LENGTH
-                )
-                if bytes_rcvd[len(bytes_rcvd) - 1] == ETX_CHAR:
-                    data.extend(bytes_rcvd)
-                    self.reception_buffer.appendleft(data)
-            elif len(byte) >= 1:
-                data.append(byte[0])
-                data.extend(self.serial.read(self.serial.inWaiting()))
-                # It is assumed that all packets are DLE encoded, so throw it away for now.
-                LOGGER.info(f"Non DLE-Encoded data with length {len(data) + 1} found..")
+        # Poll permanently, but it is possible to join this thread every 200 ms
+        self.serial.timeout = 0.2
+        while self.dle_polling_active_event.is_set():
+            # Block until at least one byte arrives and read all other available bytes at once
+            data = self.serial.read(max(1, self.serial.in_waiting))
+            if not data:
+                continue
+            packets = self.dle_decoder.feed(data)
+            if packets:
+                self.reception_buffer.put(packets)
 
     @staticmethod
     def poll_pus_packets_fixed_frames(data: bytearray) -> list:
+        """Parse the packets of a single frame. Packets spanning multiple frames are not
+        supported. :py:class:`tmtccmd.com_if.framer.FixedFrameDeframer` should be used instead.
+        """
         pus_data_list = []
         if len(data) == 0:
             return pus_data_list
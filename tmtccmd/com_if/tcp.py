@@ -4,16 +4,19 @@ import time
 import enum
 import threading
 import select
-from collections import deque
-from typing import Optional, Tuple
-
-from spacepackets.ccsds.spacepacket import parse_space_packets
+import selectors
+from typing import Optional, Tuple, List
 
 from tmtccmd.logging import get_console_logger
 from tmtccmd.com_if import ComInterface
+from tmtccmd.com_if.framer import SpacePacketFramer
+from tmtccmd.com_if.packet_queue import (
+    BoundedPacketQueue,
+    BackpressurePolicy,
+    PacketQueueStats,
+)
 from tmtccmd.tm import TelemetryListT
 from tmtccmd.com_if.tcpip_utils import EthAddr
-from tmtccmd.util.conf_util import acquire_timeout
 
 LOGGER = get_console_logger()
 
@@ -37,6 +40,9 @@ class TcpComIF(ComInterface):
 
     DEFAULT_LOCK_TIMEOUT = 0.4
     TM_LOOP_DELAY = 0.2
+    # Maximum number of receive calls per wake-up of the selector based reception thread before
+    # the received packets are passed to the TM queue
+    MAX_DRAIN_RECV_CALLS = 32
 
     def __init__(
         self,
@@ -47,6 +53,9 @@ class TcpComIF(ComInterface):
         target_address: EthAddr,
         max_recv_size: int,
         max_packets_stored: int = 50,
+        use_selector: bool = False,
+        max_bytes_stored: Optional[int] = None,
+        backpressure_policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
     ):
         """Initialize a communication interface to send and receive TMTC via TCP
         :param com_if_id:
@@ -55,6 +64,14 @@ class TcpComIF(ComInterface):
         :param space_packet_ids:        16 bit packet header for space packet headers. Used to
                                         detect the start of PUS packets
         :param tm_polling_freqency:     Polling frequency in seconds
+        :param use_selector:            If this is set to True, the reception thread blocks until
+                                        the socket is readable and drains all available data
+                                        instead of polling the socket with a fixed delay
+        :param max_packets_stored:      Maximum number of received packets stored in memory
+        :param max_bytes_stored:        Maximum number of received bytes stored in memory.
+                                        None for no limit
+        :param backpressure_policy:     Policy applied if the consumer does not retrieve the
+                                        received packets fast enough
         """
         super().__init__(com_if_id=com_if_id)
         self.com_type = com_type
@@ -62,7 +79,7 @@ class TcpComIF(ComInterface):
         self.tm_polling_frequency = tm_polling_freqency
         self.target_address = target_address
         self.max_recv_size = max_recv_size
-        self.max_packets_stored = max_packets_stored
+        self.use_selector = use_selector
         self.connected = False
 
         self.__tcp_socket: Optional[socket.socket] = None
@@ -72,11 +89,12 @@ class TcpComIF(ComInterface):
         self.__tcp_conn_thread: Optional[threading.Thread] = threading.Thread(
             target=self.__tcp_tm_client, daemon=True
         )
-        self.__tm_queue = deque()
-        self.__analysis_queue = deque()
-        # Only allow one connection to OBSW at a time for now by using this lock
-        # self.__socket_lock = threading.Lock()
-        self.__queue_lock = threading.Lock()
+        self.__tm_queue = BoundedPacketQueue(
+            max_packets=max_packets_stored,
+            max_bytes=max_bytes_stored,
+            policy=backpressure_policy,
+        )
+        self.__framer = SpacePacketFramer(space_packet_ids)
 
     def __del__(self):
         try:
@@ -89,6 +107,7 @@ class TcpComIF(ComInterface):
 
     def open(self, args: any = None):
         self.__tm_thread_kill_signal.clear()
+        self.__tm_queue.open()
         try:
             self.set_up_socket()
         except IOError as e:
@@ -124,6 +143,8 @@ class TcpComIF(ComInterface):
 
     def close(self, args: any = None) -> None:
         self.__tm_thread_kill_signal.set()
+        # Wake up the reception thread if it is blocked by a full queue
+        self.__tm_queue.close()
         if self.__tcp_conn_thread is not None:
             if self.__tcp_conn_thread.is_alive():
                 self.__tcp_conn_thread.join(self.tm_polling_frequency)
@@ -151,27 +172,37 @@ class TcpComIF(ComInterface):
             self.__tcp_socket = None
             LOGGER.warning("TCP connection attempt failed..")
 
+    def fileno(self) -> int:
+        """File descriptor which is readable while received packets are available. The socket
+        itself is read by the reception thread, so the descriptor of the packet queue is
+        returned instead. -1 if the platform does not support this"""
+        return self.__tm_queue.fileno()
+
     def receive(self, poll_timeout: float = 0) -> TelemetryListT:
-        tm_packet_list = []
-        with acquire_timeout(
-            self.__queue_lock, timeout=self.DEFAULT_LOCK_TIMEOUT
-        ) as acquired:
-            if not acquired:
-                LOGGER.warning("Acquiring queue lock failed!")
-            while self.__tm_queue:
-                self.__analysis_queue.appendleft(self.__tm_queue.pop())
-        # TCP is stream based, so there might be broken packets or multiple packets in one recv
-        # call. We parse the space packets contained in the stream here
-        if self.com_type == TcpCommunicationType.SPACE_PACKETS:
-            tm_packet_list = parse_space_packets(
-                analysis_queue=self.__analysis_queue, packet_ids=self.space_packet_ids
-            )
-        else:
-            while self.__analysis_queue:
-                tm_packet_list.append(self.__analysis_queue.pop())
-        return tm_packet_list
+        """Retrieve all packets received by the reception thread.
+
+        :param poll_timeout: If no packets are available, block up to this time in seconds until
+            the reception thread has received new packets
+        """
+        return self.__tm_queue.get_all(poll_timeout)
+
+    @property
+    def max_packets_stored(self) -> Optional[int]:
+        return self.__tm_queue.max_packets
+
+    @max_packets_stored.setter
+    def max_packets_stored(self, max_packets_stored: Optional[int]):
+        self.__tm_queue.max_packets = max_packets_stored
+
+    def recv_stats(self) -> PacketQueueStats:
+        """Statistics of the reception queue, for example the number of packets and bytes
+        which were dropped because the consumer did not retrieve the packets fast enough"""
+        return self.__tm_queue.stats()
 
     def __tcp_tm_client(self):
+        if self.use_selector:
+            self.__selector_tm_client()
+            return
         while True and not self.__tm_thread_kill_signal.is_set():
             if self.connected:
                 try:
@@ -180,43 +211,85 @@ class TcpComIF(ComInterface):
                     LOGGER.warning("TCP connection attempt failed..")
             time.sleep(self.TM_LOOP_DELAY)
 
+    def __selector_tm_client(self):
+        while not self.__tm_thread_kill_signal.is_set():
+            tcp_socket = self.__tcp_socket
+            if not self.connected or tcp_socket is None:
+                self.__tm_thread_kill_signal.wait(self.TM_LOOP_DELAY)
+                continue
+            with selectors.DefaultSelector() as selector:
+                selector.register(tcp_socket, selectors.EVENT_READ)
+                # The selector timeout is only used to check the kill signal periodically
+                while (
+                    not self.__tm_thread_kill_signal.is_set()
+                    and self.connected
+                    and self.__tcp_socket is tcp_socket
+                ):
+                    try:
+                        if selector.select(self.TM_LOOP_DELAY):
+                            self.__drain_socket(tcp_socket, selector)
+                    except ConnectionRefusedError:
+                        LOGGER.warning("TCP connection attempt failed..")
+
+    def __drain_socket(
+        self, tcp_socket: socket.socket, selector: selectors.BaseSelector
+    ):
+        packets = []
+        try:
+            for _ in range(self.MAX_DRAIN_RECV_CALLS):
+                if not self.__recv_packets(tcp_socket, packets):
+                    break
+                if not selector.select(0):
+                    break
+        except ConnectionResetError:
+            self.__close_tcp_socket()
+            LOGGER.exception("ConnectionResetError. TCP server might not be up")
+        self.__store_packets(packets)
+
     def __receive_tm_packets(self):
         try:
             ready = select.select([self.__tcp_socket], [], [], 0)
             if ready[0]:
-                bytes_recvd = self.__tcp_socket.recv(self.max_recv_size)
-                if bytes_recvd == b"":
-                    self.__close_tcp_socket()
-                    LOGGER.info("TCP server has been closed")
-                    return
-                else:
-                    self.connected = True
-                with acquire_timeout(
-                    self.__queue_lock, timeout=self.DEFAULT_LOCK_TIMEOUT
-                ) as acquired:
-                    if not acquired:
-                        LOGGER.warning("Acquiring queue lock failed!")
-                    if self.__tm_queue.__len__() >= self.max_packets_stored:
-                        LOGGER.warning(
-                            "Number of packets in TCP queue too large. "
-                            "Overwriting old packets.."
-                        )
-                        self.__tm_queue.pop()
-                        # TODO: If segments are received but the receiver is unable to parse packets
-                        #       properly, it might make sense to have a timeout which then also
-                        #       logs that there might be an issue reading packets
-                    self.__tm_queue.appendleft(bytes(bytes_recvd))
+                packets = []
+                self.__recv_packets(self.__tcp_socket, packets)
+                self.__store_packets(packets)
         except ConnectionResetError:
             self.__close_tcp_socket()
             LOGGER.exception("ConnectionResetError. TCP server might not be up")
 
-    def data_available(self, timeout: float = 0, parameters: any = 0) -> bool:
-        if self.__tm_queue:
-            return True
+    def __recv_packets(self, tcp_socket: socket.socket, packets: List[bytes]) -> bool:
+        """Perform one receive call and append all complete packets to the given list.
+
+        :return: False if the TCP server has been closed, True otherwise
+        """
+        # TCP is stream based, so there might be broken packets or multiple packets in
+        # one recv call. The data is received directly into the buffer of the framer,
+        # which only returns complete space packets
+        if self.com_type == TcpCommunicationType.SPACE_PACKETS:
+            recvd_len = self.__framer.recv_into(tcp_socket, self.max_recv_size)
+            if recvd_len > 0:
+                packets.extend(self.__framer.parse())
         else:
+            bytes_recvd = tcp_socket.recv(self.max_recv_size)
+            recvd_len = len(bytes_recvd)
+            if recvd_len > 0:
+                packets.append(bytes_recvd)
+        if recvd_len == 0:
+            self.__close_tcp_socket()
+            LOGGER.info("TCP server has been closed")
             return False
+        self.connected = True
+        return True
+
+    def __store_packets(self, packets: List[bytes]):
+        self.__tm_queue.put(packets)
+
+    def data_available(self, timeout: float = 0, parameters: any = 0) -> bool:
+        return self.__tm_queue.wait_for_packets(timeout)
 
     def __close_tcp_socket(self):
         self.connected = False
+        # Broken packets of the closed stream can not be completed anymore
+        self.__framer.clear()
         self.__tcp_socket.close()
         self.__tcp_socket = None
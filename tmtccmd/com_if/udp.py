@@ -1,16 +1,80 @@
 """UDP Communication Interface"""
 import select
+import selectors
 import socket
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, Iterator, Sequence, Dict
 
 from tmtccmd.logging import get_console_logger
-from tmtccmd.com_if import ComInterface
+from tmtccmd.com_if import ComInterface, MultiSourceComInterface, SourceTaggedTmListT
 from tmtccmd.tm import TelemetryListT
 from tmtccmd.com_if.tcpip_utils import EthAddr
 
 LOGGER = get_console_logger()
 
 
+class UdpRecvBatch:
+    """Batch of datagrams received into a preallocated and reusable buffer pool.
+
+    Indexing or iterating the batch yields :py:class:`memoryview` objects into the buffer
+    pool. These views are only valid until the next batch is received into the pool, so they
+    need to be copied, for example with :py:meth:`to_list`, if the data needs to be stored.
+    """
+
+    def __init__(self, max_datagrams: int, max_recv_size: int):
+        self.max_recv_size = max_recv_size
+        self._buf = bytearray(max_datagrams * max_recv_size)
+        view = memoryview(self._buf)
+        self._slots = [
+            view[idx * max_recv_size : (idx + 1) * max_recv_size]
+            for idx in range(max_datagrams)
+        ]
+        self._lens = [0] * max_datagrams
+        self.sender_addrs: List[Optional[Tuple[str, int]]] = [None] * max_datagrams
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    def is_full(self) -> bool:
+        return self.count == len(self._slots)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, idx: int) -> memoryview:
+        if idx < 0:
+            idx += self.count
+        if not 0 <= idx < self.count:
+            raise IndexError("batch index out of range")
+        return self._slots[idx][: self._lens[idx]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for idx in range(self.count):
+            yield self._slots[idx][: self._lens[idx]]
+
+    def to_list(self) -> TelemetryListT:
+        """Copy all datagrams of the batch into a list of bytes"""
+        return [bytes(self._slots[idx][: self._lens[idx]]) for idx in range(self.count)]
+
+    def recv_next(self, udp_socket: socket.socket) -> bool:
+        """Receive the next datagram into the next free slot without blocking.
+
+        :return: False if no datagram was available
+        """
+        try:
+            recvd, sender_addr = udp_socket.recvfrom_into(
+                self._slots[self.count], self.max_recv_size
+            )
+        except BlockingIOError:
+            return False
+        self._lens[self.count] = recvd
+        self.sender_addrs[self.count] = sender_addr
+        self.count += 1
+        return True
+
+
 class UdpComIF(ComInterface):
     """Communication interface for UDP communication"""
 
@@ -20,18 +84,23 @@ class UdpComIF(ComInterface):
         send_address: EthAddr,
         max_recv_size: int,
         recv_addr: Optional[EthAddr] = None,
+        recv_batch_size: int = 64,
     ):
         """Initialize a communication interface to send and receive UDP datagrams.
 
         :param send_address:
         :param max_recv_size:
         :param recv_addr:
+        :param recv_batch_size: Maximum number of datagrams received by one
+            :py:meth:`receive_batch` call
         """
         super().__init__(com_if_id=com_if_id)
         self.udp_socket = None
         self.send_address = send_address
         self.recv_addr = recv_addr
         self.max_recv_size = max_recv_size
+        self.recv_batch_size = recv_batch_size
+        self._recv_batch: Optional[UdpRecvBatch] = None
 
     def __del__(self):
         try:
@@ -58,6 +127,13 @@ class UdpComIF(ComInterface):
     def is_open(self) -> bool:
         return self.udp_socket is not None
 
+    def fileno(self) -> int:
+        """File descriptor of the UDP socket. Can be used to wait for TM with an event loop
+        or a selector. Returns -1 if the interface is not open."""
+        if self.udp_socket is None:
+            return -1
+        return self.udp_socket.fileno()
+
     def close(self, args: any = None) -> None:
         if self.udp_socket is not None:
             self.udp_socket.close()
@@ -78,14 +154,194 @@ class UdpComIF(ComInterface):
         return False
 
     def receive(self, poll_timeout: float = 0) -> TelemetryListT:
+        """Receive all available datagrams.
+
+        :param poll_timeout: If no datagram is available, wait up to this time in seconds for
+            the first datagram
+        """
         packet_list = []
+        batch = self.receive_batch(poll_timeout)
+        packet_list.extend(batch.to_list())
+        while batch.is_full():
+            batch = self.receive_batch()
+            packet_list.extend(batch.to_list())
+        return packet_list
+
+    def receive_batch(self, poll_timeout: float = 0) -> UdpRecvBatch:
+        """Receive up to :py:attr:`recv_batch_size` datagrams into a reusable buffer pool. The
+        socket is only polled with select if no datagram is available immediately.
+
+        :param poll_timeout: If no datagram is available, wait up to this time in seconds for
+            the first datagram
+        :return: Batch of received datagrams. The batch and the views into its buffer pool are
+            only valid until the next call of this function
+        """
+        batch = self._recv_batch
+        if (
+            batch is None
+            or batch.capacity != self.recv_batch_size
+            or batch.max_recv_size != self.max_recv_size
+        ):
+            batch = UdpRecvBatch(self.recv_batch_size, self.max_recv_size)
+            self._recv_batch = batch
+        batch.count = 0
         if self.udp_socket is None:
-            return packet_list
+            return batch
         try:
-            while self.data_available(poll_timeout):
-                data, sender_addr = self.udp_socket.recvfrom(self.max_recv_size)
-                packet_list.append(bytearray(data))
-            return packet_list
+            while not batch.is_full():
+                if not batch.recv_next(self.udp_socket):
+                    if batch.count > 0 or poll_timeout <= 0:
+                        break
+                    if not self.data_available(poll_timeout):
+                        break
+                    # Only wait once
+                    poll_timeout = 0
         except ConnectionResetError:
             LOGGER.warning("Connection reset exception occured!")
-            return []
+        return batch
+
+
+@dataclass
+class UdpEndpoint:
+    """UDP endpoint of a :py:class:`MultiUdpComIF`.
+
+    :var name: Name of the endpoint. Received packets are tagged with this name
+    :var recv_addr: Address the socket of this endpoint is bound to
+    :var send_addr: Optional address telecommands are sent to for this endpoint
+    """
+
+    name: str
+    recv_addr: EthAddr
+    send_addr: Optional[EthAddr] = None
+
+
+class MultiUdpComIF(MultiSourceComInterface):
+    """Communication interface which listens on multiple UDP sockets at once, for example one
+    per spacecraft or simulator instance. All sockets are multiplexed with one selector and each
+    received packet is tagged with the name of the endpoint it was received on."""
+
+    def __init__(
+        self,
+        com_if_id: str,
+        endpoints: Sequence[UdpEndpoint],
+        max_recv_size: int,
+        recv_batch_size: int = 64,
+    ):
+        """
+        :param endpoints: UDP endpoints. The endpoint names need to be unique. Telecommands
+            sent with :py:meth:`send` are sent to the first endpoint with a send address
+        :param max_recv_size: Maximum size of a received datagram
+        :param recv_batch_size: Size of the reusable buffer pool in datagrams
+        """
+        super().__init__(com_if_id=com_if_id)
+        self._sockets: Dict[str, socket.socket] = dict()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self.endpoints: Dict[str, UdpEndpoint] = dict()
+        for endpoint in endpoints:
+            if endpoint.name in self.endpoints:
+                raise ValueError(f"Duplicate UDP endpoint name {endpoint.name}")
+            self.endpoints[endpoint.name] = endpoint
+        self.max_recv_size = max_recv_size
+        self._batch = UdpRecvBatch(recv_batch_size, max_recv_size)
+
+    def __del__(self):
+        try:
+            self.close()
+        except IOError:
+            LOGGER.warning("Could not close UDP communication interface")
+
+    def initialize(self, args: any = None) -> any:
+        pass
+
+    def open(self, args: any = None):
+        """Bind the sockets of all endpoints. If binding one of the sockets fails, all sockets
+        are closed again and the interface stays closed.
+
+        :raises OSError: Binding a socket failed
+        """
+        self._selector = selectors.DefaultSelector()
+        try:
+            for endpoint in self.endpoints.values():
+                udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._sockets[endpoint.name] = udp_socket
+                LOGGER.info(
+                    f"Binding UDP socket for endpoint {endpoint.name} to "
+                    f"{endpoint.recv_addr.ip_addr} and port {endpoint.recv_addr.port}"
+                )
+                udp_socket.bind(endpoint.recv_addr.to_tuple)
+                udp_socket.setblocking(False)
+                self._selector.register(udp_socket, selectors.EVENT_READ, endpoint.name)
+        except BaseException:
+            self.close()
+            raise
+
+    def is_open(self) -> bool:
+        return self._selector is not None
+
+    def close(self, args: any = None) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for udp_socket in self._sockets.values():
+            udp_socket.close()
+        self._sockets.clear()
+
+    def fileno(self) -> int:
+        """File descriptor of the selector if the platform supports it, -1 otherwise. It becomes
+        readable if any of the sockets is readable."""
+        if self._selector is None or not hasattr(self._selector, "fileno"):
+            return -1
+        return self._selector.fileno()
+
+    def send(self, data: bytes):
+        for endpoint in self.endpoints.values():
+            if endpoint.send_addr is not None:
+                self.send_to(endpoint.name, data)
+                return
+        LOGGER.warning("No UDP endpoint with a send address configured")
+
+    def send_to(self, endpoint_name: str, data: bytes):
+        """Send data to the send address of a specific endpoint, using the socket of that
+        endpoint."""
+        udp_socket = self._sockets.get(endpoint_name)
+        if udp_socket is None:
+            return
+        send_addr = self.endpoints[endpoint_name].send_addr
+        if send_addr is None:
+            LOGGER.warning(f"UDP endpoint {endpoint_name} has no send address")
+            return
+        bytes_sent = udp_socket.sendto(data, send_addr.to_tuple)
+        if bytes_sent != len(data):
+            LOGGER.warning("Not all bytes were sent!")
+
+    def data_available(self, timeout: float = 0, parameters: any = 0) -> bool:
+        if self._selector is None:
+            return False
+        return len(self._selector.select(timeout)) > 0
+
+    def receive_with_source(self, poll_timeout: float = 0) -> SourceTaggedTmListT:
+        """Receive all available datagrams of all endpoints.
+
+        :param poll_timeout: If no datagram is available, wait up to this time in seconds for
+            the first datagram
+        :return: List of (endpoint name, packet) tuples
+        """
+        packet_list = []
+        if self._selector is None:
+            return packet_list
+        batch = self._batch
+        for key, _ in self._selector.select(poll_timeout if poll_timeout > 0 else 0):
+            endpoint_name = key.data
+            try:
+                while True:
+                    batch.count = 0
+                    while not batch.is_full() and batch.recv_next(key.fileobj):
+                        pass
+                    packet_list.extend(
+                        (endpoint_name, packet) for packet in batch.to_list()
+                    )
+                    if not batch.is_full():
+                        break
+            except ConnectionResetError:
+                LOGGER.warning("Connection reset exception occured!")
+        return packet_list
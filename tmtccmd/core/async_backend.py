@@ -0,0 +1,175 @@
+"""Event-driven asyncio variant of the :py:class:`tmtccmd.core.ccsds_backend.CcsdsTmtcBackend`"""
+import asyncio
+import time
+from datetime import timedelta
+from typing import Optional
+
+from tmtccmd.core.base import TmMode, TcMode, BackendRequest
+from tmtccmd.core.ccsds_backend import CcsdsTmtcBackend
+from tmtccmd.com_if import ComInterface
+from tmtccmd.logging import get_console_logger
+from tmtccmd.tc.handler import TcHandlerBase
+from tmtccmd.tm.ccsds_tm_listener import CcsdsTmListener
+
+LOGGER = get_console_logger()
+
+
+class AsyncCcsdsTmtcBackend(CcsdsTmtcBackend):
+    """Backend which can be driven by an asyncio event loop instead of a polling loop which calls
+    :py:meth:`periodic_op` and then sleeps a fixed amount of time.
+
+    The :py:meth:`run` coroutine only wakes up when there is something to do:
+
+     1. The file descriptor of the communication interface becomes readable while TM listening
+        is active. This requires the communication interface to expose a ``fileno`` method like
+        a socket does, which the UDP, TCP and serial interfaces do on POSIX systems. If it does
+        not, the interface is polled with the :py:attr:`tm_poll_interval` while TM listening is
+        active.
+     2. The remaining delay of the TC sequencer has expired.
+     3. :py:meth:`notify` was called, for example after a new procedure was set from another
+        thread or task.
+
+    All TC and TM handling is done with the regular :py:class:`TcHandlerBase` and
+    :py:class:`CcsdsTmListener` callbacks, so existing handlers can be used unchanged.
+    """
+
+    def __init__(
+        self,
+        tc_mode: TcMode,
+        tm_mode: TmMode,
+        com_if: ComInterface,
+        tm_listener: CcsdsTmListener,
+        tc_handler: TcHandlerBase,
+        tm_poll_interval: timedelta = timedelta(milliseconds=20),
+        idle_timeout: Optional[timedelta] = None,
+    ):
+        """
+        :param tm_poll_interval: Poll interval used for communication interfaces which do not
+            expose a file descriptor
+        :param idle_timeout: Maximum time to wait in the IDLE mode without being notified. None
+            means that the backend only wakes up on TM reception or a :py:meth:`notify` call
+        """
+        super().__init__(
+            tc_mode=tc_mode,
+            tm_mode=tm_mode,
+            com_if=com_if,
+            tm_listener=tm_listener,
+            tc_handler=tc_handler,
+        )
+        self.tm_poll_interval = tm_poll_interval
+        self.idle_timeout = idle_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tm_fd: Optional[int] = None
+        self._tm_reader_armed = False
+        self._stop_requested = False
+
+    def notify(self):
+        """Wake up the :py:meth:`run` coroutine. This function is thread-safe and can also
+        be called from the reception thread of a communication interface."""
+        if self._loop is None or self._wakeup is None:
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def stop(self):
+        """Request the :py:meth:`run` coroutine to return. Thread-safe."""
+        self._stop_requested = True
+        self.notify()
+
+    async def run(self) -> BackendRequest:
+        """Handle TMTC until the backend requests termination or :py:meth:`stop` is called.
+
+        :raises NoValidProcedureSet: No valid procedure set to be passed to the feed callback of
+            the TC handler
+        :return: Last backend request
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stop_requested = False
+        self._tm_fd = self._com_if_fd()
+        try:
+            while not self._stop_requested:
+                state = self.periodic_op(None)
+                self._update_tm_reader()
+                if state.request == BackendRequest.TERMINATION_NO_ERROR:
+                    break
+                elif state.request == BackendRequest.CALL_NEXT:
+                    # Still yield to the event loop so other tasks are not starved
+                    await asyncio.sleep(0)
+                    continue
+                await self._wait_for_wakeup(self._next_timeout())
+        finally:
+            self._disarm_tm_reader()
+            self._tm_fd = None
+            self._wakeup = None
+            self._loop = None
+        return self._state.request
+
+    def _next_timeout(self) -> Optional[float]:
+        timeout = None
+        if self.request == BackendRequest.DELAY_CUSTOM:
+            next_wake_time = self._state.sender_res.next_wake_time
+            if next_wake_time is not None:
+                timeout = max(next_wake_time - time.monotonic(), 0.0)
+            else:
+                timeout = self._state.next_delay.total_seconds()
+        elif (
+            self.request == BackendRequest.DELAY_IDLE and self.idle_timeout is not None
+        ):
+            timeout = self.idle_timeout.total_seconds()
+        if self._tm_fd is None and self.tm_mode == TmMode.LISTENER:
+            poll_timeout = self.tm_poll_interval.total_seconds()
+            if timeout is None or poll_timeout < timeout:
+                timeout = poll_timeout
+        return timeout
+
+    async def _wait_for_wakeup(self, timeout: Optional[float]):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    def _com_if_fd(self) -> Optional[int]:
+        fileno = getattr(self._com_if, "fileno", None)
+        if fileno is None:
+            return None
+        try:
+            fd = fileno()
+        except OSError:
+            return None
+        if fd is None or fd < 0:
+            return None
+        return fd
+
+    def _update_tm_reader(self):
+        """The reader is only armed while TM listening is active. Otherwise, pending TM would
+        never be drained and the readable file descriptor would wake up the loop continuously.
+        """
+        if self.tm_mode == TmMode.LISTENER:
+            self._arm_tm_reader()
+        else:
+            self._disarm_tm_reader()
+
+    def _arm_tm_reader(self):
+        if self._tm_fd is None or self._tm_reader_armed:
+            return
+        try:
+            self._loop.add_reader(self._tm_fd, self._on_tm_readable)
+            self._tm_reader_armed = True
+        except NotImplementedError:
+            # For example the proactor event loop on Windows
+            LOGGER.info("Event loop does not support readers, polling TM instead")
+            self._tm_fd = None
+
+    def _disarm_tm_reader(self):
+        if self._tm_reader_armed:
+            self._loop.remove_reader(self._tm_fd)
+            self._tm_reader_armed = False
+
+    def _on_tm_readable(self):
+        # One-shot reader which is re-armed after the next periodic operation drained the
+        # communication interface. Data which is left in the interface still wakes up the loop
+        # once per periodic operation, but never makes it spin without handling TM
+        self._disarm_tm_reader()
+        self._wakeup.set()
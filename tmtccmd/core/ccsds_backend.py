@@ -202,10 +202,7 @@ class CcsdsTmtcBackend(BackendBase):
             ):
                 self._state._req = BackendRequest.CALL_NEXT
             else:
-                if (
-                    int(self._state.sender_res.longest_rem_delay.microseconds / 1000.0)
-                    > 0
-                ):
+                if self._state.sender_res.longest_rem_delay > timedelta():
                     self._state._recommended_delay = (
                         self._state.sender_res.longest_rem_delay
                     )
@@ -1,70 +1,47 @@
-import csv
 import os
-import copy
-from typing import Optional, List
-from tmtccmd.util.obj_id import ObjectIdU32, ObjectIdDictT
-from tmtccmd.pus.pus_5_event import EventInfo, EventDictT
-from tmtccmd.util.retval import RetvalDictT, RetvalInfo
+from typing import Dict, Optional, List, Sequence, Type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tmtccmd.util.obj_id import ObjectIdDictT
+from tmtccmd.pus.pus_5_event import EventDictT
+from tmtccmd.util.retval import RetvalDictT
+from tmtccmd.fsfw.catalog import (
+    CsvCatalog,
+    EventCatalog,
+    ObjectCatalog,
+    RetvalCatalog,
+)
 
 
 def parse_fsfw_objects_csv(csv_file: str) -> Optional[ObjectIdDictT]:
-    if os.path.exists(csv_file):
-        obj_id_dict = dict()
-        obj_id = ObjectIdU32(obj_id=0)
-        with open(csv_file) as csvfile:
-            csv_reader = csv.reader(csvfile, delimiter=";")
-            for row in csv_reader:
-                # Parse hex string
-                obj_id.obj_id = int(row[0], 16)
-                obj_id.name = row[1]
-                obj_id_dict.update({obj_id.as_bytes: copy.copy(obj_id)})
-        return obj_id_dict
-    else:
-        return None
+    """Parse a FSFW objects CSV file. :py:class:`tmtccmd.fsfw.catalog.ObjectCatalog` can be
+    used instead to cache the parsed file and to load it lazily."""
+    return _parse_catalog_csv(ObjectCatalog, csv_file)
 
 
 def parse_fsfw_events_csv(csv_file: str) -> Optional[EventDictT]:
-    if os.path.exists(csv_file):
-        event_dict = dict()
-        with open(csv_file) as csvfile:
-            csv_reader = csv.reader(csvfile, delimiter=";")
-            info = EventInfo()
-            for idx, row in enumerate(csv_reader):
-                if idx == 0:
-                    continue
-                info.id = int(row[0])
-                info.name = row[2]
-                info.severity = row[3]
-                info.info = row[4]
-                info.file_location = row[5]
-                event_dict.update({info.id: copy.copy(info)})
-        return event_dict
-    else:
-        return None
+    """Parse a FSFW events CSV file. :py:class:`tmtccmd.fsfw.catalog.EventCatalog` can be
+    used instead to cache the parsed file and to load it lazily."""
+    return _parse_catalog_csv(EventCatalog, csv_file)
 
 
 def parse_fsfw_returnvalues_csv(csv_file: str) -> Optional[RetvalDictT]:
-    if os.path.exists(csv_file):
-        retval_dict = dict()
-        with open(csv_file) as csvfile:
-            csv_reader = csv.reader(csvfile, delimiter=";")
-            info = RetvalInfo()
-            for idx, row in enumerate(csv_reader):
-                if idx == 0:
-                    continue
-                # Parse hex
-                id_col = str(row[0])
-                if "0x" in id_col:
-                    info.id = int(id_col, 0)
-                else:
-                    info.id = int(id_col, 16)
-                info.name = row[1]
-                info.info = row[2]
-                info.if_name = row[5]
-                retval_dict.update({info.id: copy.copy(info)})
-        return retval_dict
-    else:
+    """Parse a FSFW returnvalues CSV file. :py:class:`tmtccmd.fsfw.catalog.RetvalCatalog` can
+    be used instead to cache the parsed file and to load it lazily."""
+    return _parse_catalog_csv(RetvalCatalog, csv_file)
+
+
+def _parse_catalog_csv(catalog_cls: Type[CsvCatalog], csv_file: str) -> Optional[Dict]:
+    if not os.path.exists(csv_file):
         return None
+    return {
+        key: catalog_cls.build_value(key, raw)
+        for key, raw in catalog_cls.parse_csv(csv_file).items()
+    }
 
 
 def bit_extractor(byte: int, position: int):
@@ -79,20 +56,44 @@ def bit_extractor(byte: int, position: int):
 
 
 def validity_buffer_list(validity_buffer: bytes, num_vars: int) -> List[bool]:
-    """
+    """Decode a FSFW validity buffer. The validity bit of the first variable is the most
+    significant bit of the first byte.
+
     :param validity_buffer: Validity buffer in bytes format
-    :param num_vars: Number of variables
+    :param num_vars: Number of variables. If this is not positive, the validity flags of all
+        bits of the buffer are returned
     :return:
     """
-    valid_list = []
-    counter = 0
-    for index, byte in enumerate(validity_buffer):
-        for bit in range(1, 9):
-            if bit_extractor(byte, bit) == 1:
-                valid_list.append(True)
-            else:
-                valid_list.append(False)
-            counter += 1
-            if counter == num_vars:
-                return valid_list
-    return valid_list
+    num_bits = len(validity_buffer) * 8
+    if num_bits == 0:
+        return []
+    # Converting the whole buffer to a bit string once avoids extracting each bit separately
+    bit_string = format(int.from_bytes(validity_buffer, "big"), f"0{num_bits}b")
+    if num_vars > 0:
+        bit_string = bit_string[:num_vars]
+    return [bit == "1" for bit in bit_string]
+
+
+def validity_matrix(validity_buffers: Sequence[bytes], num_vars: int) -> "np.ndarray":
+    """Decode the validity buffers of many packets of the same set at once. This requires
+    the optional NumPy dependency, which can be installed with the ``numpy`` extra.
+
+    :param validity_buffers: Validity buffers. Buffers which are shorter than required for the
+        number of variables are padded with invalid flags
+    :param num_vars: Number of variables
+    :return: Boolean NumPy matrix with one row per buffer and one column per variable
+    :raises ImportError: NumPy is not installed
+    """
+    if np is None:
+        raise ImportError(
+            "Decoding a validity matrix requires NumPy. It can be installed with the numpy extra"
+        )
+    buf_len = (num_vars + 7) // 8
+    raw = b"".join(
+        bytes(validity_buffer[:buf_len]).ljust(buf_len, b"\x00")
+        for validity_buffer in validity_buffers
+    )
+    raw_matrix = np.frombuffer(raw, dtype=np.uint8).reshape(
+        len(validity_buffers), buf_len
+    )
+    return np.unpackbits(raw_matrix, axis=1, bitorder="big")[:, :num_vars].astype(bool)
@@ -0,0 +1,274 @@
+"""Catalogs for the object, event and returnvalue CSV files generated for FSFW projects.
+
+The CSV file of a catalog is only parsed if it has changed since the last time it was parsed.
+Otherwise, the parsed entries are loaded from a binary cache file. The catalog is loaded on the
+first lookup, and the info object of an entry is only created when it is looked up.
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import marshal
+import os
+import sys
+import threading
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tmtccmd.logging import get_console_logger
+from tmtccmd.pus.pus_5_event import EventInfo
+from tmtccmd.util.obj_id import ObjectIdU32
+from tmtccmd.util.retval import RetvalInfo
+
+LOGGER = get_console_logger()
+
+CATALOG_CACHE_VERSION = 2
+CACHE_SUFFIX = ".cache"
+
+
+def catalog_cache_dir() -> str:
+    """Per-user directory of the catalog caches. This is ``tmtccmd/catalogs`` in the
+    ``XDG_CACHE_HOME`` directory, which defaults to ``~/.cache``, or in the local application
+    data directory on Windows"""
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base_dir = os.environ["LOCALAPPDATA"]
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+    return os.path.join(base_dir, "tmtccmd", "catalogs")
+
+
+def default_cache_path(csv_file: str) -> str:
+    """The cache files are stored in the :py:func:`catalog_cache_dir`. The name of a cache file
+    contains a hash of the absolute path of the CSV file, so CSV files with the same name in
+    different directories do not share a cache file"""
+    csv_path = os.path.abspath(csv_file)
+    path_hash = hashlib.sha256(csv_path.encode()).hexdigest()[:16]
+    return os.path.join(
+        catalog_cache_dir(),
+        f"{os.path.basename(csv_path)}-{path_hash}{CACHE_SUFFIX}",
+    )
+
+
+class CsvCatalog(Mapping):
+    """Read-only mapping of the entries of a FSFW CSV file.
+
+    The cache is validated with the modification time and size of the CSV file. If these
+    changed, the SHA256 hash of the file content is compared as well, so touching a file does
+    not trigger parsing it again. If the cache file can not be written, caching is skipped and
+    this is only logged with the debug level. The cache is stored with :py:mod:`marshal` and only
+    contains plain dictionaries, tuples, integers, bytes and strings. Unlike a pickled cache, a
+    manipulated cache file can at worst corrupt the catalog entries, but it can not execute code
+    when it is loaded.
+
+    Lookups are thread-safe. The info object of an entry is only created once, even if it is
+    looked up by multiple threads concurrently.
+    """
+
+    # Skip the first row of the CSV file
+    HAS_HEADER = True
+
+    def __init__(
+        self,
+        csv_file: str,
+        cache_path: Optional[str] = None,
+        use_cache: bool = True,
+    ):
+        """
+        :param csv_file: Path of the CSV file
+        :param cache_path: Path of the cache file. Defaults to :py:func:`default_cache_path`
+        :param use_cache: Cache the parsed entries
+        """
+        self.csv_file = csv_file
+        if cache_path is None:
+            cache_path = default_cache_path(csv_file)
+        self.cache_path = cache_path
+        self.use_cache = use_cache
+        self.loaded_from_cache = False
+        self._lock = threading.Lock()
+        self._raw: Optional[Dict[Any, Tuple]] = None
+        self._values: Dict[Any, Any] = dict()
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self.csv_file)
+
+    def load(self):
+        """Load the catalog. This is done automatically on the first lookup, but can be called
+        explicitely to control when the loading time is spent. A missing CSV file results in an
+        empty catalog.
+        """
+        with self._lock:
+            if self._raw is None:
+                self._raw = self._load_raw()
+
+    def __getitem__(self, key):
+        value = self._values.get(key)
+        if value is not None:
+            return value
+        raw = self._entries()[key]
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                value = self.build_value(key, raw)
+                self._values[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def to_dict(self) -> Dict:
+        """Create the info objects of all entries. This is compatible to the dictionaries returned
+        by the ``parse_fsfw_*_csv`` functions"""
+        return {key: self[key] for key in self}
+
+    @classmethod
+    def parse_csv(cls, csv_file: str) -> Dict[Any, Tuple]:
+        """Parse the CSV file into a dictionary of keys to raw entry tuples"""
+        with open(csv_file) as file:
+            csv_reader = csv.reader(file, delimiter=";")
+            if cls.HAS_HEADER:
+                next(csv_reader, None)
+            return dict(cls.parse_rows(csv_reader))
+
+    @classmethod
+    @abstractmethod
+    def parse_rows(cls, rows: Iterable[List[str]]) -> Iterator[Tuple[Any, Tuple]]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def build_value(cls, key, raw: Tuple):
+        pass
+
+    def _entries(self) -> Dict[Any, Tuple]:
+        if self._raw is None:
+            self.load()
+        return self._raw
+
+    def _load_raw(self) -> Dict[Any, Tuple]:
+        try:
+            stat = os.stat(self.csv_file)
+        except FileNotFoundError:
+            LOGGER.warning(f"Catalog file {self.csv_file} does not exist")
+            return dict()
+        if not self.use_cache:
+            return self.parse_csv(self.csv_file)
+        cache = self._read_cache()
+        if cache is not None:
+            if cache["mtime_ns"] == stat.st_mtime_ns and cache["size"] == stat.st_size:
+                self.loaded_from_cache = True
+                return cache["entries"]
+        with open(self.csv_file, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+        if cache is not None and cache["digest"] == digest:
+            entries = cache["entries"]
+            self.loaded_from_cache = True
+        else:
+            entries = self.parse_csv(self.csv_file)
+        self._write_cache(stat, digest, entries)
+        return entries
+
+    def _read_cache(self) -> Optional[Dict]:
+        try:
+            with open(self.cache_path, "rb") as file:
+                cache = marshal.loads(file.read())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            LOGGER.warning(f"Invalid catalog cache {self.cache_path}: {e}")
+            return None
+        if (
+            not isinstance(cache, dict)
+            or cache.get("version") != CATALOG_CACHE_VERSION
+            or cache.get("kind") != self.__class__.__name__
+            or not isinstance(cache.get("entries"), dict)
+        ):
+            return None
+        return cache
+
+    def _write_cache(self, stat: os.stat_result, digest: str, entries: Dict):
+        cache = {
+            "version": CATALOG_CACHE_VERSION,
+            "kind": self.__class__.__name__,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": digest,
+            "entries": entries,
+        }
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                marshal.dump(cache, file)
+            # Replacing the file ensures that other processes never read a partial cache
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            LOGGER.debug(f"Could not write catalog cache {self.cache_path}: {e}")
+
+
+class ObjectCatalog(CsvCatalog):
+    """Catalog of object IDs keyed by the raw 4 byte object ID, compatible to
+    :py:data:`tmtccmd.util.obj_id.ObjectIdDictT`"""
+
+    HAS_HEADER = False
+
+    @classmethod
+    def parse_rows(cls, rows: Iterable[List[str]]) -> Iterator[Tuple[bytes, Tuple]]:
+        for row in rows:
+            obj_id = int(row[0], 16)
+            yield obj_id.to_bytes(4, "big"), (obj_id, row[1])
+
+    @classmethod
+    def build_value(cls, key: bytes, raw: Tuple) -> ObjectIdU32:
+        return ObjectIdU32(*raw)
+
+
+class EventCatalog(CsvCatalog):
+    """Catalog of events keyed by the event ID, compatible to
+    :py:data:`tmtccmd.pus.pus_5_event.EventDictT`"""
+
+    @classmethod
+    def parse_rows(cls, rows: Iterable[List[str]]) -> Iterator[Tuple[int, Tuple]]:
+        for row in rows:
+            yield int(row[0]), (row[2], row[3], row[4], row[5])
+
+    @classmethod
+    def build_value(cls, key: int, raw: Tuple) -> EventInfo:
+        info = EventInfo()
+        info.id = key
+        info.name, info.severity, info.info, info.file_location = raw
+        return info
+
+
+class RetvalCatalog(CsvCatalog):
+    """Catalog of returnvalues keyed by the returnvalue ID, compatible to
+    :py:data:`tmtccmd.util.retval.RetvalDictT`"""
+
+    @classmethod
+    def parse_rows(cls, rows: Iterable[List[str]]) -> Iterator[Tuple[int, Tuple]]:
+        for row in rows:
+            id_col = row[0]
+            # Parse hex
+            if "0x" in id_col:
+                retval_id = int(id_col, 0)
+            else:
+                retval_id = int(id_col, 16)
+            yield retval_id, (row[1], row[2], row[5])
+
+    @classmethod
+    def build_value(cls, key: int, raw: Tuple) -> RetvalInfo:
+        info = RetvalInfo()
+        info.id = key
+        info.name, info.info, info.if_name = raw
+        return info
@@ -0,0 +1,542 @@
+"""Binary archive for raw telecommands and telemetry packets.
+
+Compared to the raw PUS text log, the archive stores the raw packets directly as length-prefixed
+records. Each record contains the receive or send timestamp, the direction, the APID and the
+PUS service and subservice. A sidecar index file with one fixed-size entry per record allows
+time range and APID queries without reading the archive. The archive files rotate like the
+:py:class:`tmtccmd.logging.pus.RawTmtcTimedLogWrapper`.
+"""
+from __future__ import annotations
+
+import bisect
+import calendar
+import enum
+import mmap
+import struct
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from spacepackets.ccsds.spacepacket import APID_MASK
+
+from tmtccmd.logging import LOG_DIR
+from tmtccmd.logging.pus import TimedLogWhen
+
+ARCHIVE_BASE_NAME = "tmtc-archive"
+ARCHIVE_SUFFIX = ".tmtca"
+INDEX_SUFFIX = ".idx"
+ARCHIVE_VERSION = 1
+
+_ARCHIVE_MAGIC = b"TMTCARCH"
+_INDEX_MAGIC = b"TMTCAIDX"
+# Magic (8), version (2) and reserved (2)
+_FILE_HEADER_STRUCT = struct.Struct("!8sHH")
+FILE_HEADER_LEN = _FILE_HEADER_STRUCT.size
+# Packet length (4), timestamp (8), direction (1), APID (2), service (1) and subservice (1)
+_RECORD_HEADER_STRUCT = struct.Struct("!IdBHBB")
+RECORD_HEADER_LEN = _RECORD_HEADER_STRUCT.size
+# Record offset (8), timestamp (8), APID (2) and direction (1)
+_INDEX_ENTRY_STRUCT = struct.Struct("!QdHB")
+INDEX_ENTRY_LEN = _INDEX_ENTRY_STRUCT.size
+_ROTATION_SECONDS = {
+    TimedLogWhen.PER_SECOND: 1,
+    TimedLogWhen.PER_MINUTE: 60,
+    TimedLogWhen.PER_HOUR: 3600,
+    TimedLogWhen.PER_DAY: 86400,
+}
+# UTC start time of the rotation period in the file names
+_FILE_TIME_FMT = "%Y%m%d_%H%M%S"
+_FILE_TIME_LEN = 15
+_SEC_HEADER_FLAG_MASK = 0x08
+_SERVICE_IDX = 7
+_SUBSERVICE_IDX = 8
+
+
+class ArchiveDirection(enum.IntEnum):
+    TM = 0
+    TC = 1
+
+
+class ArchiveRecord(NamedTuple):
+    # Unix timestamp in seconds
+    timestamp: float
+    direction: ArchiveDirection
+    apid: int
+    # Service and subservice are 0 for packets without a secondary header
+    service: int
+    subservice: int
+    raw: bytes
+
+
+# Record offset, timestamp, APID and direction
+_IndexEntry = Tuple[int, float, int, int]
+
+
+def pus_packet_fields(raw: bytes) -> Tuple[int, int, int]:
+    """Retrieve the APID, service and subservice of a raw PUS packet. Service and subservice are
+    0 for packets without a secondary header.
+
+    :raises ValueError: Packet too short for a space packet header
+    """
+    if len(raw) < 6:
+        raise ValueError(f"Packet with length {len(raw)} too short for a space packet")
+    apid = ((raw[0] << 8) | raw[1]) & APID_MASK
+    if raw[0] & _SEC_HEADER_FLAG_MASK and len(raw) > _SUBSERVICE_IDX:
+        return apid, raw[_SERVICE_IDX], raw[_SUBSERVICE_IDX]
+    return apid, 0, 0
+
+
+def index_path(archive_path: Union[str, Path]) -> Path:
+    return Path(f"{archive_path}{INDEX_SUFFIX}")
+
+
+def archive_file_start(archive_path: Union[str, Path]) -> Optional[float]:
+    """Start time of the rotation period of an archive file, which is encoded in its name.
+
+    :return: None if the name does not contain a valid time
+    """
+    stem = Path(archive_path).name[: -len(ARCHIVE_SUFFIX)]
+    try:
+        return float(
+            calendar.timegm(time.strptime(stem[-_FILE_TIME_LEN:], _FILE_TIME_FMT))
+        )
+    except ValueError:
+        return None
+
+
+def archive_files(
+    directory: Union[str, Path] = LOG_DIR, base_name: str = ARCHIVE_BASE_NAME
+) -> List[Path]:
+    """All archive files with the given base name in a directory, sorted by time"""
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    files = [
+        path
+        for path in directory.glob(f"{base_name}_*{ARCHIVE_SUFFIX}")
+        if archive_file_start(path) is not None
+    ]
+    return sorted(files, key=lambda path: archive_file_start(path))
+
+
+def archive_files_in_range(
+    directory: Union[str, Path] = LOG_DIR,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    base_name: str = ARCHIVE_BASE_NAME,
+) -> List[Path]:
+    """Archive files in a directory which can contain records in a time range. Files are
+    selected based on the start times in their names, so the files are not opened."""
+    files = archive_files(directory, base_name)
+    selected = []
+    for idx, path in enumerate(files):
+        if end is not None and archive_file_start(path) >= end:
+            break
+        if (
+            start is not None
+            and idx + 1 < len(files)
+            and archive_file_start(files[idx + 1]) <= start
+        ):
+            continue
+        selected.append(path)
+    return selected
+
+
+def _check_file_header(header: bytes, magic: bytes, path: Union[str, Path]):
+    if len(header) < FILE_HEADER_LEN:
+        raise ValueError(f"File {path} too short for the file header")
+    file_magic, version, _ = _FILE_HEADER_STRUCT.unpack_from(header)
+    if file_magic != magic:
+        raise ValueError(f"File {path} is not a packet archive file")
+    if version != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported version {version} of packet archive file {path}")
+
+
+def _scan_records(
+    data: Union[bytes, mmap.mmap], offset: int
+) -> Iterator[Tuple[_IndexEntry, int]]:
+    """Yield the index entries and end offsets of all complete records after the given offset.
+    A partially written record at the end of the data is ignored."""
+    data_len = len(data)
+    while offset + RECORD_HEADER_LEN <= data_len:
+        (
+            packet_len,
+            timestamp,
+            direction,
+            apid,
+            _,
+            _,
+        ) = _RECORD_HEADER_STRUCT.unpack_from(data, offset)
+        end = offset + RECORD_HEADER_LEN + packet_len
+        if end > data_len:
+            return
+        yield (offset, timestamp, apid, direction), end
+        offset = end
+
+
+def _read_index_entries(path: Path, archive_len: int) -> List[_IndexEntry]:
+    """Read all entries of an index file which point to complete records"""
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return []
+    try:
+        _check_file_header(data, _INDEX_MAGIC, path)
+    except ValueError:
+        return []
+    num_entries = (len(data) - FILE_HEADER_LEN) // INDEX_ENTRY_LEN
+    entries = list(
+        _INDEX_ENTRY_STRUCT.iter_unpack(
+            memoryview(data)[
+                FILE_HEADER_LEN : FILE_HEADER_LEN + num_entries * INDEX_ENTRY_LEN
+            ]
+        )
+    )
+    # The index may have been written before the archive was flushed
+    while entries and entries[-1][0] + RECORD_HEADER_LEN > archive_len:
+        entries.pop()
+    return entries
+
+
+def _load_index(
+    archive_path: Path, data: Union[bytes, mmap.mmap]
+) -> Tuple[List[_IndexEntry], int, bool]:
+    """Load the index of an archive and add all records which are missing in the index file.
+
+    :return: Index entries, end offset of the last complete record and whether the index file
+        was incomplete
+    """
+    entries = _read_index_entries(index_path(archive_path), len(data))
+    scan_offset = FILE_HEADER_LEN
+    if entries:
+        last_offset = entries[-1][0]
+        last_len = _RECORD_HEADER_STRUCT.unpack_from(data, last_offset)[0]
+        scan_offset = last_offset + RECORD_HEADER_LEN + last_len
+        if scan_offset > len(data):
+            # Last indexed record was not written completely
+            scan_offset = entries.pop()[0]
+    incomplete = False
+    for entry, end in _scan_records(data, scan_offset):
+        entries.append(entry)
+        scan_offset = end
+        incomplete = True
+    return entries, scan_offset, incomplete
+
+
+class PacketArchiveWriter:
+    """Writes raw packets into binary archive files which rotate at fixed UTC aligned periods.
+    The archive file names contain the UTC start time of their period. Writing to an existing
+    archive file appends to it, and an incomplete index file is rebuilt.
+
+    The records must be written in time order, because the readers look up time ranges with
+    a binary search.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = LOG_DIR,
+        when: TimedLogWhen = TimedLogWhen.PER_HOUR,
+        interval: int = 1,
+        base_name: str = ARCHIVE_BASE_NAME,
+    ):
+        """
+        :param directory: Directory of the archive files. It is created if it does not exist
+        :param when: A new archive file will be created at the product of when and interval
+        :param interval: A new archive file will be created at the product of when and interval
+        :param base_name: Base name of the archive files
+        """
+        if interval < 1:
+            raise ValueError(f"Invalid rotation interval {interval}")
+        self.directory = Path(directory)
+        self.base_name = base_name
+        self.rotation_seconds = _ROTATION_SECONDS[when] * interval
+        self.file_name: Optional[Path] = None
+        self._lock = threading.Lock()
+        self._archive: Optional[BinaryIO] = None
+        self._index: Optional[BinaryIO] = None
+        self._offset = 0
+        self._period_end = 0.0
+        self._last_timestamp = float("-inf")
+
+    def write_tm(self, raw: bytes, timestamp: Optional[float] = None):
+        self.write(raw, ArchiveDirection.TM, timestamp)
+
+    def write_tc(self, raw: bytes, timestamp: Optional[float] = None):
+        self.write(raw, ArchiveDirection.TC, timestamp)
+
+    def write(
+        self,
+        raw: bytes,
+        direction: ArchiveDirection,
+        timestamp: Optional[float] = None,
+    ):
+        """Append a raw packet to the archive.
+
+        :param raw: Raw space packet
+        :param direction: Whether the packet is a received TM or a sent TC
+        :param timestamp: Unix timestamp of the packet. Defaults to the current time
+        :raises ValueError: Packet too short for a space packet header or timestamp earlier than
+            the timestamp of the last record
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        apid, service, subservice = pus_packet_fields(raw)
+        record_header = _RECORD_HEADER_STRUCT.pack(
+            len(raw), timestamp, direction, apid, service, subservice
+        )
+        with self._lock:
+            if self._archive is None or timestamp >= self._period_end:
+                self._rotate(timestamp)
+            if timestamp < self._last_timestamp:
+                raise ValueError(
+                    f"Timestamp {timestamp} is earlier than the timestamp "
+                    f"{self._last_timestamp} of the last record in {self.file_name}"
+                )
+            self._last_timestamp = timestamp
+            self._archive.write(record_header)
+            self._archive.write(raw)
+            self._index.write(
+                _INDEX_ENTRY_STRUCT.pack(self._offset, timestamp, apid, direction)
+            )
+            self._offset += RECORD_HEADER_LEN + len(raw)
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            self._close_files()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _flush(self):
+        if self._archive is not None:
+            # Flush the archive first, so the index never points behind the archive
+            self._archive.flush()
+            self._index.flush()
+
+    def _close_files(self):
+        self._flush()
+        if self._archive is not None:
+            self._archive.close()
+            self._index.close()
+            self._archive = None
+            self._index = None
+
+    def _rotate(self, timestamp: float):
+        self._close_files()
+        period_start = int(timestamp) // self.rotation_seconds * self.rotation_seconds
+        self._period_end = float(period_start + self.rotation_seconds)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.file_name = self.directory / (
+            f"{self.base_name}_"
+            f"{time.strftime(_FILE_TIME_FMT, time.gmtime(period_start))}{ARCHIVE_SUFFIX}"
+        )
+        self._open_files(self.file_name)
+
+    def _open_files(self, path: Path):
+        header_len = 0
+        if path.exists():
+            header_len = min(path.stat().st_size, FILE_HEADER_LEN)
+        if header_len < FILE_HEADER_LEN:
+            with open(path, "wb") as file:
+                file.write(_FILE_HEADER_STRUCT.pack(_ARCHIVE_MAGIC, ARCHIVE_VERSION, 0))
+            with open(index_path(path), "wb") as file:
+                file.write(_FILE_HEADER_STRUCT.pack(_INDEX_MAGIC, ARCHIVE_VERSION, 0))
+            self._offset = FILE_HEADER_LEN
+            self._last_timestamp = float("-inf")
+        else:
+            self._offset, self._last_timestamp = self._repair(path)
+        self._archive = open(path, "ab")
+        self._index = open(index_path(path), "ab")
+
+    @staticmethod
+    def _repair(path: Path) -> Tuple[int, float]:
+        """Prepare an existing archive file for appending. A partially written record at the end
+        is removed and the index file is rebuilt if it is incomplete.
+
+        :return: End offset and timestamp of the last complete record
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        _check_file_header(data, _ARCHIVE_MAGIC, path)
+        entries, end, incomplete = _load_index(path, data)
+        if end < len(data):
+            with open(path, "r+b") as file:
+                file.truncate(end)
+        idx_path = index_path(path)
+        expected_index_len = FILE_HEADER_LEN + len(entries) * INDEX_ENTRY_LEN
+        if (
+            incomplete
+            or not idx_path.exists()
+            or idx_path.stat().st_size != expected_index_len
+        ):
+            with open(idx_path, "wb") as file:
+                file.write(_FILE_HEADER_STRUCT.pack(_INDEX_MAGIC, ARCHIVE_VERSION, 0))
+                for entry in entries:
+                    file.write(_INDEX_ENTRY_STRUCT.pack(*entry))
+        return end, entries[-1][1] if entries else float("-inf")
+
+
+class PacketArchiveReader:
+    """Memory-mapped random access to the records of a single archive file.
+
+    The index file is used to look up records by their position, time and APID without
+    reading the archive. Records which are missing in the index, for example because the
+    writer did not flush the index, are found by scanning the end of the archive. The records
+    are in time order, which is enforced by :py:class:`PacketArchiveWriter`.
+    """
+
+    def __init__(self, archive_path: Union[str, Path]):
+        """
+        :raises ValueError: Not a packet archive file or unsupported version
+        """
+        self.archive_path = Path(archive_path)
+        self._view: Optional[memoryview] = None
+        self._file = open(self.archive_path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            _check_file_header(self._mmap, _ARCHIVE_MAGIC, self.archive_path)
+        except (ValueError, OSError):
+            self.close()
+            raise
+        entries, _, _ = _load_index(self.archive_path, self._mmap)
+        offsets, timestamps, apids, directions = (), (), (), ()
+        if entries:
+            offsets, timestamps, apids, directions = zip(*entries)
+        self._offsets = array("Q", offsets)
+        self._timestamps = array("d", timestamps)
+        self._apids = array("H", apids)
+        self._directions = array("B", directions)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, idx: int) -> ArchiveRecord:
+        return self.record(idx)
+
+    def __iter__(self) -> Iterator[ArchiveRecord]:
+        return self.records()
+
+    @property
+    def time_range(self) -> Optional[Tuple[float, float]]:
+        """Timestamps of the first and last record. None for an empty archive"""
+        if not self._timestamps:
+            return None
+        return self._timestamps[0], self._timestamps[-1]
+
+    def record(self, idx: int, zero_copy: bool = False) -> ArchiveRecord:
+        """Retrieve a record by its position in the archive.
+
+        :param idx: Position of the record
+        :param zero_copy: The raw packet is a memoryview into the memory-mapped archive instead
+            of a copy. The archive file stays mapped until all views were released, even if the
+            reader is closed
+        """
+        return self._read_record(self._offsets[idx], zero_copy)
+
+    def records(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        apid: Optional[int] = None,
+        direction: Optional[ArchiveDirection] = None,
+        zero_copy: bool = False,
+    ) -> Iterator[ArchiveRecord]:
+        """Iterate over the records in a time range. The filters only use the index, so records
+        which are filtered out are not read.
+
+        :param start: Only records with a timestamp at or after start
+        :param end: Only records with a timestamp before end
+        :param apid: Only records with this APID
+        :param direction: Only records with this direction
+        :param zero_copy: See :py:meth:`record`
+        """
+        first, last = self.index_range(start, end)
+        for idx in range(first, last):
+            if apid is not None and self._apids[idx] != apid:
+                continue
+            if direction is not None and self._directions[idx] != direction:
+                continue
+            yield self._read_record(self._offsets[idx], zero_copy)
+
+    def index_range(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """Range of record indexes for a time range, found with a binary search"""
+        first = 0 if start is None else bisect.bisect_left(self._timestamps, start)
+        last = (
+            len(self._timestamps)
+            if end is None
+            else bisect.bisect_left(self._timestamps, end)
+        )
+        return first, max(first, last)
+
+    def close(self):
+        if getattr(self, "_mmap", None) is not None:
+            try:
+                if self._view is not None:
+                    self._view.release()
+                self._mmap.close()
+            except BufferError:
+                # Zero-copy records are still in use. The mapping is closed when the last
+                # view is garbage collected
+                pass
+            self._view = None
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _read_record(self, offset: int, zero_copy: bool = False) -> ArchiveRecord:
+        (
+            packet_len,
+            timestamp,
+            direction,
+            apid,
+            service,
+            subservice,
+        ) = _RECORD_HEADER_STRUCT.unpack_from(self._mmap, offset)
+        raw_start = offset + RECORD_HEADER_LEN
+        if zero_copy:
+            if self._view is None:
+                self._view = memoryview(self._mmap)
+            raw = self._view[raw_start : raw_start + packet_len]
+        else:
+            raw = self._mmap[raw_start : raw_start + packet_len]
+        return ArchiveRecord(
+            timestamp=timestamp,
+            direction=ArchiveDirection(direction),
+            apid=apid,
+            service=service,
+            subservice=subservice,
+            raw=raw,
+        )
+
+
+def read_archive(
+    directory: Union[str, Path] = LOG_DIR,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    apid: Optional[int] = None,
+    direction: Optional[ArchiveDirection] = None,
+    base_name: str = ARCHIVE_BASE_NAME,
+) -> Iterator[ArchiveRecord]:
+    """Iterate over the records of all archive files in a directory in a time range. See
+    :py:meth:`PacketArchiveReader.records` for the parameters.
+    """
+    for path in archive_files_in_range(directory, start, end, base_name):
+        with PacketArchiveReader(path) as reader:
+            yield from reader.records(start, end, apid, direction)
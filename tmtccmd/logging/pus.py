@@ -1,13 +1,22 @@
 from __future__ import annotations
+import atexit
 import enum
 import logging
+import queue
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional, Union
 from datetime import datetime
 
 from spacepackets.ecss import PusTelecommand, PusTelemetry
 from tmtccmd.logging import LOG_DIR
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from logging import FileHandler
 
 RAW_PUS_LOGGER_NAME = "pus-log"
@@ -19,6 +28,12 @@ TMTC_FILE_BASE_NAME = TMTC_LOGGER_NAME
 __TMTC_LOGGER: Optional[logging.Logger] = None
 __RAW_PUS_LOGGER: Optional[logging.Logger] = None
 
+RAW_PUS_LOG_FMT = "%(asctime)s.%(msecs)03d: %(message)s"
+RAW_PUS_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Log wrappers in background mode, which write their queued packets at exit
+_BACKGROUND_LOGS: weakref.WeakSet = weakref.WeakSet()
+
 
 def date_suffix() -> str:
     return f"{datetime.now().date()}"
@@ -31,30 +46,154 @@ class TimedLogWhen(enum.Enum):
     PER_DAY = "D"
 
 
+class _ReadableHex:
+    """Formats raw bytes as readable hex only when the log record is formatted"""
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+
+    def __str__(self):
+        return self.raw.hex(sep=",")
+
+
+class _RawPusQueueHandler(QueueHandler):
+    """Queues the records unformatted, so the messages are formatted by the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _RawPusQueueListener(QueueListener):
+    """Queue listener which also sets the events used to flush the queue"""
+
+    def handle(self, record: Union[logging.LogRecord, threading.Event]):
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        super().handle(record)
+
+
 class RawTmtcLogBase:
+    """Logs the representation and the raw bytes of PUS packets.
+
+    By default, all lines are formatted and written by the calling thread. In background mode,
+    the handler of the wrapper is replaced by a :py:class:`logging.handlers.QueueHandler` and
+    a :py:class:`logging.handlers.QueueListener` thread formats the records and writes them
+    with the handler. The log hooks only create the records, so the representations of the
+    packets are formatted by the listener thread. The packets should therefore not be
+    modified after logging them in background mode.
+    """
+
     def __init__(
-        self, logger: logging.Logger, log_repr: bool = True, log_raw_repr: bool = True
+        self,
+        logger: logging.Logger,
+        log_repr: bool = True,
+        log_raw_repr: bool = True,
+        handler: Optional[logging.Handler] = None,
+        background: bool = False,
     ):
+        """
+        :param logger: Logger used to write the lines
+        :param log_repr: Log the Python representation of the packets
+        :param log_raw_repr: Log the Python representation of the raw bytes
+        :param handler: Handler of the logger which writes the lines of this wrapper. It is
+            required for the background mode
+        :param background: Format and write the lines in a dedicated thread, see
+            :py:meth:`start_background`
+        """
         self.logger = logger
+        self.handler = handler
         self.do_log_repr = log_repr
         self.do_log_raw_repr = log_raw_repr
         self.counter = 0
+        self._queue_handler: Optional[_RawPusQueueHandler] = None
+        self._listener: Optional[_RawPusQueueListener] = None
+        if background:
+            self.start_background()
+
+    @property
+    def background(self) -> bool:
+        return self._listener is not None
 
-    def log_tc(self, packet: PusTelecommand):
-        """Default log function which logs the Python packet representation and raw bytes"""
+    def start_background(self):
+        """Replace the handler of the wrapper with a queue handler and start the listener
+        thread which writes the queued records with the handler.
+
+        :raises ValueError: The wrapper has no handler
+        """
+        if self._listener is not None:
+            return
+        if self.handler is None:
+            raise ValueError(
+                "Background mode requires the handler of the raw PUS logger"
+            )
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = _RawPusQueueHandler(log_queue)
+        self._listener = _RawPusQueueListener(log_queue, self.handler)
+        self._listener.start()
+        self.logger.addHandler(self._queue_handler)
+        self.logger.removeHandler(self.handler)
+        # Do not lose queued packets when the application exits
+        _BACKGROUND_LOGS.add(self)
+
+    def stop_background(self):
+        """Write all queued packets and stop the listener thread. Packets logged afterwards
+        are written by the calling thread again"""
+        if self._listener is None:
+            return
+        self.logger.addHandler(self.handler)
+        self.logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._listener = None
+        self._queue_handler = None
+        _BACKGROUND_LOGS.discard(self)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all packets logged so far have been written.
+
+        :return: False if the timeout expired before all packets were written
+        """
+        queue_handler = self._queue_handler
+        if queue_handler is None:
+            return True
+        written = threading.Event()
+        queue_handler.queue.put(written)
+        return written.wait(timeout)
+
+    def log_tc(self, packet: PusTelecommand, raw: Optional[bytes] = None):
+        """Default log function which logs the Python packet representation and raw bytes
+
+        :param packet: Telecommand to log
+        :param raw: Raw telecommand. Passing it avoids packing the telecommand again
+        """
         prefix = self.tc_prefix(packet, self.counter)
         if self.do_log_repr:
             self.log_repr(prefix, packet)
-        raw_bytes = packet.pack()
-        self.__log_raw_inc_counter(prefix, raw_bytes)
+        self.__log_raw_inc_counter(prefix, self.__raw(packet, raw))
+
+    def log_tm(self, packet: PusTelemetry, raw: Optional[bytes] = None):
+        """Default log function which logs the Python packet representation and raw bytes
 
-    def log_tm(self, packet: PusTelemetry):
-        """Default log function which logs the Python packet representation and raw bytes"""
+        :param packet: Telemetry packet to log
+        :param raw: Raw telemetry packet. Passing it avoids packing the packet again
+        """
         prefix = self.tm_prefix(packet, self.counter)
         if self.do_log_repr:
             self.log_repr(prefix, packet)
-        raw_bytes = packet.pack()
-        self.__log_raw_inc_counter(prefix, raw_bytes)
+        self.__log_raw_inc_counter(prefix, self.__raw(packet, raw))
+
+    def __raw(
+        self, packet: Union[PusTelecommand, PusTelemetry], raw: Optional[bytes]
+    ) -> bytes:
+        if raw is None:
+            return packet.pack()
+        if self._listener is not None and not isinstance(raw, bytes):
+            # The raw bytes are formatted later, so copy mutable buffers, but keep their type
+            # for the bytes representation
+            return bytearray(raw)
+        return raw
 
     def __log_raw_inc_counter(self, prefix: str, raw: bytes):
         self.log_bytes_readable(prefix, raw)
@@ -63,7 +202,7 @@ class RawTmtcLogBase:
         self.counter += 1
 
     def log_repr(self, prefix: str, packet: Union[PusTelecommand, PusTelemetry]):
-        self.logger.info(f"{prefix} repr: {packet!r}")
+        self.logger.info("%s repr: %r", prefix, packet)
 
     @staticmethod
     def tc_prefix(packet: PusTelecommand, counter: int):
@@ -74,10 +213,28 @@ class RawTmtcLogBase:
         return f"tm {counter} [{packet.service}, {packet.subservice}]"
 
     def log_bytes_readable(self, prefix: str, packet: bytes):
-        self.logger.info(f"{prefix} raw readable hex: [{packet.hex(sep=',')}]")
+        self.logger.info("%s raw readable hex: [%s]", prefix, _ReadableHex(packet))
 
     def log_bytes_repr(self, prefix: str, packet: bytes):
-        self.logger.info(f"{prefix} raw repr: {packet!r}")
+        self.logger.info("%s raw repr: %r", prefix, packet)
+
+
+def _stop_background_logs():
+    for raw_log in list(_BACKGROUND_LOGS):
+        raw_log.stop_background()
+
+
+atexit.register(_stop_background_logs)
+
+
+def _raw_pus_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(RAW_PUS_LOGGER_NAME)
+    handler.setFormatter(
+        logging.Formatter(fmt=RAW_PUS_LOG_FMT, datefmt=RAW_PUS_LOG_DATEFMT)
+    )
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    return logger
 
 
 class RawTmtcTimedLogWrapper(RawTmtcLogBase):
@@ -86,6 +243,7 @@ class RawTmtcTimedLogWrapper(RawTmtcLogBase):
         when: TimedLogWhen,
         interval: int,
         file_name: Path = Path(f"{LOG_DIR}/{RAW_PUS_FILE_BASE_NAME}.log"),
+        background: bool = False,
     ):
         """Create a raw TMTC timed rotating log wrapper.
         See the official Python documentation at
@@ -97,19 +255,21 @@ class RawTmtcTimedLogWrapper(RawTmtcLogBase):
             For example, using when="H" and interval=3, a new log file will be created in three
             hour intervals
         :param file_name: Base filename of the log file
+        :param background: Format and write the log in a dedicated thread, see
+            :py:class:`RawTmtcLogBase`
         """
-        logger = logging.getLogger(RAW_PUS_LOGGER_NAME)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s.%(msecs)03d: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
         handler = TimedRotatingFileHandler(
             filename=file_name, when=when.value, interval=interval
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        logger = _raw_pus_logger(handler)
         self.file_name = handler.baseFilename
-        super().__init__(logger)
+        super().__init__(logger, handler=handler, background=background)
+
+    def close(self):
+        """Write all queued packets and remove the file handler from the logger"""
+        self.stop_background()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
 
 
 class RawTmtcRotatingLogWrapper(RawTmtcLogBase):
@@ -119,6 +279,7 @@ class RawTmtcRotatingLogWrapper(RawTmtcLogBase):
         backup_count: int,
         file_name: Path = Path(f"{LOG_DIR}/{RAW_PUS_FILE_BASE_NAME}"),
         suffix: str = date_suffix(),
+        background: bool = False,
     ):
         """Create a raw TMTC rotating log wrapper.
         See the official Python documentation at
@@ -135,21 +296,23 @@ class RawTmtcRotatingLogWrapper(RawTmtcLogBase):
         :param suffix: Suffix of the log file. Can be used to change the used log file. The default
             argument will use a date suffix, which will lead to a new unique rotating log created
             every day
+        :param background: Format and write the log in a dedicated thread, see
+            :py:class:`RawTmtcLogBase`
         """
-        logger = logging.getLogger(RAW_PUS_LOGGER_NAME)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s.%(msecs)03d: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
         handler = RotatingFileHandler(
             filename=f"{file_name}_{suffix}.log",
             maxBytes=max_bytes,
             backupCount=backup_count,
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        logger = _raw_pus_logger(handler)
         self.file_name = handler.baseFilename
-        super().__init__(logger)
+        super().__init__(logger, handler=handler, background=background)
+
+    def close(self):
+        """Write all queued packets and remove the file handler from the logger"""
+        self.stop_background()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
 
 
 class RegularTmtcLogWrapper:
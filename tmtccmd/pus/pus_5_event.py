@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from typing import Optional, Dict
 from spacepackets.ecss.pus_5_event import Severity
 
+from tmtccmd.util.obj_id import ObjectIdDictT
+
 
 def str_to_severity(string: str) -> Optional[Severity]:
     if string == "INFO":
@@ -22,3 +26,75 @@ class EventInfo:
 
 
 EventDictT = Dict[int, EventInfo]
+
+
+class EventInfoIndex:
+    """Index for resolving the information of received events, for example from the event and
+    object CSV files generated for a FSFW project. The severities and reporter names are
+    resolved once when building the index, so each lookup is a single dictionary access.
+
+    >>> info = EventInfo()
+    >>> info.id, info.name, info.severity = 2200, "MODE_TRANSITION_FAILED", "LOW"
+    >>> index = EventInfoIndex({info.id: info})
+    >>> index.event_name(2200)
+    'MODE_TRANSITION_FAILED'
+    >>> index.severity(2200)
+    <Severity.LOW: 2>
+    >>> index.reporter_name(0x44000001)
+    'Unknown'
+    """
+
+    UNKNOWN_NAME = "Unknown"
+
+    def __init__(self, events: EventDictT, objects: Optional[ObjectIdDictT] = None):
+        self._events: EventDictT = dict(events)
+        self._severities: Dict[int, Optional[Severity]] = {
+            event_id: str_to_severity(info.severity)
+            for event_id, info in self._events.items()
+        }
+        self._reporter_names: Dict[int, str] = dict()
+        if objects is not None:
+            for obj_id in objects.values():
+                self._reporter_names[obj_id.obj_id] = obj_id.name
+
+    @classmethod
+    def from_csv(
+        cls, events_csv: str, objects_csv: Optional[str] = None
+    ) -> Optional[EventInfoIndex]:
+        """Build the index from FSFW CSV files.
+
+        :return: None if the events file does not exist
+        """
+        from tmtccmd.fsfw import parse_fsfw_events_csv, parse_fsfw_objects_csv
+
+        events = parse_fsfw_events_csv(events_csv)
+        if events is None:
+            return None
+        objects = None
+        if objects_csv is not None:
+            objects = parse_fsfw_objects_csv(objects_csv)
+        return cls(events, objects)
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, event_id: int):
+        return event_id in self._events
+
+    def event_info(self, event_id: int) -> Optional[EventInfo]:
+        return self._events.get(event_id)
+
+    def event_name(self, event_id: int) -> str:
+        info = self._events.get(event_id)
+        if info is None:
+            return self.UNKNOWN_NAME
+        return info.name
+
+    def severity(self, event_id: int) -> Optional[Severity]:
+        return self._severities.get(event_id)
+
+    def reporter_name(self, reporter_id: int) -> str:
+        """
+        :param reporter_id: Object ID of the reporter as an integer
+        """
+        return self._reporter_names.get(reporter_id, self.UNKNOWN_NAME)
@@ -9,6 +9,8 @@ from .queue import (
     SpacePacketEntry,
     PusTcEntry,
     RawTcEntry,
+    CompiledTcEntry,
+    CompiledTcBuffer,
     PacketDelayEntry,
     LogQueueEntry,
 )
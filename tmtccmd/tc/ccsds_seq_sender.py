@@ -1,5 +1,6 @@
 """Used to send multiple TCs in sequence"""
 import enum
+import time
 from datetime import timedelta
 from typing import Optional
 
@@ -13,7 +14,7 @@ from tmtccmd.tc.handler import TcHandlerBase, SendCbParams
 from tmtccmd.tc.queue import QueueWrapper
 from tmtccmd.com_if import ComInterface
 from tmtccmd.logging import get_console_logger
-from tmtccmd.util.countdown import Countdown
+from tmtccmd.util.countdown import Deadline
 
 LOGGER = get_console_logger()
 
@@ -27,6 +28,9 @@ class SeqResultWrapper:
     def __init__(self, mode: SenderMode):
         self.mode = mode
         self.longest_rem_delay: timedelta = timedelta()
+        # Absolute time in time.monotonic() seconds at which the sender should be called next.
+        # None if the sender does not have to be called again for the current delays.
+        self.next_wake_time: Optional[float] = None
         self.tc_sent: bool = False
         self.queue_empty: bool = False
         self.next_entry_is_tc: bool = False
@@ -48,8 +52,8 @@ class SequentialCcsdsSender:
         self._queue_wrapper = queue_wrapper
         self._proc_wrapper = ProcedureWrapper(None)
         self._mode = SenderMode.DONE
-        self._wait_cd = Countdown(None)
-        self._send_cd = Countdown(queue_wrapper.inter_cmd_delay)
+        self._wait_cd = Deadline()
+        self._send_cd = Deadline(queue_wrapper.inter_cmd_delay)
         self._current_res = SeqResultWrapper(self._mode)
         self._current_res.longest_rem_delay = queue_wrapper.inter_cmd_delay
         self._op_divider = 0
@@ -68,7 +72,7 @@ class SequentialCcsdsSender:
         self._mode = SenderMode.BUSY
         # There is no need to delay sending of the first entry, the send delay is inter-packet
         # only
-        self._send_cd.timeout = timedelta()
+        self._send_cd.time_out()
         self._current_res.longest_rem_delay = queue_wrapper.inter_cmd_delay
         self._proc_wrapper.base = self._queue_wrapper.info
         self._queue_wrapper = queue_wrapper
@@ -89,6 +93,8 @@ class SequentialCcsdsSender:
 
         :param com_if: Communication interface used to send telecommands. Will be passed to the
             user send function
+        :return: Result wrapper. The :py:attr:`SeqResultWrapper.next_wake_time` field
+            can be used to sleep precisely until the next queue entry can be handled
         """
         self._handle_current_tc_queue(com_if)
         self._current_res.mode = self._mode
@@ -110,6 +116,8 @@ class SequentialCcsdsSender:
                 # cache this for last wait time
                 self._tc_handler.queue_finished_cb(self._proc_wrapper)
                 self._mode = SenderMode.DONE
+                self._current_res.next_wake_time = None
+                self._current_res.longest_rem_delay = timedelta()
                 return
         else:
             self._current_res.queue_empty = False
@@ -146,10 +154,7 @@ class SequentialCcsdsSender:
                 )
             )
             if is_tc:
-                if self.queue_wrapper.inter_cmd_delay != self._send_cd.timeout:
-                    self._send_cd.reset(self.queue_wrapper.inter_cmd_delay)
-                else:
-                    self._send_cd.reset()
+                self._send_cd.reset(self.queue_wrapper.inter_cmd_delay)
             self.queue_wrapper.queue.popleft()
             if self.queue_wrapper.queue:
                 self._current_res.next_entry_is_tc = self.queue_wrapper.queue[0].is_tc()
@@ -199,6 +204,13 @@ class SequentialCcsdsSender:
         return is_tc
 
     def _update_largest_delay(self):
-        self._current_res.longest_rem_delay = max(
-            self._wait_cd.rem_time(), self._send_cd.rem_time()
-        )
+        now = time.monotonic()
+        next_wake_time = max(self._wait_cd.deadline, self._send_cd.deadline)
+        if next_wake_time > now:
+            self._current_res.next_wake_time = next_wake_time
+            self._current_res.longest_rem_delay = timedelta(
+                seconds=next_wake_time - now
+            )
+        else:
+            self._current_res.next_wake_time = None
+            self._current_res.longest_rem_delay = timedelta()
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import abc
 from abc import ABC
+from array import array
 from datetime import timedelta
 from enum import Enum
-from typing import Optional, Deque, cast, Any, Type
+from typing import Optional, Deque, cast, Any, Type, Iterable, Union
 
 from spacepackets.ccsds import SpacePacket
 from spacepackets.ecss import PusTelecommand, PusVerificator, PusServices
@@ -12,6 +13,7 @@ from tmtccmd.logging import get_console_logger
 from tmtccmd.tc.procedure import TcProcedureBase
 from tmtccmd.util import ProvidesSeqCount
 from tmtccmd.pus import Pus11Subservices
+from tmtccmd.tc.stamp import PusTcStamper, stamp_raw_pus_tc
 
 
 LOGGER = get_console_logger()
@@ -83,6 +85,24 @@ class RawTcEntry(TcQueueEntryBase):
         return f"{self.__class__.__name__}({self.tc!r})"
 
 
+class CompiledTcEntry(RawTcEntry):
+    """Entry of a queue compiled with :py:meth:`QueueWrapper.compile`. The telecommand is a
+    read-only view into the contiguous buffer of the compiled queue, which can be passed to
+    :py:meth:`tmtccmd.com_if.ComInterface.send` directly.
+    """
+
+    def __init__(self, tc: memoryview, source: TcQueueEntryBase):
+        """
+        :param tc: View on the packed telecommand
+        :param source: Original queue entry, for example for logging
+        """
+        super().__init__(tc)
+        self.source = source
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.source!r})"
+
+
 class WaitEntry(TcQueueEntryBase):
     def __init__(self, wait_time: timedelta):
         super().__init__(TcQueueEntryType.WAIT)
@@ -149,6 +169,31 @@ class QueueEntryHelper:
         return self.__cast_internally(PacketDelayEntry, TcQueueEntryType.PACKET_DELAY)
 
 
+class CompiledTcBuffer:
+    """Contiguous buffer of all telecommands of a compiled queue. The telecommand with index
+    ``n`` is stored between ``offsets[n]`` and ``offsets[n + 1]``.
+    """
+
+    def __init__(self, buffer: bytes, offsets: array):
+        self.buffer = buffer
+        self.offsets = offsets
+        self._view = memoryview(buffer)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> memoryview:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Telecommand index {idx} out of range")
+        return self._view[self.offsets[idx] : self.offsets[idx + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.buffer)
+
+
 class QueueWrapper:
     def __init__(
         self,
@@ -160,6 +205,53 @@ class QueueWrapper:
         self.queue = queue
         self.inter_cmd_delay = inter_cmd_delay
 
+    def compile(self, stamper: Optional[PusTcStamper] = None) -> CompiledTcBuffer:
+        """Pack all telecommands of the queue ahead of time into a contiguous buffer. Each PUS,
+        space packet and raw telecommand entry is replaced by a :py:class:`CompiledTcEntry`, so
+        the send callback only needs to pass the packed telecommand to the communication
+        interface. All other entries, for example wait, log and packet delay entries, are kept
+        in place.
+
+        A queue can be compiled again, for example with a different stamper. The entries of the
+        previous compilation are then packed again from their original entries.
+
+        :param stamper: Optional stamper for the APID and sequence count of the PUS
+            telecommands. The stamping is then done at compile time instead of in the send
+            callback. Raw telecommands are never stamped
+        :raises ValueError: Invalid PUS telecommand
+        """
+        parts = []
+        offsets = array("Q", [0])
+        tc_indexes = []
+        sources = []
+        # Indexing a deque is slow for long queues, so the entries are replaced in a list
+        entries = list(self.queue)
+        for idx, entry in enumerate(entries):
+            if isinstance(entry, CompiledTcEntry):
+                entry = entry.source
+            if entry.etype == TcQueueEntryType.PUS_TC:
+                raw_tc = cast(PusTcEntry, entry).pus_tc.pack(calc_crc=False)
+                if stamper is not None:
+                    stamper.stamp(raw_tc)
+                else:
+                    stamp_raw_pus_tc(raw_tc)
+            elif entry.etype == TcQueueEntryType.CCSDS_TC:
+                raw_tc = cast(SpacePacketEntry, entry).space_packet.pack()
+            elif entry.etype == TcQueueEntryType.RAW_TC:
+                raw_tc = cast(RawTcEntry, entry).tc
+            else:
+                continue
+            parts.append(raw_tc)
+            offsets.append(offsets[-1] + len(raw_tc))
+            tc_indexes.append(idx)
+            sources.append(entry)
+        compiled = CompiledTcBuffer(b"".join(parts), offsets)
+        for tc_idx, entry_idx in enumerate(tc_indexes):
+            entries[entry_idx] = CompiledTcEntry(compiled[tc_idx], sources[tc_idx])
+        self.queue.clear()
+        self.queue.extend(entries)
+        return compiled
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(info={self.info!r}, queue={self.queue!r}, "
@@ -276,5 +368,35 @@ class DefaultPusQueueHelper(QueueHelperBase):
     def add_pus_tc(self, pus_tc: PusTelecommand):
         super()._add_entry(PusTcEntry(pus_tc))
 
+    def add_pus_tcs_packed(
+        self, pus_tcs: Iterable[Union[PusTelecommand, bytes]]
+    ) -> int:
+        """Add many PUS telecommands at once, for example for generated command sequences.
+
+        Each telecommand is packed once and added as a :py:class:`RawTcEntry`. The APID and
+        sequence count are stamped directly onto the packed telecommand, which is also done for
+        time tagged PUS 11 telecommands. The passed telecommand objects are not modified.
+
+        :param pus_tcs: Telecommands, either as objects or already packed
+        :return: Number of added telecommands
+        :raises ValueError: Invalid packed telecommand
+        """
+        stamper = PusTcStamper(
+            self.pus_apid,
+            self.seq_cnt_provider,
+            self.pus_verificator,
+            self.tc_sched_timestamp_len,
+        )
+        num_tcs = 0
+        for pus_tc in pus_tcs:
+            if isinstance(pus_tc, PusTelecommand):
+                raw_tc = pus_tc.pack(calc_crc=False)
+            else:
+                raw_tc = bytearray(pus_tc)
+            stamper.stamp(raw_tc)
+            super()._add_entry(RawTcEntry(bytes(raw_tc)))
+            num_tcs += 1
+        return num_tcs
+
     def add_ccsds_tc(self, space_packet: SpacePacket):
         super()._add_entry(SpacePacketEntry(space_packet))
@@ -0,0 +1,164 @@
+"""Stamping of common header fields onto already packed PUS telecommands. This avoids unpacking
+and repacking the telecommands when the APID or sequence count needs to be changed.
+"""
+import binascii
+import struct
+from typing import Optional
+
+from spacepackets.ccsds.spacepacket import APID_MASK
+from spacepackets.ecss import PusServices, PusVerificator
+from spacepackets.ecss.pus_verificator import VerificationStatus
+from spacepackets.ecss.req_id import RequestId
+
+from tmtccmd.logging import get_console_logger
+from tmtccmd.pus import Pus11Subservices
+from tmtccmd.util.seqcnt import ProvidesSeqCount
+
+LOGGER = get_console_logger()
+
+# Packet ID (2), packet sequence control (2) and packet data length (2)
+_SP_HEADER_STRUCT = struct.Struct("!HHH")
+_SP_HEADER_LEN = _SP_HEADER_STRUCT.size
+# Primary header (6) and the PUS C TC secondary header with the source ID (5)
+PUS_TC_HEADER_LEN = 11
+_SERVICE_IDX = 7
+_SUBSERVICE_IDX = 8
+_SEQ_FLAGS_MASK = 0xC000
+_SEQ_COUNT_MASK = 0x3FFF
+_CRC_STRUCT = struct.Struct("!H")
+CRC16_CCITT_INIT = 0xFFFF
+
+
+def crc16_ccitt(data: bytes, init: int = CRC16_CCITT_INIT) -> int:
+    """CRC16 CCITT checksum as used by PUS packets. The calculation uses the C implementation of
+    the :py:mod:`binascii` module, so no lookup table is created for each packet.
+    """
+    return binascii.crc_hqx(data, init)
+
+
+def raw_packet_len(packet: bytes, offset: int = 0) -> int:
+    """Packet length determined from the data length field of the space packet header.
+
+    :raises ValueError: Data too short for the packet
+    """
+    if len(packet) < offset + _SP_HEADER_LEN:
+        raise ValueError(f"Data with length {len(packet)} too short for a space packet")
+    packet_len = (packet[offset + 4] << 8 | packet[offset + 5]) + _SP_HEADER_LEN + 1
+    if len(packet) < offset + packet_len:
+        raise ValueError(
+            f"Data with length {len(packet) - offset} too short for packet with length "
+            f"{packet_len}"
+        )
+    return packet_len
+
+
+def stamp_raw_pus_tc(
+    packet: bytearray,
+    apid: Optional[int] = None,
+    seq_count: Optional[int] = None,
+    offset: int = 0,
+) -> int:
+    """Stamp the APID and sequence count onto a packed PUS telecommand in place and recalculate
+    its CRC16.
+
+    :param packet: Buffer containing the packed telecommand
+    :param apid: New APID. The APID is not changed if this is None
+    :param seq_count: New sequence count. The sequence count is not changed if this is None
+    :param offset: Offset of the telecommand in the buffer
+    :return: Length of the telecommand
+    :raises ValueError: Buffer too short for the telecommand
+    """
+    packet_len = raw_packet_len(packet, offset)
+    if packet_len < PUS_TC_HEADER_LEN + 2:
+        raise ValueError(f"Packet with length {packet_len} too short for a PUS TC")
+    packet_id, psc, data_len = _SP_HEADER_STRUCT.unpack_from(packet, offset)
+    if apid is not None:
+        packet_id = (packet_id & ~APID_MASK) | (apid & APID_MASK)
+    if seq_count is not None:
+        psc = (psc & _SEQ_FLAGS_MASK) | (seq_count & _SEQ_COUNT_MASK)
+    _SP_HEADER_STRUCT.pack_into(packet, offset, packet_id, psc, data_len)
+    crc_offset = offset + packet_len - 2
+    # Slicing a memoryview does not copy the packet for the CRC calculation
+    with memoryview(packet) as view:
+        crc = crc16_ccitt(view[offset:crc_offset])
+    _CRC_STRUCT.pack_into(packet, crc_offset, crc)
+    return packet_len
+
+
+def add_raw_tc_to_verificator(
+    verificator: PusVerificator, packet: bytes, offset: int = 0
+) -> bool:
+    """Add a packed telecommand to a verificator. This is equivalent to
+    :py:meth:`PusVerificator.add_tc`, which requires a telecommand object.
+
+    :return: False if the request ID of the telecommand was already added
+    :raises ValueError: Data too short for the request ID
+    """
+    req_id = RequestId.unpack(packet[offset : offset + 4])
+    verif_dict = verificator.verif_dict
+    if req_id in verif_dict:
+        return False
+    verif_dict.update({req_id: VerificationStatus()})
+    return True
+
+
+def is_time_tagged_tc(packet: bytes, offset: int = 0) -> bool:
+    """Check whether a packed PUS telecommand inserts a time tagged telecommand into the
+    PUS 11 TC scheduler. Data which is too short for a PUS TC header is never time tagged."""
+    if len(packet) < offset + PUS_TC_HEADER_LEN:
+        return False
+    return (
+        packet[offset + _SERVICE_IDX] == PusServices.S11_TC_SCHED
+        and packet[offset + _SUBSERVICE_IDX] == Pus11Subservices.TC_INSERT
+    )
+
+
+class PusTcStamper:
+    """Stamps the APID and sequence count onto packed PUS telecommands and adds them to a
+    verificator, like :py:class:`tmtccmd.tc.queue.DefaultPusQueueHelper` does for telecommand
+    objects. Time tagged telecommands inserted into the PUS 11 TC scheduler are stamped as well.
+    """
+
+    def __init__(
+        self,
+        pus_apid: Optional[int] = None,
+        seq_cnt_provider: Optional[ProvidesSeqCount] = None,
+        pus_verificator: Optional[PusVerificator] = None,
+        tc_sched_timestamp_len: int = 4,
+    ):
+        """
+        :param pus_apid: APID stamped onto all telecommands
+        :param seq_cnt_provider: Provides the sequence count stamped onto all telecommands
+        :param pus_verificator: All stamped telecommands are added to this verificator
+        :param tc_sched_timestamp_len: Length of the release timestamp of time tagged
+            telecommands
+        """
+        self.pus_apid = pus_apid
+        self.seq_cnt_provider = seq_cnt_provider
+        self.pus_verificator = pus_verificator
+        self.tc_sched_timestamp_len = tc_sched_timestamp_len
+
+    def stamp(self, packet: bytearray, offset: int = 0) -> int:
+        """Stamp a packed telecommand in place. The CRC16 is always recalculated, so the
+        telecommand can be packed without calculating it.
+
+        :return: Length of the telecommand
+        :raises ValueError: Buffer too short for the telecommand
+        """
+        if is_time_tagged_tc(packet, offset):
+            try:
+                self._stamp_single(
+                    packet, offset + PUS_TC_HEADER_LEN + self.tc_sched_timestamp_len
+                )
+            except ValueError as e:
+                LOGGER.warning(f"Stamping time tagged TC failed with exception {e}")
+        return self._stamp_single(packet, offset)
+
+    def _stamp_single(self, packet: bytearray, offset: int) -> int:
+        seq_count = None
+        if self.seq_cnt_provider is not None:
+            seq_count = self.seq_cnt_provider.get_and_increment()
+        packet_len = stamp_raw_pus_tc(packet, self.pus_apid, seq_count, offset)
+        if self.pus_verificator is not None:
+            add_raw_tc_to_verificator(self.pus_verificator, packet, offset)
+        return packet_len
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import enum
 from abc import abstractmethod, ABC
-from typing import Deque, List, Union, Dict, Optional
+from typing import TYPE_CHECKING, Deque, List, Union, Dict, Optional
 
 from spacepackets.ecss import PusTelemetry
 from tmtccmd.logging import get_console_logger
@@ -11,6 +13,9 @@ from tmtccmd.tm.pus_3_fsfw_hk import Service3FsfwTm
 from tmtccmd.tm.pus_20_fsfw_parameters import Service20FsfwTm
 from tmtccmd.tm.pus_200_fsfw_modes import Service200FsfwTm
 
+if TYPE_CHECKING:
+    from tmtccmd.tm.apid_worker import ApidWorker, ApidWorkerCfg, ApidWorkerStats
+
 TelemetryListT = List[bytes]
 TelemetryQueueT = Deque[bytes]
 
@@ -78,28 +83,59 @@ HandlerDictT = Dict[int, SpecificApidHandlerBase]
 class CcsdsTmHandler(TmHandlerBase):
     """Generic CCSDS handler class. The user can create an instance of this class to handle
     CCSDS packets by adding dedicated APID handlers or a generic handler for all APIDs with no
-    dedicated handler"""
+    dedicated handler.
+
+    By default, all packets are handled synchronously on the thread calling
+    :py:meth:`handle_packet`. Optionally, APID handlers can be configured to run on dedicated
+    worker threads with a bounded queue, so that slow handlers do not delay other APIDs.
+    """
 
     def __init__(self, generic_handler: Optional[GenericApidHandlerBase]):
         super().__init__(tm_type=TmTypes.CCSDS_SPACE_PACKETS)
         self._handler_dict: HandlerDictT = dict()
+        self._worker_dict: Dict[int, ApidWorker] = dict()
         if generic_handler is None:
             self.generic_handler = DefaultApidHandler(None)
         else:
             self.generic_handler = generic_handler
 
-    def add_apid_handler(self, handler: SpecificApidHandlerBase):
+    def add_apid_handler(
+        self,
+        handler: SpecificApidHandlerBase,
+        worker_cfg: Optional[ApidWorkerCfg] = None,
+    ):
         """Add a TM handler for a certain APID. The handler is a callback function which
         will be called if telemetry with that APID arrives.
 
         :param handler: Handler class instance
+        :param worker_cfg: If this is specified, the handler is called on dedicated worker
+            threads which are started immediately. :py:meth:`stop_workers` should be called
+            to stop them
         :return:
         """
+        old_worker = self._worker_dict.pop(handler.apid, None)
+        if old_worker is not None:
+            old_worker.stop()
         self._handler_dict[handler.apid] = handler
+        if worker_cfg is not None:
+            from tmtccmd.tm.apid_worker import ApidWorker
+
+            worker = ApidWorker(handler, worker_cfg)
+            worker.start()
+            self._worker_dict[handler.apid] = worker
 
     def has_apid(self, apid: int) -> bool:
         return apid in self._handler_dict
 
+    def worker_stats(self) -> Dict[int, ApidWorkerStats]:
+        """Retrieve the statistics like the queue depth of all APID handler workers"""
+        return {apid: worker.stats() for apid, worker in self._worker_dict.items()}
+
+    def stop_workers(self, timeout: Optional[float] = None):
+        """Stop all APID handler worker threads after they have handled all queued packets"""
+        for worker in self._worker_dict.values():
+            worker.stop(timeout)
+
     def handle_packet(self, apid: int, packet: bytes) -> bool:
         """Handle a packet with an APID. If a handler exists for the given APID,
         it is used to handle the packet. If not, a dedicated handler for unknown APIDs
@@ -109,6 +145,11 @@ class CcsdsTmHandler(TmHandlerBase):
         :param packet:
         :return: True if the packet was passed to as dedicated APID handler, False otherwise
         """
+        if self._worker_dict:
+            worker = self._worker_dict.get(apid)
+            if worker is not None:
+                worker.put(packet)
+                return True
         specific_handler = self._handler_dict.get(apid)
         if specific_handler is None:
             self.generic_handler.handle_tm(apid, packet, self.generic_handler.user_args)
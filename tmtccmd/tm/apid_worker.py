@@ -0,0 +1,148 @@
+"""Worker threads which decouple the handling of packets of a specific APID from the thread
+receiving the packets"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional
+
+from tmtccmd.com_if.packet_queue import (
+    BackpressurePolicy,
+    BoundedPacketQueue,
+    PacketQueueStats,
+)
+from tmtccmd.logging import get_console_logger
+
+if TYPE_CHECKING:
+    from tmtccmd.tm import SpecificApidHandlerBase
+
+LOGGER = get_console_logger()
+
+
+@dataclass
+class ApidWorkerCfg:
+    """Configures the worker of an APID handler.
+
+    If the packets are ordered, a single worker thread handles all packets of the APID in the
+    order they were received. Otherwise, the packets are distributed to the given number of
+    worker threads and may be handled concurrently and out of order. The handler then needs to
+    be thread-safe.
+    """
+
+    max_queue_len: Optional[int] = 1024
+    max_queue_bytes: Optional[int] = None
+    policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST
+    ordered: bool = True
+    num_workers: int = 1
+    # Maximum number of packets a worker retrieves from the queue at once
+    batch_size: int = 64
+
+
+@dataclass
+class ApidWorkerStats:
+    apid: int
+    handled_packets: int = 0
+    # Number of packets where the handler raised an exception
+    handler_errors: int = 0
+    queue: PacketQueueStats = field(default_factory=PacketQueueStats)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of packets which are still waiting to be handled"""
+        return self.queue.stored_packets
+
+
+class ApidWorker:
+    """Passes the packets of one APID to a :py:class:`tmtccmd.tm.SpecificApidHandlerBase` on
+    dedicated worker threads, using a bounded queue. A slow handler then does not delay the
+    handling of packets with other APIDs.
+    """
+
+    JOIN_POLL_INTERVAL = 0.2
+
+    def __init__(self, handler: SpecificApidHandlerBase, cfg: ApidWorkerCfg):
+        self.handler = handler
+        self.cfg = cfg
+        self.queue = BoundedPacketQueue(
+            max_packets=cfg.max_queue_len,
+            max_bytes=cfg.max_queue_bytes,
+            policy=cfg.policy,
+        )
+        self._stats_lock = threading.Lock()
+        self._handled_packets = 0
+        self._handler_errors = 0
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def apid(self) -> int:
+        return self.handler.apid
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.queue.open()
+        num_workers = 1 if self.cfg.ordered else max(self.cfg.num_workers, 1)
+        self._threads = [
+            threading.Thread(
+                target=self._work,
+                name=f"apid-{self.apid:#05x}-worker-{idx}",
+                daemon=True,
+            )
+            for idx in range(num_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the worker threads. Packets which are still queued are handled before the
+        threads exit.
+
+        :param timeout: Maximum time to wait for each worker thread
+        """
+        self._stop_event.set()
+        self.queue.close()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def put(self, packet: bytes):
+        self.queue.put((packet,))
+
+    def stats(self) -> ApidWorkerStats:
+        with self._stats_lock:
+            return ApidWorkerStats(
+                apid=self.apid,
+                handled_packets=self._handled_packets,
+                handler_errors=self._handler_errors,
+                queue=self.queue.stats(),
+            )
+
+    def _work(self):
+        handler = self.handler
+        batch_size = self.cfg.batch_size
+        while True:
+            packets = self.queue.get_all(
+                timeout=self.JOIN_POLL_INTERVAL, max_packets=batch_size
+            )
+            if not packets:
+                if self._stop_event.is_set():
+                    return
+                continue
+            errors = 0
+            for packet in packets:
+                try:
+                    handler.handle_tm(packet, handler.user_args)
+                except Exception:
+                    if self._handler_errors + errors == 0:
+                        LOGGER.exception(
+                            f"Handler for APID {self.apid:#05x} raised an exception"
+                        )
+                    errors += 1
+            with self._stats_lock:
+                self._handled_packets += len(packets)
+                self._handler_errors += errors
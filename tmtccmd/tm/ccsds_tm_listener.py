@@ -5,7 +5,7 @@ from spacepackets.ccsds.spacepacket import get_apid_from_raw_space_packet
 
 from tmtccmd.tm import TelemetryQueueT, CcsdsTmHandler
 from tmtccmd.logging import get_console_logger
-from tmtccmd.com_if import ComInterface
+from tmtccmd.com_if import ComInterface, MultiSourceComInterface
 
 LOGGER = get_console_logger()
 
@@ -31,18 +31,35 @@ class CcsdsTmListener:
             the passed handler
         """
         self.__tm_handler = tm_handler
+        self.__source_handlers: Dict[str, CcsdsTmHandler] = dict()
+
+    def add_source_handler(self, source: str, tm_handler: CcsdsTmHandler):
+        """Add a dedicated CCSDS handler for packets received from a specific source of a
+        :py:class:`tmtccmd.com_if.MultiSourceComInterface`. This allows routing packets by
+        source and APID, for example if one process handles multiple test benches. Packets of
+        sources without a dedicated handler are passed to the default handler.
+        """
+        self.__source_handlers[source] = tm_handler
 
     def operation(self, com_if: ComInterface) -> int:
+        if self.__source_handlers and isinstance(com_if, MultiSourceComInterface):
+            tagged_packets = com_if.receive_with_source()
+            for source, tm_packet in tagged_packets:
+                self.__handle_ccsds_space_packet(
+                    tm_packet, self.__source_handlers.get(source, self.__tm_handler)
+                )
+            return len(tagged_packets)
         packet_list = com_if.receive()
         for tm_packet in packet_list:
-            self.__handle_ccsds_space_packet(tm_packet)
+            self.__handle_ccsds_space_packet(tm_packet, self.__tm_handler)
         return len(packet_list)
 
-    def __handle_ccsds_space_packet(self, tm_packet: bytes):
+    @staticmethod
+    def __handle_ccsds_space_packet(tm_packet: bytes, tm_handler: CcsdsTmHandler):
         if len(tm_packet) < 6:
             LOGGER.warning("TM packet to small to be a CCSDS space packet")
         else:
             apid = get_apid_from_raw_space_packet(tm_packet)
-            self.__tm_handler.handle_packet(apid, tm_packet)
+            tm_handler.handle_packet(apid, tm_packet)
             return True
         return False
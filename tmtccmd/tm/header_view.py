@@ -0,0 +1,186 @@
+"""Lightweight access to the header fields of raw PUS telemetry packets without unpacking the
+whole packet"""
+from __future__ import annotations
+
+import struct
+from collections import defaultdict
+from typing import Callable, DefaultDict, Dict, List, Optional, TypeVar, Union
+
+from spacepackets.ccsds.spacepacket import APID_MASK
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.tm import SpecificApidHandlerBase
+
+# Primary header, followed by the PUS C secondary header up to the timestamp
+_TM_HEADER_STRUCT = struct.Struct("!HHHBBBHH")
+_SEQ_COUNT_MASK = 0x3FFF
+
+RawPacketT = Union[bytes, bytearray, memoryview]
+TmT = TypeVar("TmT")
+
+
+class PusTmHeaderView:
+    """Read-only view on the header fields of a raw PUS C telemetry packet.
+
+    All fixed header fields are read with a single struct unpack call. The packet is not copied,
+    and neither the timestamp is converted nor the CRC checked. :py:meth:`unpack_timestamp` or a
+    full unpack with :py:meth:`spacepackets.ecss.PusTelemetry.unpack` can be used if this
+    is required.
+    """
+
+    __slots__ = (
+        "raw",
+        "apid",
+        "seq_count",
+        "data_len",
+        "pus_version",
+        "service",
+        "subservice",
+        "msg_counter",
+        "dest_id",
+        "timestamp_len",
+    )
+
+    def __init__(
+        self,
+        packet: RawPacketT,
+        timestamp_len: int = PusTelemetry.PUS_TIMESTAMP_SIZE,
+    ):
+        """
+        :param packet: Raw PUS telemetry packet
+        :param timestamp_len: Length of the timestamp in the secondary header
+        :raises ValueError: Packet too short to contain the PUS TM headers
+        """
+        if len(packet) < _TM_HEADER_STRUCT.size + timestamp_len:
+            raise ValueError(
+                f"Packet with length {len(packet)} too short for a PUS TM header"
+            )
+        self.raw = packet if isinstance(packet, memoryview) else memoryview(packet)
+        (
+            packet_id,
+            psc,
+            self.data_len,
+            version_byte,
+            self.service,
+            self.subservice,
+            self.msg_counter,
+            self.dest_id,
+        ) = _TM_HEADER_STRUCT.unpack_from(packet)
+        self.apid = packet_id & APID_MASK
+        self.seq_count = psc & _SEQ_COUNT_MASK
+        self.pus_version = version_byte >> 4
+        self.timestamp_len = timestamp_len
+
+    @property
+    def packet_len(self) -> int:
+        """Total packet length determined from the packet data length field"""
+        return self.data_len + 7
+
+    @property
+    def header_len(self) -> int:
+        return _TM_HEADER_STRUCT.size + self.timestamp_len
+
+    @property
+    def timestamp(self) -> memoryview:
+        return self.raw[_TM_HEADER_STRUCT.size : self.header_len]
+
+    @property
+    def source_data(self) -> memoryview:
+        """View on the source data, without the CRC16"""
+        return self.raw[self.header_len : self.packet_len - 2]
+
+    def unpack_timestamp(self) -> CdsShortTimestamp:
+        return CdsShortTimestamp.unpack(bytes(self.timestamp))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(apid={self.apid:#05x}, seq_count={self.seq_count}, "
+            f"service={self.service}, subservice={self.subservice}, "
+            f"msg_counter={self.msg_counter})"
+        )
+
+
+class LazyPusTm:
+    """Raw PUS telemetry packet together with its header view. Full unpacking is deferred until
+    :py:meth:`unpack` is called, and the result is cached per unpack function, so that multiple
+    consumers of the same packet only unpack it once.
+    """
+
+    __slots__ = ("raw", "header", "_unpacked")
+
+    def __init__(
+        self,
+        packet: bytes,
+        timestamp_len: int = PusTelemetry.PUS_TIMESTAMP_SIZE,
+    ):
+        self.raw = packet
+        self.header = PusTmHeaderView(packet, timestamp_len)
+        self._unpacked: Optional[Dict[Callable, object]] = None
+
+    @property
+    def service(self) -> int:
+        return self.header.service
+
+    @property
+    def subservice(self) -> int:
+        return self.header.subservice
+
+    def unpack(self, unpacker: Callable[[bytes], TmT] = PusTelemetry.unpack) -> TmT:
+        """Unpack the packet with the given function, for example ``Service17Tm.unpack``.
+
+        :raises ValueError: Propagated from the unpack function
+        """
+        if self._unpacked is None:
+            self._unpacked = dict()
+        else:
+            unpacked = self._unpacked.get(unpacker)
+            if unpacked is not None:
+                return unpacked
+        unpacked = unpacker(self.raw)
+        self._unpacked[unpacker] = unpacked
+        return unpacked
+
+
+LazyTmCallbackT = Callable[[LazyPusTm], None]
+
+
+class PusTmDispatcher(SpecificApidHandlerBase):
+    """APID handler which passes the :py:class:`LazyPusTm` of each received packet to the
+    subscribers of its service. Only the header fields are read for the dispatch, so packets
+    are only fully unpacked if a subscriber requests it.
+    """
+
+    def __init__(
+        self,
+        apid: int,
+        user_args: any = None,
+        timestamp_len: int = PusTelemetry.PUS_TIMESTAMP_SIZE,
+    ):
+        super().__init__(apid, user_args)
+        self.timestamp_len = timestamp_len
+        self._service_subscribers: DefaultDict[
+            int, List[LazyTmCallbackT]
+        ] = defaultdict(list)
+        self._generic_subscribers: List[LazyTmCallbackT] = []
+
+    def subscribe(self, callback: LazyTmCallbackT, service: Optional[int] = None):
+        """Subscribe to the packets of a service.
+
+        :param callback: Called with the lazy packet
+        :param service: Service of the packets passed to the callback. None to receive all
+            packets
+        """
+        if service is None:
+            self._generic_subscribers.append(callback)
+        else:
+            self._service_subscribers[service].append(callback)
+
+    def handle_tm(self, packet: bytes, _user_args: any):
+        tm = LazyPusTm(packet, self.timestamp_len)
+        subscribers = self._service_subscribers.get(tm.header.service)
+        if subscribers is not None:
+            for callback in subscribers:
+                callback(tm)
+        for callback in self._generic_subscribers:
+            callback(tm)
@@ -3,17 +3,71 @@
 """
 from __future__ import annotations
 from abc import abstractmethod
+from dataclasses import dataclass, field
 import struct
 
 from spacepackets.ecss.tm import CdsShortTimestamp, PusVersion, PusTelemetry
 from tmtccmd.tm.base import PusTmInfoBase, PusTmBase
 from tmtccmd.tm.pus_3_hk_base import *
 from tmtccmd.logging import get_console_logger
+from tmtccmd.util.obj_id import get_obj_id_interner
 from typing import Tuple, List
 
 
 LOGGER = get_console_logger()
 
+# SID (8), reporting status (1), validity flag (1), collection interval (4) and number of
+# parameters (1)
+_DEFINITIONS_HEADER_STRUCT = struct.Struct("!8sBBfB")
+
+
+@dataclass
+class HkSetDefinition:
+    """Content of a FSFW HK definitions report"""
+
+    sid: bytes
+    reporting_enabled: bool
+    valid: bool
+    collection_interval_seconds: float
+    pool_ids: List[int] = field(default_factory=list)
+
+    @classmethod
+    def unpack(cls, tm_data: bytes) -> HkSetDefinition:
+        """See :py:func:`unpack_hk_definitions`"""
+        return unpack_hk_definitions(tm_data)
+
+
+def unpack_hk_definitions(tm_data: bytes) -> HkSetDefinition:
+    """Unpack the source data of a FSFW HK definitions report.
+
+    :raises ValueError: Source data too short
+    """
+    if len(tm_data) < _DEFINITIONS_HEADER_STRUCT.size:
+        raise ValueError(f"HK definitions report with length {len(tm_data)} too short")
+    (
+        sid,
+        reporting_enabled,
+        valid,
+        collection_interval,
+        num_params,
+    ) = _DEFINITIONS_HEADER_STRUCT.unpack_from(tm_data)
+    pool_ids_end = _DEFINITIONS_HEADER_STRUCT.size + 4 * num_params
+    if len(tm_data) < pool_ids_end:
+        raise ValueError(
+            f"HK definitions report with length {len(tm_data)} too short for "
+            f"{num_params} pool IDs"
+        )
+    pool_ids = list(
+        struct.unpack_from(f"!{num_params}I", tm_data, _DEFINITIONS_HEADER_STRUCT.size)
+    )
+    return HkSetDefinition(
+        sid=bytes(sid),
+        reporting_enabled=reporting_enabled == 1,
+        valid=valid != 0,
+        collection_interval_seconds=collection_interval / 1000.0,
+        pool_ids=pool_ids,
+    )
+
 
 class Service3FsfwTm(Service3Base, PusTmBase, PusTmInfoBase):
     """This class encapsulates the format of Service 3 telemetry
@@ -97,7 +151,7 @@ class Service3FsfwTm(Service3Base, PusTmBase, PusTmInfoBase):
             raise ValueError
         instance.min_hk_reply_size = minimum_reply_size
         instance.hk_structure_report_header_size = minimum_structure_report_header_size
-        instance.object_id = ObjectIdU32.from_bytes(tm_data[0:4])
+        instance.object_id = get_obj_id_interner().get(tm_data[0:4])
         instance.set_id = struct.unpack("!I", tm_data[4:8])[0]
         if instance.subservice == 25 or instance.subservice == 26:
             if len(tm_data) > 8:
@@ -150,6 +204,14 @@ class Service3FsfwTm(Service3Base, PusTmBase, PusTmInfoBase):
                 f"than {self.hk_structure_report_header_size}"
             )
             return [], []
+        try:
+            definition = unpack_hk_definitions(tm_data)
+        except ValueError as e:
+            LOGGER.warning(
+                f"Service3TM: handle_filling_definition_arrays: Invalid structure report "
+                f"from {self.object_id.as_hex_string}: {e}"
+            )
+            return [], []
         definitions_header = [
             "Object ID",
             "Set ID",
@@ -158,34 +220,15 @@ class Service3FsfwTm(Service3Base, PusTmBase, PusTmInfoBase):
             "Collection Interval (s)",
             "Number Of IDs",
         ]
-        reporting_enabled = tm_data[8]
-        set_valid = tm_data[9]
-        collection_interval_seconds = struct.unpack("!f", tm_data[10:14])[0] / 1000.0
-        num_params = tm_data[14]
-        if len(tm_data) < self.hk_structure_report_header_size + num_params * 4:
-            LOGGER.warning(
-                f"Service3TM: handle_filling_definition_arrays: Invalid structure report "
-                f"from {self.object_id.as_hex_string}, is shorter than "
-                f"{self.hk_structure_report_header_size + num_params * 4}"
-            )
-            return [], []
-
         parameters = []
-        counter = 1
-        for array_index in range(
-            self.hk_structure_report_header_size,
-            self.hk_structure_report_header_size + 4 * num_params,
-            4,
-        ):
-            parameter = struct.unpack("!I", tm_data[array_index : array_index + 4])[0]
+        for counter, pool_id in enumerate(definition.pool_ids, 1):
             definitions_header.append("Pool ID " + str(counter))
-            parameters.append(str(hex(parameter)))
-            counter = counter + 1
-        if reporting_enabled == 1:
+            parameters.append(str(hex(pool_id)))
+        if definition.reporting_enabled:
             status_string = "On"
         else:
             status_string = "Off"
-        if set_valid:
+        if definition.valid:
             valid_string = "Yes"
         else:
             valid_string = "No"
@@ -194,8 +237,8 @@ class Service3FsfwTm(Service3Base, PusTmBase, PusTmInfoBase):
             self._set_id,
             status_string,
             valid_string,
-            collection_interval_seconds,
-            num_params,
+            definition.collection_interval_seconds,
+            len(definition.pool_ids),
         ]
         definitions_content.extend(parameters)
         return definitions_header, definitions_content
@@ -0,0 +1,219 @@
+"""Batch decoding of FSFW housekeeping packets into columnar NumPy arrays. This requires
+the optional NumPy dependency, which can be installed with the ``numpy`` extra"""
+from __future__ import annotations
+
+import re
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from spacepackets.ccsds.time import DAYS_CCSDS_TO_UNIX, SECONDS_PER_DAY
+from spacepackets.ecss import PusTelemetry
+
+# Primary header (6) and PUS C secondary header without the timestamp (7)
+_PUS_TM_HEADER_LEN = 13
+_SID_LEN = 8
+_CRC_LEN = 2
+_VAR_FORMAT = re.compile(r"^(\d*)([bBhHiIlLqQfd?])$")
+# Big endian NumPy types for the supported struct format characters
+_NUMPY_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": ">i2",
+    "H": ">u2",
+    "i": ">i4",
+    "I": ">u4",
+    "l": ">i4",
+    "L": ">u4",
+    "q": ">i8",
+    "Q": ">u8",
+    "f": ">f4",
+    "d": ">f8",
+    "?": "?",
+}
+
+
+class HkSetLayout:
+    """Describes the serialized layout of the variables of a housekeeping set.
+
+    Each variable is described with a name and a :py:mod:`struct` format character, for example
+    ``("temperature", "f")``. Vector variables prefix the format character with the number of
+    elements, for example ``("quaternion", "4d")``. All variables are big endian. FSFW sets can
+    optionally append a validity buffer with one bit per variable.
+    """
+
+    def __init__(
+        self,
+        variables: Sequence[Tuple[str, str]],
+        has_validity_buffer: bool = True,
+    ):
+        """
+        :raises ValueError: Invalid or unsupported format string
+        """
+        self.variables = list(variables)
+        self._names = [name for name, _ in self.variables]
+        self.has_validity_buffer = has_validity_buffer
+        self._parsed: List[Tuple[str, int, str]] = []
+        for name, fmt in self.variables:
+            match = _VAR_FORMAT.match(fmt)
+            if match is None:
+                raise ValueError(f"Invalid format {fmt} for HK variable {name}")
+            count = int(match.group(1)) if match.group(1) else 1
+            self._parsed.append((name, count, match.group(2)))
+        self.struct = struct.Struct(
+            ">" + "".join(f"{count}{char}" for _, count, char in self._parsed)
+        )
+        # Vector variables are unpacked into multiple values by struct, so the slices of all
+        # variables inside the unpacked tuple are precomputed
+        self._value_slices: List[Tuple[str, int, int]] = []
+        value_idx = 0
+        for name, count, _ in self._parsed:
+            self._value_slices.append((name, value_idx, count))
+            value_idx += count
+        self._is_scalar_only = value_idx == len(self._parsed)
+        self._dtype = None
+
+    @property
+    def num_vars(self) -> int:
+        return len(self.variables)
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def validity_buffer_len(self) -> int:
+        if not self.has_validity_buffer:
+            return 0
+        return (self.num_vars + 7) // 8
+
+    @property
+    def hk_data_len(self) -> int:
+        """Length of the HK data following the SID, including the validity buffer"""
+        return self.struct.size + self.validity_buffer_len
+
+    def unpack(self, hk_data: bytes, offset: int = 0) -> Dict[str, any]:
+        """Unpack the variables of a single HK packet with the precompiled struct.
+
+        :param hk_data: Raw HK data following the SID
+        :param offset: Offset of the variables inside the passed data
+        :return: Dictionary of variable names to values. Vector variables are tuples
+        :raises struct.error: Data too short
+        """
+        values = self.struct.unpack_from(hk_data, offset)
+        if self._is_scalar_only:
+            return dict(zip(self._names, values))
+        return {
+            name: values[start] if count == 1 else values[start : start + count]
+            for name, start, count in self._value_slices
+        }
+
+    def validity_buffer(self, hk_data: bytes, offset: int = 0) -> bytes:
+        start = offset + self.struct.size
+        return hk_data[start : start + self.validity_buffer_len]
+
+    def numpy_dtype(self) -> np.dtype:
+        """NumPy structured type of the HK data. The type is created once and cached"""
+        if self._dtype is None:
+            _check_numpy()
+            fields = []
+            for name, count, char in self._parsed:
+                if count == 1:
+                    fields.append((name, _NUMPY_TYPES[char]))
+                else:
+                    fields.append((name, _NUMPY_TYPES[char], (count,)))
+            if self.has_validity_buffer:
+                fields.append(("_validity", "u1", (self.validity_buffer_len,)))
+            self._dtype = np.dtype(fields)
+        return self._dtype
+
+
+@dataclass
+class HkBatch:
+    """Columnar housekeeping data of multiple packets of one set"""
+
+    # Unix timestamps of the packets in seconds
+    timestamps: np.ndarray
+    # One array per variable, with one row per packet
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    # Boolean matrix with one row per packet and one column per variable. None if the set does
+    # not have a validity buffer
+    validity: Optional[np.ndarray] = None
+    # Number of passed packets which were skipped because of a different SID or length
+    skipped_packets: int = 0
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+def decode_hk_batch(
+    packets: Sequence[bytes],
+    layout: HkSetLayout,
+    sid: Optional[bytes] = None,
+) -> HkBatch:
+    """Decode many FSFW housekeeping packets of one set into columns in a single pass.
+
+    The packets are expected to be PUS C packets with a CDS short timestamp. Packets with a length
+    which does not match the layout or a different SID are skipped. The CRCs are not checked.
+
+    :param packets: Raw HK packets
+    :param layout: Layout of the HK data
+    :param sid: Only decode packets with this 8 byte SID. If this is not specified, the SID of
+        the first packet is used
+    :raises ImportError: NumPy is not installed
+    """
+    _check_numpy()
+    timestamp_len = PusTelemetry.PUS_TIMESTAMP_SIZE
+    sid_start = _PUS_TM_HEADER_LEN + timestamp_len
+    packet_len = sid_start + _SID_LEN + layout.hk_data_len + _CRC_LEN
+    if sid is None and packets:
+        sid = bytes(packets[0][sid_start : sid_start + _SID_LEN])
+    selected = [
+        packet
+        for packet in packets
+        if len(packet) == packet_len and packet[sid_start : sid_start + _SID_LEN] == sid
+    ]
+    packet_dtype = np.dtype(
+        [
+            ("_header", "V", _PUS_TM_HEADER_LEN),
+            ("_pfield", "u1"),
+            ("_days", ">u2"),
+            ("_ms_of_day", ">u4"),
+            ("_sid", "V", _SID_LEN),
+            ("hk", layout.numpy_dtype()),
+            ("_crc", ">u2"),
+        ]
+    )
+    records = np.frombuffer(b"".join(selected), dtype=packet_dtype)
+    timestamps = (records["_days"].astype(np.float64) + DAYS_CCSDS_TO_UNIX) * float(
+        SECONDS_PER_DAY
+    ) + records["_ms_of_day"] / 1000.0
+    hk_records = records["hk"]
+    # Copy the fields so the columns are contiguous and native endian
+    columns = {
+        name: hk_records[name].astype(hk_records[name].dtype.newbyteorder("="))
+        for name in layout.names
+    }
+    validity = None
+    if layout.has_validity_buffer:
+        validity = np.unpackbits(hk_records["_validity"], axis=1, bitorder="big")[
+            :, : layout.num_vars
+        ].astype(bool)
+    return HkBatch(
+        timestamps=timestamps,
+        columns=columns,
+        validity=validity,
+        skipped_packets=len(packets) - len(selected),
+    )
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError(
+            "Batch HK decoding requires NumPy. It can be installed with the numpy extra"
+        )
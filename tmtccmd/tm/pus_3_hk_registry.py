@@ -0,0 +1,128 @@
+"""Registry for the layouts of FSFW housekeeping sets, keyed by the structure ID (SID)"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from spacepackets.ecss.pus_3_hk import Subservices
+
+from tmtccmd.fsfw import validity_buffer_list
+from tmtccmd.logging import get_console_logger
+from tmtccmd.tc.pus_3_fsfw_hk import make_sid
+from tmtccmd.tm.pus_3_fsfw_hk import (
+    HkSetDefinition,
+    Service3FsfwTm,
+    unpack_hk_definitions,
+)
+from tmtccmd.tm.pus_3_hk_batch import HkSetLayout
+
+LOGGER = get_console_logger()
+
+SID_LEN = 8
+_DEFINITION_REPORTS = (
+    Subservices.TM_HK_DEFINITIONS_REPORT,
+    Subservices.TM_DIAG_DEFINITION_REPORT,
+)
+_HK_REPORTS = (Subservices.TM_HK_REPORT, Subservices.TM_DIAGNOSTICS_REPORT)
+
+
+@dataclass
+class DecodedHkSet:
+    sid: bytes
+    values: Dict[str, any]
+    # None if the set does not have a validity buffer
+    validity: Optional[List[bool]] = None
+
+
+class HkSetRegistry:
+    """Stores the layouts of HK sets keyed by their 8 byte SID, which consists of the object ID
+    and the set ID.
+
+    Layouts can be registered explicitely with :py:meth:`register_set`. Alternatively, the types
+    of the pool variables can be registered with :py:meth:`register_pool_variable`. The registry
+    then learns the layouts of sets from received HK definitions reports, which contain the pool
+    IDs of the set variables. The struct of each layout is compiled once, so decoding a HK
+    packet is a single dictionary lookup and ``unpack_from`` call.
+    """
+
+    def __init__(self, validity_buffers: bool = True):
+        """
+        :param validity_buffers: Sets learned from definitions reports have a validity buffer
+        """
+        self.validity_buffers = validity_buffers
+        self._layouts: Dict[bytes, HkSetLayout] = dict()
+        self._pool_vars: Dict[int, Tuple[str, str]] = dict()
+        self._definitions: Dict[bytes, HkSetDefinition] = dict()
+
+    @staticmethod
+    def sid(object_id: bytes, set_id: int) -> bytes:
+        return bytes(make_sid(object_id, set_id))
+
+    def register_set(self, sid: bytes, layout: HkSetLayout):
+        self._layouts[bytes(sid)] = layout
+
+    def register_pool_variable(self, pool_id: int, name: str, fmt: str):
+        """Register the name and the :py:mod:`struct` format of a pool variable, which is used
+        to learn set layouts from definitions reports"""
+        self._pool_vars[pool_id] = (name, fmt)
+
+    def layout(self, sid: bytes) -> Optional[HkSetLayout]:
+        return self._layouts.get(bytes(sid))
+
+    def definition(self, sid: bytes) -> Optional[HkSetDefinition]:
+        """Retrieve the last received definitions report for a set"""
+        return self._definitions.get(bytes(sid))
+
+    def learn_from_definitions(
+        self, definition: HkSetDefinition
+    ) -> Optional[HkSetLayout]:
+        """Compile and register the layout of a set from its definitions report.
+
+        :return: The new layout. None if the types of some pool variables are unknown
+        """
+        self._definitions[definition.sid] = definition
+        variables = []
+        for pool_id in definition.pool_ids:
+            pool_var = self._pool_vars.get(pool_id)
+            if pool_var is None:
+                LOGGER.debug(
+                    f"Can not learn layout of HK set {definition.sid.hex()}, "
+                    f"unknown pool ID {pool_id:#010x}"
+                )
+                return None
+            variables.append(pool_var)
+        layout = HkSetLayout(variables, has_validity_buffer=self.validity_buffers)
+        self._layouts[definition.sid] = layout
+        return layout
+
+    def decode(self, tm_data: bytes) -> Optional[DecodedHkSet]:
+        """Decode the source data of a HK report, starting with the SID.
+
+        :return: Decoded set. None if no layout is known for the SID or if the data is too short
+        """
+        sid = bytes(tm_data[:SID_LEN])
+        layout = self._layouts.get(sid)
+        if layout is None or len(tm_data) < SID_LEN + layout.hk_data_len:
+            return None
+        validity = None
+        if layout.has_validity_buffer:
+            validity = validity_buffer_list(
+                layout.validity_buffer(tm_data, SID_LEN), layout.num_vars
+            )
+        return DecodedHkSet(
+            sid=sid, values=layout.unpack(tm_data, SID_LEN), validity=validity
+        )
+
+    def handle_hk_tm(self, hk_tm: Service3FsfwTm) -> Optional[DecodedHkSet]:
+        """Learn from definitions reports and decode HK reports.
+
+        :return: The decoded set for HK reports with a known layout, None otherwise
+        """
+        if hk_tm.subservice in _DEFINITION_REPORTS:
+            try:
+                self.learn_from_definitions(unpack_hk_definitions(hk_tm.tm_data))
+            except ValueError as e:
+                LOGGER.warning(f"Invalid HK definitions report: {e}")
+        elif hk_tm.subservice in _HK_REPORTS:
+            return self.decode(hk_tm.tm_data)
+        return None
@@ -4,17 +4,75 @@
 from __future__ import annotations
 from abc import abstractmethod
 import struct
+from typing import NamedTuple
+
+from crcmod.predefined import mkPredefinedCrcFun
 
 from spacepackets.ecss.defs import PusServices
 from spacepackets.ecss.pus_5_event import Subservices
 from spacepackets.ecss.tm import CdsShortTimestamp, PusVersion
 from tmtccmd.tm.base import PusTmInfoBase, PusTmBase, PusTelemetry
-from tmtccmd.util.obj_id import ObjectIdU32
+from tmtccmd.util.obj_id import ObjectIdU32, get_obj_id_interner
 from tmtccmd.logging import get_console_logger
 
 
 LOGGER = get_console_logger()
 
+# Event ID (2), reporter object ID (4), parameter 1 (4) and parameter 2 (4)
+EVENT_STRUCT = struct.Struct(">HIII")
+_PACKET_INFOS = {
+    Subservices.TM_INFO_EVENT: "Event Info",
+    Subservices.TM_LOW_SEVERITY_EVENT: "Event Error Low Severity",
+    Subservices.TM_MEDIUM_SEVERITY_EVENT: "Event Error Med Severity",
+    Subservices.TM_HIGH_SEVERITY_EVENT: "Event Error High Severity",
+}
+# Primary header (6) and PUS C secondary header up to the timestamp (7)
+_TM_HEADER_LEN = 13
+_SUBSERVICE_IDX = 8
+# The CRC function is only created once, instead of creating its table for each packet
+_crc16_ccitt = mkPredefinedCrcFun(crc_name="crc-ccitt-false")
+
+
+class EventData(NamedTuple):
+    subservice: int
+    event_id: int
+    reporter_id: ObjectIdU32
+    param_1: int
+    param_2: int
+
+
+def decode_event(
+    raw_telemetry: bytes,
+    check_crc: bool = True,
+    timestamp_len: int = PusTelemetry.PUS_TIMESTAMP_SIZE,
+) -> EventData:
+    """Decode the event of a raw PUS C event packet in a single pass. Unlike
+    :py:meth:`Service5Tm.unpack`, no :py:class:`spacepackets.ecss.PusTelemetry` is created,
+    which makes this function suitable for high event rates. The service is not checked.
+
+    :param raw_telemetry: Raw event packet
+    :param check_crc: Verify the CRC16 of the packet
+    :param timestamp_len: Length of the timestamp in the secondary header
+    :raises ValueError: Packet too short or invalid CRC
+    """
+    data_start = _TM_HEADER_LEN + timestamp_len
+    if len(raw_telemetry) < data_start + EVENT_STRUCT.size + 2:
+        raise ValueError(
+            f"Packet with length {len(raw_telemetry)} too short for an event packet"
+        )
+    if check_crc and _crc16_ccitt(raw_telemetry) != 0:
+        raise ValueError("Invalid CRC16 of event packet")
+    event_id, obj_id, param_1, param_2 = EVENT_STRUCT.unpack_from(
+        raw_telemetry, data_start
+    )
+    return EventData(
+        raw_telemetry[_SUBSERVICE_IDX],
+        event_id,
+        get_obj_id_interner().get_by_int(obj_id),
+        param_1,
+        param_2,
+    )
+
 
 class Service5Tm(PusTmBase, PusTmInfoBase):
     def __init__(
@@ -42,14 +100,12 @@ class Service5Tm(PusTmBase, PusTmInfoBase):
         self._event_id = event_id
         self._param_1 = param_1
         self._param_2 = param_2
-        source_data = bytearray()
-        source_data.extend(struct.pack("!H", self._event_id))
         if len(object_id) != 4:
             LOGGER.warning("Object ID must be a bytrarray with length 4")
             raise ValueError
-        source_data.extend(object_id)
-        source_data.extend(struct.pack("!I", self._param_1))
-        source_data.extend(struct.pack("!I", self._param_2))
+        source_data = EVENT_STRUCT.pack(
+            self._event_id, self._object_id.obj_id, self._param_1, self._param_2
+        )
         pus_tm = PusTelemetry(
             service=PusServices.S5_EVENT,
             subservice=subservice,
@@ -65,24 +121,22 @@ class Service5Tm(PusTmBase, PusTmInfoBase):
         PusTmInfoBase.__init__(self, pus_tm=pus_tm)
         self.__init_without_base(instance=self, set_attrs_from_tm_data=False)
 
-    @classmethod
-    def __empty(cls) -> Service5Tm:
-        return cls(
-            subservice=Subservices.TM_INFO_EVENT,
-            event_id=0,
-            object_id=bytearray(4),
-            param_1=0,
-            param_2=0,
-        )
-
     @classmethod
     def unpack(
         cls,
         raw_telemetry: bytes,
         pus_version: PusVersion = PusVersion.GLOBAL_CONFIG,
     ) -> Service5Tm:
-        service_5_tm = cls.__empty()
-        service_5_tm.pus_tm = PusTelemetry.unpack(raw_telemetry=raw_telemetry)
+        """Unpack a raw event packet. The reporter ID of the returned instance is interned and
+        shared with other instances, see :py:class:`tmtccmd.util.obj_id.ObjectIdInterner`.
+
+        :raises ValueError: Invalid packet
+        """
+        # The constructor is skipped, because it would pack a dummy packet first
+        service_5_tm = cls.__new__(cls)
+        pus_tm = PusTelemetry.unpack(raw_telemetry=raw_telemetry)
+        PusTmBase.__init__(service_5_tm, pus_tm=pus_tm)
+        PusTmInfoBase.__init__(service_5_tm, pus_tm=pus_tm)
         service_5_tm.__init_without_base(
             instance=service_5_tm, set_attrs_from_tm_data=True
         )
@@ -131,23 +185,19 @@ class Service5Tm(PusTmBase, PusTmInfoBase):
     def __init_without_base(instance: Service5Tm, set_attrs_from_tm_data: bool = False):
         if instance.service != 5:
             LOGGER.warning("This packet is not an event service packet!")
-        instance.set_packet_info("Event")
-        if instance.subservice == Subservices.TM_INFO_EVENT:
-            instance.append_packet_info(" Info")
-        elif instance.subservice == Subservices.TM_LOW_SEVERITY_EVENT:
-            instance.append_packet_info(" Error Low Severity")
-        elif instance.subservice == Subservices.TM_MEDIUM_SEVERITY_EVENT:
-            instance.append_packet_info(" Error Med Severity")
-        elif instance.subservice == Subservices.TM_HIGH_SEVERITY_EVENT:
-            instance.append_packet_info(" Error High Severity")
+        instance.set_packet_info(_PACKET_INFOS.get(instance.subservice, "Event"))
         tm_data = instance.tm_data
-        if len(tm_data) < 14:
+        if len(tm_data) < EVENT_STRUCT.size:
             LOGGER.warning(
-                f"Length of TM data field {len(tm_data)} shorter than expected 14 bytes"
+                f"Length of TM data field {len(tm_data)} shorter than expected "
+                f"{EVENT_STRUCT.size} bytes"
             )
             raise ValueError
         if set_attrs_from_tm_data:
-            instance._event_id = struct.unpack(">H", tm_data[0:2])[0]
-            instance._object_id = ObjectIdU32.from_bytes(tm_data[2:6])
-            instance._param_1 = struct.unpack(">I", tm_data[6:10])[0]
-            instance._param_2 = struct.unpack(">I", tm_data[10:14])[0]
+            (
+                instance._event_id,
+                obj_id,
+                instance._param_1,
+                instance._param_2,
+            ) = EVENT_STRUCT.unpack_from(tm_data)
+            instance._object_id = get_obj_id_interner().get_by_int(obj_id)
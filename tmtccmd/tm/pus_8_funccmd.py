@@ -6,7 +6,7 @@ import struct
 from spacepackets.ecss.tm import CdsShortTimestamp, PusTelemetry
 from spacepackets.util import UnsignedByteField
 from tmtccmd.tm.base import PusTmInfoBase, PusTmBase
-from tmtccmd.util.obj_id import ObjectIdU32
+from tmtccmd.util.obj_id import ObjectIdU32, get_obj_id_interner
 from tmtccmd.logging import get_console_logger
 
 LOGGER = get_console_logger()
@@ -66,7 +66,7 @@ class Service8FsfwTm(PusTmBase, PusTmInfoBase):
                 )
                 raise ValueError
             instance.set_packet_info("Functional Data Reply")
-            instance._object_id = ObjectIdU32.from_bytes(obj_id_as_bytes=tm_data[0:4])
+            instance._object_id = get_obj_id_interner().get(tm_data[0:4])
             instance._action_id = struct.unpack("!I", tm_data[4:8])[0]
             instance._custom_data = tm_data[8:]
         else:
@@ -0,0 +1,134 @@
+"""Routing of PUS telemetry to callbacks registered for APID, service and subservice
+combinations"""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from spacepackets.ecss import PusTelemetry
+
+from tmtccmd.logging import get_console_logger
+from tmtccmd.tm import GenericApidHandlerBase
+from tmtccmd.tm.header_view import LazyPusTm, LazyTmCallbackT
+
+LOGGER = get_console_logger()
+
+
+def _unpacking_callback(
+    callback: Callable, unpacker: Callable[[bytes], any]
+) -> LazyTmCallbackT:
+    def unpack_and_call(lazy_tm: LazyPusTm):
+        callback(lazy_tm.unpack(unpacker))
+
+    return unpack_and_call
+
+
+class PusTmRouter(GenericApidHandlerBase):
+    """Routes PUS telemetry to callbacks registered with :py:meth:`register` for
+    ``(apid, service, subservice)`` combinations, where each field can be a wildcard.
+
+    The routing only reads the packet headers using a :py:class:`tmtccmd.tm.header_view.LazyPusTm`.
+    The callbacks of a concrete ``(apid, service, subservice)`` combination are resolved once
+    from the registration table and then cached, so each packet is dispatched with a single
+    dictionary lookup. The router can be used as the generic handler of a
+    :py:class:`tmtccmd.tm.CcsdsTmHandler`, or :py:meth:`route` can be called directly.
+    """
+
+    def __init__(
+        self,
+        user_args: any = None,
+        unmatched_handler: Optional[LazyTmCallbackT] = None,
+        timestamp_len: int = PusTelemetry.PUS_TIMESTAMP_SIZE,
+    ):
+        """
+        :param unmatched_handler: Called for packets without a matching callback
+        :param timestamp_len: Length of the timestamp in the PUS TM secondary header
+        """
+        super().__init__(user_args)
+        self.unmatched_handler = unmatched_handler
+        self.timestamp_len = timestamp_len
+        self.unmatched_packets = 0
+        self.invalid_packets = 0
+        # APID -> service -> subservice -> callbacks. None keys are wildcards
+        self._table: Dict[
+            Optional[int], Dict[Optional[int], Dict[Optional[int], List[Callable]]]
+        ] = dict()
+        self._resolved: Dict[Tuple[int, int, int], Tuple[Callable, ...]] = dict()
+
+    def register(
+        self,
+        callback: Callable,
+        apid: Optional[int] = None,
+        service: Optional[int] = None,
+        subservice: Optional[int] = None,
+        unpacker: Optional[Callable[[bytes], any]] = None,
+    ):
+        """Register a callback for packets matching the given fields. None matches any value.
+
+        :param callback: Called with the :py:class:`tmtccmd.tm.header_view.LazyPusTm` of the
+            packet, which can be unpacked on demand
+        :param unpacker: If this is specified, the packet is unpacked with this function, for
+            example ``Service17Tm.unpack``, and the unpacked packet is passed to the callback
+            instead. The unpacked packet is shared between callbacks using the same function
+        """
+        if unpacker is not None:
+            callback = _unpacking_callback(callback, unpacker)
+        self._table.setdefault(apid, dict()).setdefault(service, dict()).setdefault(
+            subservice, []
+        ).append(callback)
+        self._resolved.clear()
+
+    def callbacks(
+        self, apid: int, service: int, subservice: int
+    ) -> Tuple[Callable, ...]:
+        """Retrieve the callbacks for a concrete field combination. More specific registrations
+        are called first."""
+        key = (apid, service, subservice)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            resolved = self._resolve(apid, service, subservice)
+            self._resolved[key] = resolved
+        return resolved
+
+    def route(self, packet: bytes) -> bool:
+        """Route a raw PUS packet.
+
+        :return: True if at least one callback was called
+        """
+        try:
+            lazy_tm = LazyPusTm(packet, self.timestamp_len)
+        except ValueError:
+            if self.invalid_packets == 0:
+                LOGGER.warning("Packet too short to be routed as PUS telemetry")
+            self.invalid_packets += 1
+            return False
+        header = lazy_tm.header
+        callbacks = self._resolved.get((header.apid, header.service, header.subservice))
+        if callbacks is None:
+            callbacks = self.callbacks(header.apid, header.service, header.subservice)
+        for callback in callbacks:
+            callback(lazy_tm)
+        if callbacks:
+            return True
+        self.unmatched_packets += 1
+        if self.unmatched_handler is not None:
+            self.unmatched_handler(lazy_tm)
+        return False
+
+    def handle_tm(self, apid: int, packet: bytes, _user_args: any):
+        self.route(packet)
+
+    def _resolve(
+        self, apid: int, service: int, subservice: int
+    ) -> Tuple[Callable, ...]:
+        resolved = []
+        for apid_key in (apid, None):
+            service_table = self._table.get(apid_key)
+            if service_table is None:
+                continue
+            for service_key in (service, None):
+                subservice_table = service_table.get(service_key)
+                if subservice_table is None:
+                    continue
+                for subservice_key in (subservice, None):
+                    resolved.extend(subservice_table.get(subservice_key, ()))
+        return tuple(resolved)
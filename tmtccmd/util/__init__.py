@@ -1,4 +1,13 @@
-from .obj_id import ObjectIdU32, ObjectIdU16, ObjectIdU8, ObjectIdBase, ObjectIdDictT
+from .obj_id import (
+    ObjectIdU32,
+    ObjectIdU16,
+    ObjectIdU8,
+    ObjectIdBase,
+    ObjectIdDictT,
+    InternedObjectIdU32,
+    ObjectIdInterner,
+    get_obj_id_interner,
+)
 from .retval import RetvalDictT
 from .seqcnt import (
     FileSeqCountProvider,
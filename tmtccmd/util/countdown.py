@@ -65,3 +65,64 @@ class Countdown:
             f"{self.__class__.__class__} with {timedelta(milliseconds=self._timeout_ms)} "
             f"ms timeout, {self.rem_time()} time remaining"
         )
+
+
+class Deadline:
+    """Countdown variant which stores the absolute expiry time based on the monotonic clock.
+    It is not affected by system clock adjustments and allows to calculate the exact time
+    until expiry. All query functions accept an optional current time so that multiple deadlines
+    can be checked against a single clock read.
+    """
+
+    def __init__(self, timeout: Optional[timedelta] = None):
+        if timeout is not None:
+            self._timeout = timeout.total_seconds()
+            self._deadline = time.monotonic() + self._timeout
+        else:
+            self._timeout = 0.0
+            self._deadline = 0.0
+
+    @property
+    def timeout(self) -> timedelta:
+        return timedelta(seconds=self._timeout)
+
+    @timeout.setter
+    def timeout(self, timeout: timedelta):
+        """Set a new timeout. The deadline is not restarted."""
+        self._deadline += timeout.total_seconds() - self._timeout
+        self._timeout = timeout.total_seconds()
+
+    @property
+    def deadline(self) -> float:
+        """Absolute expiry time in :py:func:`time.monotonic` seconds"""
+        return self._deadline
+
+    def timed_out(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        return now >= self._deadline
+
+    def busy(self, now: Optional[float] = None) -> bool:
+        return not self.timed_out(now)
+
+    def reset(self, new_timeout: Optional[timedelta] = None):
+        if new_timeout is not None:
+            self._timeout = new_timeout.total_seconds()
+        self.start()
+
+    def start(self):
+        self._deadline = time.monotonic() + self._timeout
+
+    def time_out(self):
+        self._deadline = 0.0
+
+    def rem_seconds(self, now: Optional[float] = None) -> float:
+        if now is None:
+            now = time.monotonic()
+        return max(self._deadline - now, 0.0)
+
+    def rem_time(self, now: Optional[float] = None) -> timedelta:
+        return timedelta(seconds=self.rem_seconds(now))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(timeout={self.timeout!r})"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from typing import Union, Dict, Optional
 
 from spacepackets.util import UnsignedByteField
@@ -114,3 +116,130 @@ class ObjectIdU8(ObjectIdBase):
 
 
 ObjectIdDictT = Dict[bytes, ObjectIdBase]
+
+
+class InternedObjectIdU32(ObjectIdU32):
+    """Immutable 32-bit object ID which is shared by all users of a
+    :py:class:`ObjectIdInterner`. The hex string is formatted once on creation.
+
+    Modifying an instance raises an :py:class:`AttributeError`. :py:func:`copy.copy` returns a
+    regular :py:class:`ObjectIdU32` which may be modified.
+    """
+
+    def __init__(self, obj_id: int, name: Optional[str] = None):
+        super().__init__(obj_id, name)
+        self._hex_string = super().as_hex_string
+        self._frozen = True
+
+    def __setattr__(self, key, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                f"Interned object ID {self._hex_string} can not be modified. Modify a copy "
+                f"created with copy.copy instead, or add the name to the object ID interner"
+            )
+        super().__setattr__(key, value)
+
+    def __copy__(self) -> ObjectIdU32:
+        # Copies are regular object IDs which may be modified
+        return ObjectIdU32(self.obj_id, self.name)
+
+    @property
+    def as_hex_string(self) -> str:
+        return self._hex_string
+
+
+class ObjectIdInterner:
+    """Factory for shared :py:class:`InternedObjectIdU32` instances, keyed by the raw 4 byte
+    object ID. Unpacking the object ID of a packet then usually is a single dictionary lookup
+    instead of creating a new object ID.
+
+    Object IDs with known names, for example the ones returned by the configuration hook or by
+    :py:func:`tmtccmd.fsfw.parse_fsfw_objects_csv`, are always kept. All other object IDs are
+    stored in a least recently used cache with a bounded size.
+
+    >>> interner = ObjectIdInterner(names={bytes([0, 0, 0, 42]): ObjectIdU32(42, "Answer")})
+    >>> obj_id = interner.get(bytes([0, 0, 0, 42]))
+    >>> obj_id.name
+    'Answer'
+    >>> obj_id is interner.get_by_int(42)
+    True
+    """
+
+    def __init__(self, max_cached: int = 4096, names: Optional[ObjectIdDictT] = None):
+        """
+        :param max_cached: Maximum number of cached object IDs without a known name
+        :param names: Known object IDs with their names
+        """
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._named: Dict[bytes, InternedObjectIdU32] = dict()
+        self._cache: OrderedDict[bytes, InternedObjectIdU32] = OrderedDict()
+        if names is not None:
+            self.add_names(names)
+
+    @classmethod
+    def from_csv(
+        cls, csv_file: str, max_cached: int = 4096
+    ) -> Optional[ObjectIdInterner]:
+        """Create an interner with the names of a FSFW objects CSV file.
+
+        :return: None if the file does not exist
+        """
+        from tmtccmd.fsfw import parse_fsfw_objects_csv
+
+        names = parse_fsfw_objects_csv(csv_file)
+        if names is None:
+            return None
+        return cls(max_cached, names)
+
+    def add_names(self, names: ObjectIdDictT):
+        """Add or replace the names of object IDs. Previously retrieved instances keep their
+        old name"""
+        with self._lock:
+            for obj_id in names.values():
+                raw = obj_id.as_bytes
+                self._cache.pop(raw, None)
+                self._named[raw] = InternedObjectIdU32(obj_id.obj_id, obj_id.name)
+
+    def get(self, raw: bytes) -> InternedObjectIdU32:
+        """Retrieve the shared instance for a raw object ID.
+
+        :param raw: Raw object ID. Only the first 4 bytes are used
+        :raises ValueError: Raw object ID shorter than 4 bytes
+        """
+        raw = bytes(raw[0:4])
+        obj_id = self._named.get(raw)
+        if obj_id is not None:
+            return obj_id
+        with self._lock:
+            obj_id = self._cache.get(raw)
+            if obj_id is not None:
+                self._cache.move_to_end(raw)
+                return obj_id
+            if len(raw) < 4:
+                raise ValueError(f"Raw object ID {raw.hex()} shorter than 4 bytes")
+            obj_id = InternedObjectIdU32(int.from_bytes(raw, "big"))
+            self._cache[raw] = obj_id
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+            return obj_id
+
+    def get_by_int(self, obj_id: int) -> InternedObjectIdU32:
+        """
+        :raises ValueError: Object ID negative or larger than 32 bits
+        """
+        try:
+            return self.get(obj_id.to_bytes(4, "big"))
+        except OverflowError:
+            raise ValueError(f"Invalid 32-bit object ID {obj_id}")
+
+    def __len__(self):
+        return len(self._named) + len(self._cache)
+
+
+_OBJ_ID_INTERNER = ObjectIdInterner()
+
+
+def get_obj_id_interner() -> ObjectIdInterner:
+    """Retrieve the interner which is used to unpack the object IDs of telemetry packets"""
+    return _OBJ_ID_INTERNER
@@ -6,6 +6,7 @@ from typing import List, Optional
 
 from spacepackets.util import get_printable_data_string, PrintFormats
 
+from tmtccmd.fsfw import validity_buffer_list
 from tmtccmd.tm.pus_8_funccmd import Service8FsfwTm
 from tmtccmd.tm.base import PusTmInfoInterface, PusTmInterface
 from tmtccmd.util.obj_id import ObjectIdU32, ObjectIdBase
@@ -107,10 +108,11 @@ class FsfwTmTcPrinter:
             print_prefix = "Housekeeping definitions"
         else:
             print_prefix = "Unknown housekeeping data"
-        if object_id.name == "":
-            object_id.name = "Unknown Name"
+        obj_name = object_id.name
+        if obj_name == "":
+            obj_name = "Unknown Name"
         generic_info = (
-            f"{print_prefix} from Object ID {object_id.name} ({object_id.as_hex_string}) with "
+            f"{print_prefix} from Object ID {obj_name} ({object_id.as_hex_string}) with "
             f"Set ID {set_id} and {len(hk_data)} bytes of HK data"
         )
         LOGGER.info(generic_info)
@@ -123,29 +125,13 @@ class FsfwTmTcPrinter:
         :param num_vars: Number of variables
         :return:
         """
-        valid_list = []
-        counter = 0
-        for index, byte in enumerate(validity_buffer):
-            for bit in range(1, 9):
-                if self.bit_extractor(byte, bit) == 1:
-                    valid_list.append(True)
-                else:
-                    valid_list.append(False)
-                counter += 1
-                if counter == num_vars:
-                    break
-        validity_lists = list(self.chunks(n=16, lst=valid_list))
-        for valid_list in validity_lists:
-            printout = "Valid: ["
-            for idx, valid in enumerate(valid_list):
-                if valid:
-                    printout += "Y"
-                else:
-                    printout += "N"
-                if idx < len(valid_list) - 1:
-                    printout += ","
-                else:
-                    printout += "]"
+        valid_list = validity_buffer_list(validity_buffer, num_vars)
+        for valid_chunk in self.chunks(n=16, lst=valid_list):
+            printout = (
+                "Valid: ["
+                + ",".join("Y" if valid else "N" for valid in valid_chunk)
+                + "]"
+            )
             print(printout)
             if self.file_logger is not None:
                 self.file_logger.info(printout)